@@ -1,10 +1,20 @@
-from django.contrib import admin
+from django import forms
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
+from django.shortcuts import get_object_or_404, redirect
+from django.template.response import TemplateResponse
+from django.urls import path, reverse
 from django.utils.html import format_html
 from .models import (
     Category, HomepageSEO, Article, ArticleParagraph, 
     ArticleImage, NewsletterSubscriber, ContactMessage,
     CookieConsent, CookiePolicy
 )
+from .exports import export_csv_action
+from .markdown_import import import_markdown
+from .paginator import EstimatedCountPaginator
+from .thumbnails import thumbnail_url
 
 
 class ArticleParagraphInline(admin.TabularInline):
@@ -13,12 +23,60 @@ class ArticleParagraphInline(admin.TabularInline):
     fields = ('order', 'paragraph_type', 'heading_text', 'heading_text_en', 'content', 'content_en', 'code_language')
 
 
+class CachedModelChoiceField(forms.ModelChoiceField):
+    """Seçenekleri bir kez yükleyip formset'in tüm satırlarında paylaşan alan"""
+
+    cached_objects = None
+
+    def set_objects(self, objects, label):
+        self.cached_objects = {str(obj.pk): obj for obj in objects}
+        self.choices = [('', self.empty_label), *((obj.pk, label(obj)) for obj in objects)]
+
+    def to_python(self, value):
+        if self.cached_objects is None:
+            return super().to_python(value)
+        if value in self.empty_values:
+            return None
+        try:
+            return self.cached_objects[str(getattr(value, 'pk', value))]
+        except KeyError:
+            raise ValidationError(
+                self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value},
+            )
+
+
+def paragraph_label(paragraph):
+    text = paragraph.heading_text if paragraph.paragraph_type == 'heading' else paragraph.content
+    text = ' '.join(text.split())
+    return f'{paragraph.order}. {text[:60]}' if text else f'Paragraf {paragraph.order}'
+
+
 class ArticleImageInline(admin.TabularInline):
     model = ArticleImage
     extra = 1
     fields = ('order', 'image', 'alt_text', 'caption', 'after_paragraph')
     readonly_fields = ('image_preview',)
     
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        if db_field.name == 'after_paragraph':
+            kwargs['form_class'] = CachedModelChoiceField
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
+    
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        # Her görsel satırı tüm paragrafları ayrı ayrı sorgulamasın:
+        # yalnızca bu makalenin paragrafları tek sorguda yüklenir
+        paragraphs = []
+        if obj is not None:
+            paragraphs = list(
+                ArticleParagraph.objects.filter(article=obj)
+                .only('id', 'order', 'paragraph_type', 'heading_text', 'content')
+            )
+        field = formset.form.base_fields['after_paragraph']
+        field.queryset = ArticleParagraph.objects.filter(article=obj) if obj else ArticleParagraph.objects.none()
+        field.set_objects(paragraphs, paragraph_label)
+        return formset
+    
     def image_preview(self, obj):
         if obj.image:
             return format_html('<img src="{}" style="max-width: 200px; max-height: 150px;" />', obj.image.url)
@@ -33,9 +91,16 @@ class CategoryAdmin(admin.ModelAdmin):
     prepopulated_fields = {'slug': ('name',)}
     search_fields = ('name',)
     
+    def get_queryset(self, request):
+        # Satır başına COUNT sorgusu yerine tek sorguda say
+        return super().get_queryset(request).annotate(
+            published_article_count=Count('articles', filter=Q(articles__is_published=True))
+        )
+    
     def article_count(self, obj):
         return obj.get_article_count()
     article_count.short_description = 'Makale Sayısı'
+    article_count.admin_order_field = 'published_article_count'
 
 
 @admin.register(HomepageSEO)
@@ -68,10 +133,32 @@ class HomepageSEOAdmin(admin.ModelAdmin):
     )
 
 
+class MarkdownImportForm(forms.Form):
+    document = forms.FileField(label='Markdown dosyası', required=False)
+    text = forms.CharField(label='veya metin', widget=forms.Textarea(attrs={'rows': 20, 'cols': 100}), required=False)
+    language = forms.ChoiceField(
+        label='Dil', choices=[('tr', 'Türkçe (yeni paragraflar)'), ('en', 'English (mevcut paragrafları çevir)')],
+    )
+    replace = forms.BooleanField(label='Mevcut paragrafları sil', required=False)
+    
+    def clean(self):
+        cleaned_data = super().clean()
+        document = cleaned_data.get('document')
+        if document:
+            try:
+                cleaned_data['text'] = document.read().decode('utf-8-sig')
+            except UnicodeDecodeError:
+                raise ValidationError('Dosya UTF-8 olmalı.')
+        if not cleaned_data.get('text', '').strip():
+            raise ValidationError('Bir Markdown dosyası seçin ya da metni yapıştırın.')
+        return cleaned_data
+
+
 @admin.register(Article)
 class ArticleAdmin(admin.ModelAdmin):
     list_display = ('title', 'category', 'author_name', 'is_published', 'is_featured', 
-                    'published_date', 'view_count', 'thumbnail_preview')
+                    'published_date', 'view_count', 'thumbnail_small')
+    list_select_related = ('category',)
     list_filter = ('is_published', 'is_featured', 'category', 'created_at')
     list_editable = ('is_published', 'is_featured')
     search_fields = ('title', 'excerpt', 'meta_description', 'author_name')
@@ -80,6 +167,7 @@ class ArticleAdmin(admin.ModelAdmin):
     readonly_fields = ('view_count', 'created_at', 'updated_at', 'thumbnail_preview')
     
     inlines = [ArticleParagraphInline, ArticleImageInline]
+    actions = ['import_markdown_action']
     
     fieldsets = (
         ('Temel Bilgiler', {
@@ -121,6 +209,60 @@ class ArticleAdmin(admin.ModelAdmin):
         return '-'
     thumbnail_preview.short_description = 'Kapak Görseli Önizleme'
     
+    def thumbnail_small(self, obj):
+        url = thumbnail_url(obj.thumbnail)
+        if url:
+            return format_html('<img src="{}" width="60" style="border-radius: 4px;" loading="lazy" />', url)
+        return '-'
+    thumbnail_small.short_description = 'Kapak'
+    
+    def import_markdown_action(self, request, queryset):
+        if queryset.count() != 1:
+            self.message_user(request, 'Markdown içe aktarmak için tek bir makale seçin.', messages.WARNING)
+            return None
+        return redirect('admin:blog_article_import_markdown', queryset.get().pk)
+    import_markdown_action.short_description = "Markdown'dan içerik aktar"
+    
+    def get_urls(self):
+        urls = [
+            path(
+                '<int:object_id>/import-markdown/',
+                self.admin_site.admin_view(self.import_markdown_view),
+                name='blog_article_import_markdown',
+            ),
+        ]
+        return urls + super().get_urls()
+    
+    def import_markdown_view(self, request, object_id):
+        """Markdown belgesinden paragrafları toplu oluştur"""
+        article = get_object_or_404(Article, pk=object_id)
+        if not self.has_change_permission(request, article):
+            return redirect('admin:blog_article_changelist')
+        
+        form = MarkdownImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            try:
+                count = import_markdown(
+                    article, form.cleaned_data['text'],
+                    language=form.cleaned_data['language'],
+                    replace=form.cleaned_data['replace'],
+                )
+            except ValueError as error:
+                form.add_error(None, str(error))
+            else:
+                self.message_user(request, f'{count} paragraf içe aktarıldı.', messages.SUCCESS)
+                return redirect('admin:blog_article_change', article.pk)
+        
+        context = {
+            **self.admin_site.each_context(request),
+            'title': "Markdown'dan içerik aktar",
+            'opts': self.model._meta,
+            'original': article,
+            'form': form,
+            'change_url': reverse('admin:blog_article_change', args=[article.pk]),
+        }
+        return TemplateResponse(request, 'admin/blog/article/import_markdown.html', context)
+    
     def save_model(self, request, obj, form, change):
         # Yayına alınırken tarih yoksa otomatik ekle
         if obj.is_published and not obj.published_date:
@@ -138,8 +280,14 @@ class NewsletterSubscriberAdmin(admin.ModelAdmin):
     search_fields = ('email',)
     list_editable = ('is_active',)
     date_hierarchy = 'subscribed_at'
+    # Büyük tablolarda tam COUNT(*) yapma
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
-    actions = ['activate_subscribers', 'deactivate_subscribers']
+    actions = [
+        'activate_subscribers', 'deactivate_subscribers',
+        export_csv_action(('email', 'is_active', 'subscribed_at'), 'aboneler'),
+    ]
     
     def activate_subscribers(self, request, queryset):
         count = queryset.update(is_active=True)
@@ -160,8 +308,13 @@ class ContactMessageAdmin(admin.ModelAdmin):
     list_editable = ('is_read',)
     date_hierarchy = 'created_at'
     readonly_fields = ('created_at',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
-    actions = ['mark_as_read', 'mark_as_unread']
+    actions = [
+        'mark_as_read', 'mark_as_unread',
+        export_csv_action(('name', 'email', 'message', 'created_at', 'is_read'), 'mesajlar'),
+    ]
     
     def message_preview(self, obj):
         return obj.message[:80] + '...' if len(obj.message) > 80 else obj.message
@@ -0,0 +1,281 @@
+"""
+Zaman kovalı görüntülenme analitiği ve trend sıralaması.
+
+- record_view() (önceden render edilmiş sayfalarda count_view())
+  görüntülenmeyi bellekte (makale, dil, gün) başına sayar;
+  ViewCounter sayaçları partiler halinde ArticleViewBucket gün kovalarına ve
+  Article.view_count'a ekler (istek başına yazma yok).
+- update_analytics komutu zamanlanmış olarak çalışır: eski gün kovalarını
+  haftalık, eski haftalıkları aylık kovalara sıkıştırır ve son
+  TRENDING_WINDOW_DAYS gün üzerinden yarılanma ömürlü trend skorunu
+  hesaplayıp kategori ve dil başına ilk N'i TrendingArticle'a yazar.
+- Kenar çubuğu widget'ı trending_articles() ile tek indeksli sorgu yapar.
+
+Yazan işler (add_views, compact, compute_trending) okumalarını da
+birincilden yapar; replikadan okunan kova listesi eksik kalabilir.
+"""
+import heapq
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, F, Sum, Value, When
+from django.db.models.functions import TruncMonth, TruncWeek
+from django.utils import timezone
+
+from .cache import bump_content_version
+from .language import LANGUAGES
+from .models import Article, ArticleViewBucket, TrendingArticle
+from .routers import primary_reads
+from .writebuffer import BatchWriter
+
+# Tek UPDATE ... CASE sorgusundaki en fazla kova
+WRITE_CHUNK_SIZE = 500
+
+DAY = ArticleViewBucket.PERIOD_DAY
+WEEK = ArticleViewBucket.PERIOD_WEEK
+MONTH = ArticleViewBucket.PERIOD_MONTH
+
+
+def chunked(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def add_to_buckets(period, counts):
+    """
+    {(makale, dil, başlangıç): adet} sayaçlarını kovalara ekle. Eksik kovalar
+    önce 0 ile açılır, sonra tek UPDATE ile artırılır; aynı anda yazan diğer
+    süreçlerin sayıları ezilmez.
+    """
+    for chunk in chunked(counts.items(), WRITE_CHUNK_SIZE):
+        keys = dict(chunk)
+        with transaction.atomic():
+            ArticleViewBucket.objects.bulk_create([
+                ArticleViewBucket(article_id=article_id, language=language, period=period, start=start)
+                for article_id, language, start in keys
+            ], ignore_conflicts=True)
+            buckets = ArticleViewBucket.objects.filter(
+                period=period,
+                start__in={start for _, _, start in keys},
+                article_id__in={article_id for article_id, _, _ in keys},
+            ).values_list('pk', 'article_id', 'language', 'start')
+            increments = {}
+            for pk, article_id, language, start in buckets:
+                count = keys.get((article_id, language, start))
+                if count:
+                    increments[pk] = count
+            ArticleViewBucket.objects.filter(pk__in=increments).update(
+                views=F('views') + Case(
+                    *(When(pk=pk, then=Value(count)) for pk, count in increments.items()),
+                    default=Value(0),
+                )
+            )
+
+
+@primary_reads
+@transaction.atomic
+def add_views(counts):
+    """
+    Bellekteki sayaçları gün kovalarına ve toplam görüntülenme sayısına yaz.
+    Tek transaction'dır: hata olursa hiçbir sayı yazılmaz, parti tekrar
+    denendiğinde iki kez sayılmaz.
+    """
+    add_to_buckets(DAY, counts)
+    per_article = Counter()
+    for (article_id, _, _), count in counts.items():
+        per_article[article_id] += count
+    for chunk in chunked(per_article.items(), WRITE_CHUNK_SIZE):
+        Article.objects.filter(pk__in=[article_id for article_id, _ in chunk]).update(
+            view_count=F('view_count') + Case(
+                *(When(pk=article_id, then=Value(count)) for article_id, count in chunk),
+                default=Value(0),
+            )
+        )
+
+
+class ViewCounter(BatchWriter):
+    """
+    Görüntülenmeleri bellekte toplayıp partiler halinde yazar.
+
+    batch_size görüntülenmeye ulaşınca ya da ilk sayımdan flush_interval
+    saniye sonra yazılır (bkz. writebuffer.BatchWriter). Aynı makalenin
+    yüzlerce görüntülenmesi tek bir satır artışına dönüşür; yazılamayan
+    sayaçlar yeni gelenlere eklenip tekrar denenir.
+    """
+
+    def __init__(self, batch_size=100, flush_interval=10.0):
+        super().__init__(batch_size, flush_interval)
+
+    def _new_batch(self):
+        return Counter()
+
+    def _size(self, counts):
+        return sum(counts.values())
+
+    def _merge(self, failed, counts):
+        failed.update(counts)
+        return failed
+
+    def _write(self, counts):
+        add_views(counts)
+
+    def add(self, article_id, language, day=None):
+        """Görüntülenmeyi say; parti dolduysa True döndür (yazma çağırana kalır)"""
+        key = (article_id, language, day or timezone.localdate())
+        return self._append(lambda counts: counts.update((key,)))
+
+
+_view_counter = None
+
+
+def get_view_counter():
+    """Görüntülenmeler için paylaşılan sayaç"""
+    global _view_counter
+    if _view_counter is None:
+        _view_counter = ViewCounter(
+            batch_size=getattr(settings, 'VIEW_BUFFER_BATCH_SIZE', 100),
+            flush_interval=getattr(settings, 'VIEW_BUFFER_FLUSH_INTERVAL', 10.0),
+        )
+    return _view_counter
+
+
+def normalize_language(language):
+    return language if language in LANGUAGES else LANGUAGES[0]
+
+
+def record_view(article, language):
+    counter = get_view_counter()
+    if counter.add(article.pk, normalize_language(language)):
+        counter.flush()
+
+
+def count_view(article_id, language):
+    """
+    Veritabanına dokunmadan say; parti dolduysa arka planda yazılır.
+    View'ı çalışmayan (önceden render edilmiş) sayfalar içindir.
+    """
+    counter = get_view_counter()
+    if counter.add(article_id, normalize_language(language)):
+        counter.flush_in_background()
+
+
+async def arecord_view(article, language):
+    counter = get_view_counter()
+    if counter.add(article.pk, normalize_language(language)):
+        await sync_to_async(counter.flush)()
+
+
+def week_start(day):
+    return day - timedelta(days=day.weekday())
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def rollup(source, target, cutoff, trunc):
+    """cutoff'tan eski source kovalarını target kovalarına topla; taşınan satır sayısı"""
+    old = ArticleViewBucket.objects.filter(period=source, start__lt=cutoff)
+    with transaction.atomic():
+        totals = (
+            old.annotate(target_start=trunc('start'))
+            .values('article_id', 'language', 'target_start')
+            .annotate(total=Sum('views'))
+            .order_by()
+        )
+        for chunk in chunked(totals.iterator(chunk_size=WRITE_CHUNK_SIZE), WRITE_CHUNK_SIZE):
+            add_to_buckets(target, {
+                (row['article_id'], row['language'], row['target_start']): row['total'] for row in chunk
+            })
+        moved, _ = old.delete()
+    return moved
+
+
+@primary_reads
+def compact(today=None):
+    """
+    Saklama süresini aşan gün kovalarını haftalığa, hafta kovalarını aylığa
+    sıkıştır. Sınırlar dönem başına hizalanır; yalnızca tamamlanmış haftalar
+    ve aylar taşınır.
+    """
+    today = today or timezone.localdate()
+    daily_cutoff = week_start(today - timedelta(days=getattr(settings, 'VIEW_DAILY_RETENTION_DAYS', 35)))
+    weekly_cutoff = month_start(today - timedelta(weeks=getattr(settings, 'VIEW_WEEKLY_RETENTION_WEEKS', 26)))
+    return {
+        'days': rollup(DAY, WEEK, daily_cutoff, TruncWeek),
+        'weeks': rollup(WEEK, MONTH, weekly_cutoff, TruncMonth),
+    }
+
+
+def trending_scores(today, window_days, half_life_days):
+    """{(makale, dil): skor} ve {makale: kategori}; her gün yarılanma ömrüyle sönümlenir"""
+    since = today - timedelta(days=window_days - 1)
+    rows = (
+        ArticleViewBucket.objects
+        .filter(period=DAY, start__gte=since, start__lte=today, article__is_published=True)
+        .values_list('article_id', 'article__category_id', 'language', 'start', 'views')
+    )
+    scores = defaultdict(float)
+    categories = {}
+    for article_id, category_id, language, start, views in rows.iterator(chunk_size=WRITE_CHUNK_SIZE):
+        age = (today - start).days
+        scores[(article_id, language)] += views * 0.5 ** (age / half_life_days)
+        categories[article_id] = category_id
+    return scores, categories
+
+
+@primary_reads
+def compute_trending(today=None, window_days=None, half_life_days=None, size=None):
+    """Trend tablosunu baştan hesapla; yazılan satır sayısını döndür"""
+    today = today or timezone.localdate()
+    window_days = window_days or getattr(settings, 'TRENDING_WINDOW_DAYS', 14)
+    half_life_days = half_life_days or getattr(settings, 'TRENDING_HALF_LIFE_DAYS', 2)
+    size = size or getattr(settings, 'TRENDING_SIZE', 5)
+
+    scores, categories = trending_scores(today, window_days, half_life_days)
+    groups = defaultdict(list)
+    for (article_id, language), score in scores.items():
+        groups[(None, language)].append((score, article_id))
+        if categories[article_id] is not None:
+            groups[(categories[article_id], language)].append((score, article_id))
+
+    now = timezone.now()
+    rows = [
+        TrendingArticle(
+            category_id=category_id, language=language, rank=rank,
+            article_id=article_id, score=round(score, 4), computed_at=now,
+        )
+        for (category_id, language), candidates in groups.items()
+        # Eşit skorda daha yeni makale (büyük id) önde
+        for rank, (score, article_id) in enumerate(heapq.nlargest(size, candidates), start=1)
+    ]
+    with transaction.atomic():
+        TrendingArticle.objects.all().delete()
+        TrendingArticle.objects.bulk_create(rows)
+    bump_content_version('trending')
+    return len(rows)
+
+
+def trending_articles(language, category_id=None, limit=None):
+    """
+    Trend widget'ı için makaleler; (language, category, rank) indeksiyle tek
+    sorgu. Tablo hesaplandıktan sonra yayından kalkan makaleler atlanır.
+    """
+    limit = limit or getattr(settings, 'TRENDING_SIZE', 5)
+    entries = (
+        TrendingArticle.objects
+        .filter(language=normalize_language(language), category_id=category_id, article__is_published=True)
+        .select_related('article')
+        .only('rank', 'article__slug', 'article__title', 'article__title_en')
+        .order_by('rank')[:limit]
+    )
+    return [entry.article for entry in entries]
@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class BlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'blog'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .db import configure_sqlite
+        connection_created.connect(configure_sqlite, dispatch_uid='blog.configure_sqlite')
+
+        from django.conf import settings
+        if getattr(settings, 'INSTRUMENTATION_ENABLED', True):
+            from .instrumentation import install_query_timer, install_template_timer
+            connection_created.connect(install_query_timer, dispatch_uid='blog.install_query_timer')
+            install_template_timer()
@@ -0,0 +1,197 @@
+"""
+ASGI altında kullanılan asenkron okuma view'ları.
+
+DJANGO_ASYNC_VIEWS=1 olduğunda (asgi.py bunu varsayılan yapar) blog/urls.py
+home, blog_list, category_detail, article_detail ve search için bu
+view'ları kullanır. Veriler async ORM ile çekilir; birbirinden bağımsız
+sorgular asyncio.gather ile aynı anda başlatılır. Django 4.2'de async ORM
+sorguları yine tek bir veritabanı thread'inde sırayla çalışır, kazanç
+event loop'un bu sırada başka istekleri karşılayabilmesidir.
+
+Şablonlar sync_to_async içinde render edilir; böylece önbellekteki parçalar
+dışında kalan tembel sorgular (kenar çubukları gibi) güvenle çalışır.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db.models import Count, Q
+from django.http import Http404
+from django.shortcuts import render
+from django.utils.functional import SimpleLazyObject
+
+from .analytics import arecord_view
+from .http_cache import add_surrogate_keys, cache_policy, ensure_csrf_cookie
+from .models import Article, Category, CookieConsent, HomepageSEO
+from .views import TAG_CLOUD_CACHE_KEY, build_content_items, build_tag_cloud, has_code_blocks
+from .warmup import is_warmup_request
+
+arender = sync_to_async(render)
+
+
+async def alist(queryset):
+    return [obj async for obj in queryset]
+
+
+async def aget_page(queryset, per_page, number):
+    """Paginator.get_page'in async karşılığı; sayfadaki nesneler yüklenmiş döner"""
+    paginator = Paginator(queryset, per_page)
+    paginator.count = await queryset.acount()
+    page = paginator.get_page(number)
+    page.object_list = await alist(page.object_list)
+    return page
+
+
+async def aget_seo_context():
+    """Anasayfa SEO verilerini getir"""
+    homepage_seo = await HomepageSEO.objects.filter(is_active=True).afirst()
+    return {
+        'seo': homepage_seo,
+        'cookie_consent': SimpleLazyObject(lambda: CookieConsent.objects.filter(is_active=True).first()),
+    }
+
+
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['home', 'list'])
+async def home(request):
+    """Anasayfa"""
+    featured_articles, categories, context = await asyncio.gather(
+        alist(
+            Article.objects.filter(is_published=True, is_featured=True)
+            .order_by('-published_date').cards(request.LANGUAGE_CODE)[:3]
+        ),
+        alist(
+            Category.objects.annotate(
+                published_article_count=Count('articles', filter=Q(articles__is_published=True))
+            )[:4]
+        ),
+        aget_seo_context(),
+    )
+
+    context.update({
+        'featured_articles': featured_articles,
+        'categories': categories,
+        'page_title': 'Ana Sayfa',
+    })
+    # Bülten formu için
+    ensure_csrf_cookie(request)
+    return await arender(request, 'blog/home.html', context)
+
+
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['list'])
+async def blog_list(request):
+    """Tüm makaleler listesi"""
+    articles = (
+        Article.objects
+        .filter(is_published=True)
+        .order_by('-published_date')
+        .cards(request.LANGUAGE_CODE)
+    )
+    page_obj = await aget_page(articles, 9, request.GET.get('page'))
+
+    # Sidebar önbellekteyse bu sorgular hiç çalışmaz
+    categories = (
+        Category.objects
+        .annotate(article_count=Count('articles', filter=Q(articles__is_published=True)))
+        .filter(article_count__gt=0)
+    )
+
+    def tags():
+        return cache.get_or_set(TAG_CLOUD_CACHE_KEY, build_tag_cloud, 60 * 60)
+
+    context = {
+        'page_obj': page_obj,
+        'categories': categories,
+        'tags': tags,
+        'page_title': 'Tüm Yazılar - EdebAi',
+        'meta_description': 'Yapay zeka, prompt engineering ve dijital üretkenlik üzerine tüm makalelerimiz.',
+    }
+    return await arender(request, 'blog/blog_list.html', context)
+
+
+@cache_policy(max_age=60, s_maxage=600, stale_while_revalidate=86400)
+async def article_detail(request, slug):
+    """Makale detay sayfası"""
+    try:
+        article = await Article.objects.select_related('category').aget(slug=slug, is_published=True)
+    except Article.DoesNotExist:
+        raise Http404('Makale bulunamadı')
+
+    add_surrogate_keys(request, f'article-{article.pk}', f'category-{article.category_id}' if article.category_id else None)
+
+    queries = [
+        alist(article.paragraphs.all()),
+        alist(article.images.all()),
+        alist(
+            Article.objects.filter(category_id=article.category_id, is_published=True)
+            .exclude(id=article.id).order_by('-published_date').cards(request.LANGUAGE_CODE)[:3]
+        ),
+    ]
+    # Görüntülenmeyi say (önbellek ısıtma istekleri hariç); partiler halinde yazılır
+    if not is_warmup_request(request):
+        queries.append(arecord_view(article, request.LANGUAGE_CODE))
+    paragraphs, images, related_articles, *_ = await asyncio.gather(*queries)
+
+    context = {
+        'article': article,
+        'content_items': build_content_items(paragraphs, images),
+        'has_code': has_code_blocks(paragraphs),
+        'related_articles': related_articles,
+        'page_title': article.meta_title or article.title,
+    }
+    return await arender(request, 'blog/article_detail.html', context)
+
+
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['list'])
+async def category_detail(request, slug):
+    """Kategori detay sayfası"""
+    try:
+        category = await Category.objects.aget(slug=slug)
+    except Category.DoesNotExist:
+        raise Http404('Kategori bulunamadı')
+    add_surrogate_keys(request, f'category-{category.pk}')
+
+    articles = Article.objects.filter(
+        category=category,
+        is_published=True
+    ).order_by('-published_date').cards(request.LANGUAGE_CODE)
+    page_obj = await aget_page(articles, 9, request.GET.get('page'))
+
+    context = {
+        'category': category,
+        'page_obj': page_obj,
+        'page_title': f'{category.name} - EdebAi',
+        'meta_description': category.description or f'{category.name} kategorisindeki tüm makaleler.',
+    }
+    return await arender(request, 'blog/category_detail.html', context)
+
+
+@cache_policy(max_age=0, s_maxage=60, stale_while_revalidate=60, keys=['list'])
+async def search(request):
+    """Arama sayfası"""
+    query = request.GET.get('q', '').strip()
+
+    if query:
+        articles = Article.objects.filter(
+            Q(title__icontains=query) |
+            Q(title_en__icontains=query) |
+            Q(excerpt__icontains=query) |
+            Q(excerpt_en__icontains=query) |
+            Q(meta_description__icontains=query),
+            is_published=True
+        ).order_by('-published_date').cards(request.LANGUAGE_CODE)
+        page_obj, context = await asyncio.gather(
+            aget_page(articles, 9, request.GET.get('page')),
+            aget_seo_context(),
+        )
+    else:
+        page_obj = None
+        context = await aget_seo_context()
+
+    context.update({
+        'query': query,
+        'page_obj': page_obj,
+        'page_title': f'Arama: {query}' if query else 'Arama - EdebAi',
+        'meta_description': f'{query} ile ilgili arama sonuçları.' if query else 'EdebAi\'de arama yapın.',
+    })
+    return await arender(request, 'blog/search.html', context)
@@ -0,0 +1,293 @@
+"""
+Ölçeklenme ölçümleri için sentetik veri üretimi ve süreç içi view ölçümü.
+
+seed_benchmark komutu generate() ile istenen hacimde iki dilli içerik
+üretir; bench komutu measure_url() ile blog/urls.py'deki her sayfayı
+ölçer. Benchmark kayıtlarının slug'ları ve e-postaları BENCH_PREFIX ile
+başlar, böylece gerçek içeriğe dokunmadan silinebilirler.
+"""
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .models import (
+    Article, ArticleImage, ArticleParagraph, Category, ContactMessage, NewsletterSubscriber,
+)
+
+BENCH_PREFIX = 'bench-'
+
+# (tr, en) anahtar kelime çiftleri; Zipf dağılımıyla seçilir, ilkler çok daha sık
+KEYWORDS = [
+    ('yapay zeka', 'artificial intelligence'), ('prompt', 'prompt'),
+    ('chatgpt', 'chatgpt'), ('üretkenlik', 'productivity'), ('edebiyat', 'literature'),
+    ('dil modeli', 'language model'), ('etik', 'ethics'), ('otomasyon', 'automation'),
+    ('makine öğrenmesi', 'machine learning'), ('yazarlık', 'writing'), ('görsel üretim', 'image generation'),
+    ('eğitim', 'education'), ('veri', 'data'), ('kodlama', 'coding'), ('araştırma', 'research'),
+    ('şiir', 'poetry'), ('roman', 'novel'), ('çeviri', 'translation'), ('gelecek', 'future'),
+    ('iş dünyası', 'business'), ('girişim', 'startup'), ('güvenlik', 'security'),
+    ('telif', 'copyright'), ('yaratıcılık', 'creativity'), ('öğrenme', 'learning'),
+]
+
+WORDS_TR = (
+    'yapay zeka dil modeli metin üretim yaratıcı yazar okur hikaye anlatı bilgi '
+    'soru cevap örnek deneme sonuç yöntem araç süreç fikir taslak düzenleme'
+).split()
+WORDS_EN = (
+    'artificial intelligence language model text generation creative writer reader story '
+    'narrative knowledge question answer example draft result method tool process idea edit'
+).split()
+
+CODE_SAMPLE = 'def prompt(text):\n    return model.generate(text, temperature=0.7)\n'
+
+
+def sentence(rng, words, length):
+    return ' '.join(rng.choice(words) for _ in range(length)).capitalize() + '.'
+
+
+def text(rng, words, sentences):
+    return ' '.join(sentence(rng, words, rng.randint(6, 16)) for _ in range(sentences))
+
+
+def pick_keywords(rng, count):
+    weights = [1 / (rank + 1) for rank in range(len(KEYWORDS))]
+    chosen = []
+    while len(chosen) < count:
+        pair = rng.choices(KEYWORDS, weights)[0]
+        if pair not in chosen:
+            chosen.append(pair)
+    return chosen
+
+
+def clear():
+    """Önceki benchmark verisini sil"""
+    with transaction.atomic():
+        Article.objects.filter(slug__startswith=BENCH_PREFIX).delete()
+        Category.objects.filter(slug__startswith=BENCH_PREFIX).delete()
+        NewsletterSubscriber.objects.filter(email__startswith=BENCH_PREFIX).delete()
+        ContactMessage.objects.filter(email__startswith=BENCH_PREFIX).delete()
+
+
+def generate(categories=10, articles=1000, paragraphs=12, images=2, subscribers=10000,
+             messages=2000, batch_size=1000, seed=42, start=0, log=None):
+    """
+    Benchmark verisini bulk_create ile üret; oluşturulan kayıt sayılarını döndür.
+    start, mevcut benchmark verisini büyütürken slug/e-posta çakışmasını önler.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    log = log or (lambda message: None)
+
+    with transaction.atomic():
+        # bulk_create MySQL'de pk döndürmez; kayıtlar slug ile geri okunur
+        category_slugs = [f'{BENCH_PREFIX}kategori-{start + index}' for index in range(categories)]
+        Category.objects.bulk_create([
+            Category(
+                name=f'Bench {start + index}', slug=slug,
+                description=text(rng, WORDS_TR, 2), order=100 + start + index,
+            )
+            for index, slug in enumerate(category_slugs)
+        ], batch_size=batch_size)
+        # categories=0: arşivi mevcut benchmark kategorileri içinde büyüt
+        category_objs = Category.objects.filter(slug__startswith=BENCH_PREFIX).only('pk').order_by('order')
+        if category_slugs:
+            category_objs = category_objs.filter(slug__in=category_slugs)
+        category_objs = list(category_objs)
+        log(f'{len(category_objs)} kategori')
+
+        article_objs = []
+        for index in range(articles):
+            keywords = pick_keywords(rng, rng.randint(2, 6))
+            title_tr = sentence(rng, WORDS_TR, rng.randint(4, 9))[:-1]
+            article_objs.append(Article(
+                title=title_tr,
+                title_en=sentence(rng, WORDS_EN, rng.randint(4, 9))[:-1],
+                slug=f'{BENCH_PREFIX}{start + index}',
+                # Kategori büyüklükleri de dengesiz olsun
+                category=rng.choices(category_objs, [1 / (rank + 1) for rank in range(len(category_objs))])[0],
+                excerpt=text(rng, WORDS_TR, 2),
+                excerpt_en=text(rng, WORDS_EN, 2),
+                author_name='EdebAi',
+                author_bio=text(rng, WORDS_TR, 3),
+                reading_time=rng.randint(3, 20),
+                is_published=rng.random() < 0.9,
+                is_featured=rng.random() < 0.03,
+                noindex=rng.random() < 0.02,
+                published_date=now - timezone.timedelta(minutes=rng.randint(0, 60 * 24 * 365 * 3)),
+                meta_title=title_tr[:60],
+                meta_description=text(rng, WORDS_TR, 1)[:160],
+                meta_description_en=text(rng, WORDS_EN, 1)[:160],
+                meta_keywords=', '.join(tr for tr, _ in keywords),
+                meta_keywords_en=', '.join(en for _, en in keywords),
+                og_title=title_tr[:60],
+                view_count=int(rng.paretovariate(1.2) * 10),
+            ))
+        Article.objects.bulk_create(article_objs, batch_size=batch_size)
+        slugs = [article.slug for article in article_objs]
+        article_ids = []
+        for offset in range(0, len(slugs), batch_size):
+            chunk = slugs[offset:offset + batch_size]
+            ids = dict(Article.objects.filter(slug__in=chunk).values_list('slug', 'pk'))
+            article_ids.extend(ids[slug] for slug in chunk)
+        log(f'{len(article_ids)} makale')
+
+        paragraph_objs = []
+        for article_id in article_ids:
+            for order in range(paragraphs):
+                kind = 'heading' if order % 6 == 0 else rng.choices(
+                    ['text', 'quote', 'code'], [20, 2, 1]
+                )[0]
+                paragraph_objs.append(ArticleParagraph(
+                    article_id=article_id, order=order, paragraph_type=kind,
+                    heading_text=sentence(rng, WORDS_TR, 4)[:-1] if kind == 'heading' else '',
+                    heading_text_en=sentence(rng, WORDS_EN, 4)[:-1] if kind == 'heading' else '',
+                    content=CODE_SAMPLE if kind == 'code' else text(rng, WORDS_TR, rng.randint(2, 6)),
+                    content_en='' if kind == 'code' else text(rng, WORDS_EN, rng.randint(2, 6)),
+                    code_language='python' if kind == 'code' else '',
+                ))
+        ArticleParagraph.objects.bulk_create(paragraph_objs, batch_size=batch_size)
+        log(f'{len(paragraph_objs)} paragraf')
+
+        image_objs = [
+            ArticleImage(
+                article_id=article_id, order=order, alt_text=sentence(rng, WORDS_TR, 3),
+                image=f'articles/content_images/{BENCH_PREFIX}{article_id}-{order}.webp',
+            )
+            for article_id in article_ids for order in range(images)
+        ]
+        ArticleImage.objects.bulk_create(image_objs, batch_size=batch_size)
+        log(f'{len(image_objs)} görsel')
+
+        NewsletterSubscriber.objects.bulk_create([
+            NewsletterSubscriber(email=f'{BENCH_PREFIX}{start + index}@example.com', is_active=rng.random() < 0.95)
+            for index in range(subscribers)
+        ], batch_size=batch_size)
+        log(f'{subscribers} abone')
+
+        ContactMessage.objects.bulk_create([
+            ContactMessage(
+                name=f'Okur {index}', email=f'{BENCH_PREFIX}{start + index}@example.com',
+                message=text(rng, WORDS_TR, rng.randint(1, 8)), is_read=rng.random() < 0.6,
+            )
+            for index in range(messages)
+        ], batch_size=batch_size)
+        log(f'{messages} mesaj')
+
+    return {
+        'categories': len(category_objs),
+        'articles': len(article_ids),
+        'paragraphs': len(paragraph_objs),
+        'images': len(image_objs),
+        'subscribers': subscribers,
+        'messages': messages,
+    }
+
+
+# Ölçülmeyen URL adları ve nedenleri
+SKIPPED_URLS = {
+    'set_language': 'yönlendirme, çerez yazar',
+    'newsletter_subscribe': 'yalnızca POST',
+    'contact_submit': 'yalnızca POST',
+    'performance_stats': 'yönetici girişi ister',
+}
+
+# Arama sorguları anahtar kelime dağılımından seçilir
+SEARCH_QUERIES = ('yapay', 'prompt', 'etik')
+
+
+def collect_urls():
+    """blog/urls.py'deki her GET sayfası için (ad, URL) listesi ve atlananlar"""
+    from . import urls as blog_urls
+
+    article = (
+        Article.objects.filter(is_published=True, slug__startswith=BENCH_PREFIX)
+        .order_by('-published_date').only('slug').first()
+        or Article.objects.filter(is_published=True).only('slug').first()
+    )
+    category = (
+        Category.objects.filter(slug__startswith=BENCH_PREFIX).order_by('order').only('slug').first()
+        or Category.objects.only('slug').first()
+    )
+    slugs = {
+        'article_detail': article and article.slug,
+        'article_pdf': article and article.slug,
+        'category_detail': category and category.slug,
+    }
+
+    urls, skipped = [], {}
+    for pattern in blog_urls.urlpatterns:
+        name = pattern.name or str(pattern.pattern)
+        if name in SKIPPED_URLS:
+            skipped[name] = SKIPPED_URLS[name]
+            continue
+        if not pattern.name:
+            urls.append((name, '/' + str(pattern.pattern)))
+        elif name in slugs:
+            if slugs[name] is None:
+                skipped[name] = 'veri yok'
+                continue
+            urls.append((name, reverse(f'blog:{name}', kwargs={'slug': slugs[name]})))
+        elif name == 'search':
+            for query in SEARCH_QUERIES:
+                urls.append((f'search?q={query}', f"{reverse('blog:search')}?q={query}"))
+        else:
+            urls.append((name, reverse(f'blog:{name}')))
+    urls.append(('blog_list?page=2', reverse('blog:blog_list') + '?page=2'))
+    return urls, skipped
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+
+def measure_url(client, url, iterations=20, warmup=2, cold_cache=False, alloc_iterations=3):
+    """URL'yi ölç: gecikme yüzdelikleri, istek başına sorgu ve bellek ayırma"""
+    from django.core.cache import cache
+
+    for _ in range(warmup):
+        client.get(url)
+
+    latencies, queries, status = [], [], None
+    for _ in range(iterations):
+        if cold_cache:
+            cache.clear()
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(url)
+            latencies.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        status = response.status_code
+
+    # tracemalloc gecikmeyi bozduğu için ayrı turda ölçülür
+    peaks, allocated = [], []
+    for _ in range(alloc_iterations):
+        if cold_cache:
+            cache.clear()
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            client.get(url)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak - before)
+        allocated.append(current - before)
+
+    return {
+        'status': status,
+        'iterations': iterations,
+        'mean_ms': round(statistics.fmean(latencies), 3),
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p95_ms': round(percentile(latencies, 0.95), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'queries': round(statistics.fmean(queries), 2),
+        'queries_max': max(queries),
+        'alloc_peak_kb': round(max(peaks) / 1024, 1) if peaks else None,
+        'alloc_retained_kb': round(statistics.median(allocated) / 1024, 1) if allocated else None,
+    }
@@ -0,0 +1,255 @@
+import math
+import random
+import threading
+import time
+from collections import Counter, OrderedDict
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+
+class LocalLRU:
+    """Süre sınırlı, boyutu sınırlı süreç içi LRU"""
+
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, envelope = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return envelope
+
+    def set(self, key, envelope, ttl):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, envelope)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class TwoTierCache(BaseCache):
+    """
+    Süreç içi LRU + paylaşılan önbellek (Redis).
+
+    Değerler uzak önbellekte (değer, bitiş zamanı, hesaplama süresi) zarfı
+    olarak tutulur. get_or_set() aynı anahtar için tek bir hesaplama yapar
+    (single-flight) ve sıcak anahtarları süresi dolmadan olasılıksal olarak
+    yeniler, böylece anahtar düştüğünde tüm worker'lar aynı anda
+    yeniden hesaplamaya girişmez.
+
+    OPTIONS:
+        REMOTE: paylaşılan önbelleğin CACHES içindeki alias'ı
+        LOCAL_MAX_ENTRIES: yerel LRU kapasitesi
+        LOCAL_TIMEOUT: yerel kopyanın en fazla yaşayacağı süre (saniye)
+        EARLY_EXPIRY_BETA: erken yenileme katsayısı (0 kapatır)
+        LOCK_TIMEOUT: hesaplama kilidinin ömrü (saniye)
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self.remote_alias = options.get('REMOTE', location)
+        self.local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self.beta = options.get('EARLY_EXPIRY_BETA', 1.0)
+        self.lock_timeout = options.get('LOCK_TIMEOUT', 10)
+        self.local = LocalLRU(options.get('LOCAL_MAX_ENTRIES', 1000))
+        self.metrics = Counter()
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+
+    @property
+    def remote(self):
+        return caches[self.remote_alias]
+
+    def _expires_at(self, timeout):
+        if timeout is DEFAULT_TIMEOUT:
+            timeout = self.default_timeout
+        if timeout is None:
+            return None
+        return time.time() + timeout
+
+    def _local_ttl(self, expires_at):
+        if expires_at is None:
+            return self.local_timeout
+        return min(self.local_timeout, expires_at - time.time())
+
+    def _fetch(self, key, version):
+        """Zarfı önce yerel, sonra uzak önbellekten getir"""
+        local_key = self.make_and_validate_key(key, version=version)
+        envelope = self.local.get(local_key)
+        if envelope is not None:
+            self.metrics['local_hits'] += 1
+            return envelope
+
+        envelope = self.remote.get(key, version=version)
+        if envelope is None:
+            self.metrics['misses'] += 1
+            return None
+
+        self.metrics['remote_hits'] += 1
+        ttl = self._local_ttl(envelope[1])
+        if ttl > 0:
+            self.local.set(local_key, envelope, ttl)
+        return envelope
+
+    def _store(self, key, value, timeout, version, delta=0):
+        envelope = (value, self._expires_at(timeout), delta)
+        local_key = self.make_and_validate_key(key, version=version)
+        self.remote.set(key, envelope, timeout, version=version)
+        ttl = self._local_ttl(envelope[1])
+        if ttl > 0:
+            self.local.set(local_key, envelope, ttl)
+        else:
+            self.local.delete(local_key)
+
+    def get(self, key, default=None, version=None):
+        envelope = self._fetch(key, version)
+        if envelope is None:
+            return default
+        return envelope[0]
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self._store(key, value, timeout, version)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        envelope = (value, self._expires_at(timeout), 0)
+        return self.remote.add(key, envelope, timeout, version=version)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.remote.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        self.local.delete(self.make_and_validate_key(key, version=version))
+        return self.remote.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        return self._fetch(key, version) is not None
+
+    def clear(self):
+        self.local.clear()
+        self.remote.clear()
+
+    def _should_refresh_early(self, envelope):
+        """XFetch: son kullanma yaklaştıkça yenileme olasılığını artır"""
+        _, expires_at, delta = envelope
+        if expires_at is None or not delta or not self.beta:
+            return False
+        return time.time() - delta * self.beta * math.log(random.random()) >= expires_at
+
+    def get_or_set(self, key, default, timeout=DEFAULT_TIMEOUT, version=None):
+        envelope = self._fetch(key, version)
+        if envelope is not None and not self._should_refresh_early(envelope):
+            return envelope[0]
+        if not callable(default):
+            if envelope is None:
+                self.set(key, default, timeout, version=version)
+                return default
+            return envelope[0]
+        if envelope is not None:
+            self.metrics['early_refreshes'] += 1
+        return self._single_flight(key, default, timeout, version, stale=envelope)
+
+    def _single_flight(self, key, compute, timeout, version, stale=None):
+        local_key = self.make_and_validate_key(key, version=version)
+        with self._flights_lock:
+            flight = self._flights.get(local_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[local_key] = {'event': threading.Event()}
+
+        if not leader:
+            # Aynı süreçte hesaplayan var; eski değer varsa onu ver, yoksa bekle
+            self.metrics['coalesced'] += 1
+            if stale is not None:
+                return stale[0]
+            flight['event'].wait(self.lock_timeout)
+            if 'value' in flight:
+                return flight['value']
+            return self._compute_and_store(key, compute, timeout, version)
+
+        try:
+            value = self._compute_across_workers(key, compute, timeout, version, stale)
+            flight['value'] = value
+            return value
+        finally:
+            with self._flights_lock:
+                self._flights.pop(local_key, None)
+            flight['event'].set()
+
+    def _compute_across_workers(self, key, compute, timeout, version, stale):
+        lock_key = f'{key}:lock'
+        if self.remote.add(lock_key, 1, self.lock_timeout, version=version):
+            try:
+                return self._compute_and_store(key, compute, timeout, version)
+            finally:
+                self.remote.delete(lock_key, version=version)
+
+        # Başka bir worker hesaplıyor
+        self.metrics['coalesced'] += 1
+        if stale is not None:
+            return stale[0]
+        deadline = time.monotonic() + self.lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.05)
+            envelope = self.remote.get(key, version=version)
+            if envelope is not None:
+                return envelope[0]
+        return self._compute_and_store(key, compute, timeout, version)
+
+    def _compute_and_store(self, key, compute, timeout, version):
+        started = time.time()
+        value = compute()
+        self.metrics['computes'] += 1
+        self._store(key, value, timeout, version, delta=time.time() - started)
+        return value
+
+    def stats(self):
+        """Bu süreçteki isabet/ıskalama sayaçları"""
+        stats = dict(self.metrics)
+        hits = stats.get('local_hits', 0) + stats.get('remote_hits', 0)
+        lookups = hits + stats.get('misses', 0)
+        stats['hit_ratio'] = round(hits / lookups, 4) if lookups else None
+        stats['local_entries'] = len(self.local)
+        return stats
+
+
+def content_version_key(scope):
+    return f'blog:content_version:{scope}'
+
+
+def get_content_version(*scopes):
+    """Şablon parçası anahtarları için içerik sürümü (kapsamlar birleştirilir)"""
+    from django.core.cache import cache
+
+    versions = cache.get_many([content_version_key(scope) for scope in scopes])
+    return '.'.join(
+        str(versions.get(content_version_key(scope), 0)) for scope in scopes
+    )
+
+
+def bump_content_version(scope):
+    """Kapsamın sürümünü değiştir; eski parçalar kendiliğinden geçersiz olur"""
+    from django.core.cache import cache
+
+    cache.set(content_version_key(scope), time.time_ns(), None)
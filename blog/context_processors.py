@@ -1,23 +1,25 @@
+from django.utils.functional import SimpleLazyObject
+
+from .language import resolve_language
 from .models import CookieConsent
 
 
+def request_language(request):
+    """İsteğin etkin dili (LanguageMiddleware'in çözdüğü)"""
+    return getattr(request, 'LANGUAGE_CODE', None) or resolve_language(request)
+
+
 def language_context(request):
     """Her template'de kullanılabilecek dil bilgisi"""
-    # Cookie'den dil tercihini al
-    language = request.COOKIES.get('language', 'tr')
-    
-    # Session'dan da kontrol et
-    if hasattr(request, 'session'):
-        language = request.session.get('language', language)
-    
     return {
-        'LANGUAGE_CODE': language,
+        'LANGUAGE_CODE': request_language(request),
     }
 
 
 def cookie_consent_context(request):
     """Çerez onayı banner için"""
-    cookie_consent = CookieConsent.objects.filter(is_active=True).first()
+    # Footer parçası önbellekteyken sorgu hiç çalışmaz
+    cookie_consent = SimpleLazyObject(lambda: CookieConsent.objects.filter(is_active=True).first())
     return {
         'cookie_consent': cookie_consent,
     }
\ No newline at end of file
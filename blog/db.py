@@ -0,0 +1,30 @@
+from django.conf import settings
+
+
+# Varsayılan üretim profili; settings.SQLITE_PRAGMAS ile ezilebilir
+DEFAULT_SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 5000,
+    'temp_store': 'MEMORY',
+    'cache_size': -20000,  # negatif değer KiB cinsindendir (~20 MB)
+    'mmap_size': 134217728,  # 128 MB
+}
+
+
+def get_sqlite_pragmas():
+    pragmas = dict(DEFAULT_SQLITE_PRAGMAS)
+    pragmas.update(getattr(settings, 'SQLITE_PRAGMAS', {}))
+    return pragmas
+
+
+def configure_sqlite(sender, connection, **kwargs):
+    """Yeni açılan her SQLite bağlantısına pragma ayarlarını uygula"""
+    if connection.vendor != 'sqlite':
+        return
+
+    with connection.cursor() as cursor:
+        for name, value in get_sqlite_pragmas().items():
+            if value is None:
+                continue
+            cursor.execute(f'PRAGMA {name} = {value}')
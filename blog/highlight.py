@@ -0,0 +1,49 @@
+"""
+Kod paragrafları için sunucu tarafı renklendirme.
+
+Pygments çıktısı yalnızca sınıf içeren HTML'dir, renkler static/css/code.css
+içinde tanımlıdır. Sonuç içerik ve dilin özetiyle önbelleğe alınır; aynı kod
+bloğu yalnızca bir kez renklendirilir.
+"""
+import hashlib
+
+from django.core.cache import cache
+from django.utils.html import escape
+from django.utils.safestring import mark_safe
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import get_lexer_by_name
+from pygments.util import ClassNotFound
+
+HIGHLIGHT_TIMEOUT = 60 * 60 * 24 * 30
+
+# Çok uzun bloklar renklendirilmeden gösterilir
+MAX_HIGHLIGHT_LENGTH = 50000
+
+formatter = HtmlFormatter(cssclass='highlight', wrapcode=True)
+
+
+def cache_key(code, language):
+    digest = hashlib.sha256(f'{language}\0{code}'.encode()).hexdigest()[:32]
+    return f'blog:code:{digest}'
+
+
+def render_code(code, language):
+    if not language or len(code) > MAX_HIGHLIGHT_LENGTH:
+        return f'<pre><code>{escape(code)}</code></pre>'
+    try:
+        lexer = get_lexer_by_name(language, stripnl=False)
+    except ClassNotFound:
+        return f'<pre><code>{escape(code)}</code></pre>'
+    return highlight(code, lexer, formatter)
+
+
+def highlight_code(code, language=''):
+    """Kod bloğunun renklendirilmiş HTML'i"""
+    # 'Python' ve 'python' aynı önbellek kaydını kullansın
+    language = (language or '').strip().lower()
+    return mark_safe(cache.get_or_set(
+        cache_key(code, language),
+        lambda: render_code(code, language),
+        HIGHLIGHT_TIMEOUT,
+    ))
@@ -0,0 +1,123 @@
+"""
+Paylaşılan önbellekler (CDN / reverse proxy) için Cache-Control ve
+surrogate-key başlıkları, içerik değişince de anahtar bazlı purge.
+"""
+import json
+import logging
+import threading
+import urllib.request
+
+from django.conf import settings
+from django.db import transaction
+from django.middleware.csrf import get_token
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Tüm sayfaların ortak kısmı (navbar, footer, çerez banner'ı)
+CHROME_KEY = 'chrome'
+
+
+def cache_policy(max_age=0, s_maxage=None, stale_while_revalidate=None, keys=()):
+    """View'ın paylaşılan önbellek politikasını tanımla"""
+    def decorator(view_func):
+        view_func.cache_policy = {
+            'max_age': max_age,
+            's_maxage': s_maxage,
+            'stale_while_revalidate': stale_while_revalidate,
+            'keys': tuple(keys),
+        }
+        return view_func
+    return decorator
+
+
+def add_surrogate_keys(request, *keys):
+    """Yanıta eklenecek surrogate key'leri kaydet"""
+    if not hasattr(request, 'surrogate_keys'):
+        request.surrogate_keys = []
+    request.surrogate_keys.extend(key for key in keys if key)
+
+
+def ensure_csrf_cookie(request):
+    """
+    AJAX formları CSRF token'ını çerezden okur. Çerezi olmayan ziyaretçiye
+    verilir; olanda yeniden yazılmaz ki yanıt public kalsın. Şablonda
+    {% csrf_token %} kullanılmaz: her yanıtta çerezi yeniler.
+    """
+    if settings.CSRF_COOKIE_NAME not in request.COOKIES:
+        get_token(request)
+
+
+def article_keys(article):
+    """Makale değişince purge edilecek anahtarlar"""
+    keys = [f'article-{article.pk}', 'list', 'home']
+    if article.category_id:
+        keys.append(f'category-{article.category_id}')
+    return keys
+
+
+class LocalPurger:
+    """Test ve geliştirme için: purge isteklerini bellekte tutar"""
+
+    def __init__(self):
+        self.purged = []
+
+    def purge(self, keys):
+        self.purged.append(sorted(keys))
+
+
+class HTTPPurger:
+    """Anahtarları PURGE_URL'e JSON olarak POST eder ({"keys": [...]})"""
+
+    def __init__(self):
+        self.url = getattr(settings, 'PURGE_URL', None)
+        self.token = getattr(settings, 'PURGE_TOKEN', None)
+        self.timeout = getattr(settings, 'PURGE_TIMEOUT', 5)
+
+    def purge(self, keys):
+        if not self.url:
+            return
+        headers = {'Content-Type': 'application/json'}
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        request = urllib.request.Request(
+            self.url, data=json.dumps({'keys': sorted(keys)}).encode(),
+            headers=headers, method='POST',
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+
+
+_purger = None
+_purger_lock = threading.Lock()
+
+
+def get_purger():
+    global _purger
+    with _purger_lock:
+        if _purger is None:
+            backend = getattr(settings, 'PURGE_BACKEND', 'blog.http_cache.HTTPPurger')
+            _purger = import_string(backend)()
+    return _purger
+
+
+def _send(keys):
+    try:
+        get_purger().purge(keys)
+    except Exception:
+        logger.exception('Purge başarısız: %s', ', '.join(sorted(keys)))
+
+
+def purge(*keys):
+    """Transaction commit edildikten sonra anahtarları arka planda purge et"""
+    keys = set(keys)
+    if not keys:
+        return
+
+    def dispatch():
+        if getattr(settings, 'PURGE_ASYNC', True):
+            threading.Thread(target=_send, args=(keys,), daemon=True).start()
+        else:
+            _send(keys)
+
+    transaction.on_commit(dispatch)
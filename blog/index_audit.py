@@ -0,0 +1,107 @@
+"""
+Public sayfaların sorgu planı denetimi.
+
+audit() blog/urls.py'deki her GET sayfasını (bkz. benchmark.collect_urls)
+süreç içinde çağırır, ORM'in çalıştırdığı SELECT sorgularını parametreleriyle
+yakalar ve her birine SQLite'ın EXPLAIN QUERY PLAN'ını uygular. İndekssiz
+tablo taramaları ("SCAN tablo") ve geçici B-tree sıralamaları ("USE TEMP
+B-TREE FOR ORDER BY") sorun olarak işaretlenir; index_audit komutu bunları
+raporlar, yeni indeksler bu rapora göre eklenir.
+"""
+import re
+from contextlib import contextmanager
+
+from django.db import connection
+
+from . import benchmark
+
+# Birkaç satırlık ayar tabloları; taranmaları indeks gerektirmez
+SMALL_TABLES = frozenset({
+    'django_site', 'django_session', 'django_content_type',
+    'blog_homepageseo', 'blog_cookieconsent', 'blog_cookiepolicy', 'blog_category',
+})
+
+TABLE = re.compile(r'^(?:SCAN|SEARCH) (?P<table>\w+)')
+FULL_SCAN = re.compile(r'^SCAN (?P<table>\w+)(?: AS \w+)?$')
+TEMP_SORT = re.compile(r'^USE TEMP B-TREE FOR (?P<purpose>.+)$')
+
+
+@contextmanager
+def capture_selects(using=connection):
+    """Çalışan SELECT sorgularını (sql, params) olarak topla"""
+    captured = []
+
+    def wrapper(execute, sql, params, many, context):
+        if not many and sql.lstrip().upper().startswith('SELECT'):
+            captured.append((sql, tuple(params or ())))
+        return execute(sql, params, many, context)
+
+    with using.execute_wrapper(wrapper):
+        yield captured
+
+
+def explain(sql, params=(), using=connection):
+    """Sorgunun plan satırları (EXPLAIN QUERY PLAN'ın detail sütunu)"""
+    with using.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def plan_problems(plan, limited=True, ignore_tables=SMALL_TABLES, known_tables=None):
+    """
+    Plan satırlarındaki tam taramalar ve geçici sıralamalar.
+
+    Tam tarama yalnızca LIMIT'li sorgularda sorundur: sayfa başına birkaç
+    satır isteyen sorgu tüm tabloyu okumamalı. Zaten tüm yayındaki makaleleri
+    okuyan sorgularda (sayım, sitemap, alt dize araması) SQLite'ın tabloyu
+    taramayı seçmesi doğrudur. known_tables verilirse alt sorgu/CTE
+    taramaları (ör. window fonksiyonunun ara sonucu) tablo sayılmaz.
+    """
+    tables = {match.group('table') for match in map(TABLE.match, plan) if match}
+    if known_tables is not None:
+        tables &= known_tables
+    # Yalnızca küçük tablolara dokunan sorguların planı önemsiz
+    if tables and tables <= ignore_tables:
+        return []
+    problems = []
+    for detail in plan:
+        scan = FULL_SCAN.match(detail)
+        if limited and scan and scan.group('table') in tables - ignore_tables:
+            problems.append(f"tam tarama: {scan.group('table')}")
+        sort = TEMP_SORT.match(detail)
+        if sort:
+            problems.append(f"geçici B-tree: {sort.group('purpose')}")
+    return problems
+
+
+def audit_url(client, url, ignore_tables=SMALL_TABLES, using=connection):
+    """URL'nin sorguları, planları ve sorunları (aynı SQL bir kez)"""
+    with capture_selects(using) as captured:
+        response = client.get(url)
+
+    known_tables = set(using.introspection.table_names())
+    results, seen = [], set()
+    for sql, params in captured:
+        if sql in seen:
+            continue
+        seen.add(sql)
+        plan = explain(sql, params, using)
+        results.append({
+            'sql': sql,
+            'plan': plan,
+            'problems': plan_problems(plan, ' LIMIT ' in sql, ignore_tables, known_tables),
+        })
+    return response.status_code, results
+
+
+def audit(client, only=(), ignore_tables=SMALL_TABLES, using=connection):
+    """Public sayfaların denetimi: {ad: {'url', 'status', 'queries'}} ve atlananlar"""
+    urls, skipped = benchmark.collect_urls()
+    urls.append(('sitemap', '/sitemap.xml'))
+    report = {}
+    for name, url in urls:
+        if only and name.split('?')[0] not in only:
+            continue
+        status, queries = audit_url(client, url, ignore_tables, using)
+        report[name] = {'url': url, 'status': status, 'queries': queries}
+    return report, skipped
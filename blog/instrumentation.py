@@ -0,0 +1,230 @@
+"""
+İstek başına performans ölçümü.
+
+RequestTimingMiddleware her istek için bir RequestMetrics açar; veritabanı
+sorguları (execute_wrapper) ve şablon render süreleri buna yazılır. Ölçüm
+ContextVar üzerinden taşındığı için sync_to_async içindeki sorgular da aynı
+isteğe sayılır. Sonuçlar:
+
+- Server-Timing başlığı (db, tpl, view, total; SERVER_TIMING_HEADER açıksa)
+- SLOW_REQUEST_MS üzerindeki istekler için 'blog.performance' logger'ına
+  tek satır JSON (en yavaş SQL'lerle birlikte)
+- view başına bellekte tutulan gecikme histogramı (p50/p95/p99)
+"""
+import json
+import math
+import threading
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+
+_current = ContextVar('blog_request_metrics', default=None)
+
+# En yavaş kaç SQL'in log'a yazılacağı
+TOP_QUERIES = 5
+MAX_SQL_LENGTH = 500
+
+
+class RequestMetrics:
+    __slots__ = ('started', 'view_started', 'view_ms', 'db_ms', 'query_count', 'template_ms', 'queries')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.view_started = None
+        self.view_ms = 0.0
+        self.db_ms = 0.0
+        self.query_count = 0
+        self.template_ms = 0.0
+        # (süre, sql) çiftleri; yalnızca en yavaşları tutulur
+        self.queries = []
+
+    def add_query(self, sql, duration_ms):
+        self.query_count += 1
+        self.db_ms += duration_ms
+        if len(self.queries) < TOP_QUERIES:
+            self.queries.append((duration_ms, sql))
+            self.queries.sort(reverse=True)
+        elif duration_ms > self.queries[-1][0]:
+            self.queries[-1] = (duration_ms, sql)
+            self.queries.sort(reverse=True)
+
+    def total_ms(self):
+        return (time.perf_counter() - self.started) * 1000
+
+    def slow_queries(self):
+        return [
+            {'ms': round(duration, 2), 'sql': sql[:MAX_SQL_LENGTH]}
+            for duration, sql in self.queries
+        ]
+
+
+def start():
+    return _current.set(RequestMetrics())
+
+
+def finish(token):
+    _current.reset(token)
+
+
+def current():
+    return _current.get()
+
+
+def query_timer(execute, sql, params, many, context):
+    """Bağlantılara kalıcı olarak eklenen execute_wrapper"""
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.add_query(sql, (time.perf_counter() - started) * 1000)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """connection_created: her yeni bağlantıya sorgu zamanlayıcısını ekle"""
+    if query_timer not in connection.execute_wrappers:
+        connection.execute_wrappers.append(query_timer)
+
+
+def install_template_timer():
+    """Django şablon backend'inin render'ını süre ölçecek şekilde sar"""
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'timed', False):
+        return
+    original = Template.render
+
+    def render(self, context=None, request=None):
+        metrics = _current.get()
+        if metrics is None:
+            return original(self, context, request)
+        started = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            metrics.template_ms += (time.perf_counter() - started) * 1000
+
+    render.timed = True
+    Template.render = render
+
+
+class LatencyHistogram:
+    """
+    Logaritmik kovalı gecikme histogramı. Her kova bir öncekinden %5 geniştir;
+    yüzdelikler en fazla %5 hatayla, sabit bellekle hesaplanır.
+    """
+
+    growth = 1.05
+
+    def __init__(self):
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def bucket_for(self, value):
+        return int(math.log(max(value, 0.01) / 0.01, self.growth))
+
+    def add(self, value):
+        index = self.bucket_for(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def percentile(self, fraction):
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Kovanın üst sınırı
+                return min(0.01 * self.growth ** (index + 1), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count, 2) if self.count else None,
+            'p50_ms': round(self.percentile(0.50), 2) if self.count else None,
+            'p95_ms': round(self.percentile(0.95), 2) if self.count else None,
+            'p99_ms': round(self.percentile(0.99), 2) if self.count else None,
+            'max_ms': round(self.max, 2),
+        }
+
+
+class ViewStats:
+    """View başına süre, sorgu ve şablon histogramları (süreç içi)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.views = {}
+
+    def record(self, view_name, metrics, total_ms):
+        with self.lock:
+            entry = self.views.get(view_name)
+            if entry is None:
+                entry = self.views[view_name] = {
+                    'total': LatencyHistogram(),
+                    'db': LatencyHistogram(),
+                    'template': LatencyHistogram(),
+                    'queries': 0,
+                }
+            entry['total'].add(total_ms)
+            entry['db'].add(metrics.db_ms)
+            entry['template'].add(metrics.template_ms)
+            entry['queries'] += metrics.query_count
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: {
+                    **entry['total'].summary(),
+                    'db_p95_ms': entry['db'].summary()['p95_ms'],
+                    'template_p95_ms': entry['template'].summary()['p95_ms'],
+                    'queries_per_request': round(entry['queries'] / entry['total'].count, 2),
+                }
+                for name, entry in sorted(self.views.items())
+            }
+
+    def reset(self):
+        with self.lock:
+            self.views.clear()
+
+
+view_stats = ViewStats()
+
+
+def server_timing(metrics, total_ms):
+    parts = [
+        f'db;dur={metrics.db_ms:.1f};desc="{metrics.query_count} sorgu"',
+        f'tpl;dur={metrics.template_ms:.1f}',
+    ]
+    if metrics.view_started is not None:
+        parts.append(f'view;dur={metrics.view_ms:.1f}')
+    parts.append(f'total;dur={total_ms:.1f}')
+    return ', '.join(parts)
+
+
+def slow_request_record(request, response, view_name, metrics, total_ms):
+    return json.dumps({
+        'method': request.method,
+        'path': request.path,
+        'view': view_name,
+        'status': response.status_code,
+        'total_ms': round(total_ms, 2),
+        'view_ms': round(metrics.view_ms, 2),
+        'db_ms': round(metrics.db_ms, 2),
+        'template_ms': round(metrics.template_ms, 2),
+        'queries': metrics.query_count,
+        'slow_queries': metrics.slow_queries(),
+    }, ensure_ascii=False)
+
+
+def slow_request_threshold():
+    return getattr(settings, 'SLOW_REQUEST_MS', 500)
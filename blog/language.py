@@ -0,0 +1,75 @@
+"""
+Oturumsuz dil seçimi.
+
+LanguageMiddleware dili istek başına bir kez çözer ve request.LANGUAGE_CODE'a
+yazar. I18N_URLS açıkken dil URL önekinden gelir (/en/makale/<slug>/,
+öneksiz yollar Türkçe); kapalıysa önce imzalı 'language' çerezi
+(set_language yazar), yoksa Accept-Language başlığı, o da yoksa Türkçe.
+Anonim ziyaretçilerde oturum tablosu hiç okunmaz.
+"""
+from django.conf import settings
+from django.core import signing
+from django.utils.translation.trans_real import parse_accept_lang_header
+
+LANGUAGES = ('tr', 'en')
+DEFAULT_LANGUAGE = LANGUAGES[0]
+
+LANGUAGE_COOKIE = 'language'
+LANGUAGE_COOKIE_SALT = 'blog.language'
+LANGUAGE_COOKIE_AGE = 365 * 24 * 60 * 60  # 1 yıl
+
+
+def cookie_language(request):
+    """Çerezdeki geçerli dil ya da None"""
+    language = request.get_signed_cookie(LANGUAGE_COOKIE, default=None, salt=LANGUAGE_COOKIE_SALT)
+    if language in LANGUAGES:
+        return language
+    # İmzasız eski çerezler (yalnızca izinli değerler) de tanınır
+    language = request.COOKIES.get(LANGUAGE_COOKIE)
+    return language if language in LANGUAGES else None
+
+
+def header_language(request):
+    """Accept-Language'taki ilk desteklenen dil ya da None"""
+    for tag, _ in parse_accept_lang_header(request.META.get('HTTP_ACCEPT_LANGUAGE', '')):
+        language = tag.split('-')[0]
+        if language in LANGUAGES:
+            return language
+    return None
+
+
+def url_routing():
+    """Dil URL önekiyle mi seçiliyor"""
+    return getattr(settings, 'I18N_URLS', False)
+
+
+def split_language_prefix(path):
+    """'/en/makale/x/' -> ('en', '/makale/x/'); öneksiz yollar varsayılan dildedir"""
+    prefix, _, rest = path.lstrip('/').partition('/')
+    if prefix in LANGUAGES and prefix != DEFAULT_LANGUAGE:
+        return prefix, '/' + rest
+    return DEFAULT_LANGUAGE, path
+
+
+def language_path(path, language):
+    """Yolun istenen dildeki karşılığı"""
+    _, path = split_language_prefix(path)
+    return path if language == DEFAULT_LANGUAGE else f'/{language}{path}'
+
+
+def resolve_language(request):
+    if url_routing():
+        return split_language_prefix(request.path_info)[0]
+    return cookie_language(request) or header_language(request) or DEFAULT_LANGUAGE
+
+
+def language_cookie_value(language):
+    """set_language'in yazdığı imzalı çerez değeri (iç istemciler için)"""
+    return signing.get_cookie_signer(salt=LANGUAGE_COOKIE + LANGUAGE_COOKIE_SALT).sign(language)
+
+
+def set_language_cookie(response, language):
+    response.set_signed_cookie(
+        LANGUAGE_COOKIE, language, salt=LANGUAGE_COOKIE_SALT,
+        max_age=LANGUAGE_COOKIE_AGE, samesite='Lax',
+    )
@@ -0,0 +1,105 @@
+import json
+import platform
+import subprocess
+
+from django import get_version
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import Client
+from django.utils import timezone
+
+from ... import benchmark
+from ...language import LANGUAGE_COOKIE, language_cookie_value, language_path, url_routing
+from ...models import Article, ArticleImage, ArticleParagraph, Category, ContactMessage, NewsletterSubscriber
+from ...warmup import WARMUP_HEADER
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def row_counts():
+    return {
+        model._meta.model_name: model.objects.count()
+        for model in (Category, Article, ArticleParagraph, ArticleImage, NewsletterSubscriber, ContactMessage)
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "blog/urls.py'deki her GET sayfasını süreç içinde N kez çağırır; gecikme "
+        "yüzdeliklerini, istek başına sorgu sayısını ve bellek ayırmayı JSON olarak "
+        "raporlar. Farklı commit'lerin sonuçları --output dosyaları karşılaştırılarak "
+        "izlenir. Önce seed_benchmark ile veri üretin."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='URL başına ölçülen istek')
+        parser.add_argument('--warmup', type=int, default=2, help='Ölçüm öncesi ısınma isteği')
+        parser.add_argument('--alloc-iterations', type=int, default=3, help='Bellek ölçümü için istek')
+        parser.add_argument('--cold', action='store_true', help='Her istekten önce önbelleği temizle')
+        parser.add_argument('--language', default='tr', help='İstek dili (çerez)')
+        parser.add_argument('--only', default='', help='Virgülle ayrılmış URL adları')
+        parser.add_argument('--output', help='JSON sonucu bu dosyaya yaz')
+
+    def handle(self, *args, **options):
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        # Ölçüm istekleri görüntülenme sayacını artırmasın
+        client = Client(HTTP_HOST=host, headers={WARMUP_HEADER: '1'})
+        client.cookies[LANGUAGE_COOKIE] = language_cookie_value(options['language'])
+
+        urls, skipped = benchmark.collect_urls()
+        only = {name.strip() for name in options['only'].split(',') if name.strip()}
+        if only:
+            urls = [(name, url) for name, url in urls if name.split('?')[0] in only]
+        if url_routing():
+            urls = [(name, language_path(url, options['language'])) for name, url in urls]
+
+        results = {}
+        for name, url in urls:
+            results[name] = {'url': url, **benchmark.measure_url(
+                client, url,
+                iterations=options['iterations'],
+                warmup=options['warmup'],
+                cold_cache=options['cold'],
+                alloc_iterations=options['alloc_iterations'],
+            )}
+            if options['verbosity'] >= 2:
+                self.stderr.write(f"{name}: p50 {results[name]['p50_ms']} ms")
+
+        report = {
+            'meta': {
+                'revision': git_revision(),
+                'timestamp': timezone.now().isoformat(),
+                'python': platform.python_version(),
+                'django': get_version(),
+                'database': settings.DATABASES['default']['ENGINE'].rsplit('.', 1)[-1],
+                'iterations': options['iterations'],
+                'cold_cache': options['cold'],
+                'language': options['language'],
+                'rows': row_counts(),
+            },
+            'urls': results,
+            'skipped': skipped,
+        }
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as handle:
+                handle.write(output + '\n')
+            self.print_table(results)
+        else:
+            self.stdout.write(output)
+
+    def print_table(self, results):
+        self.stdout.write(f"{'URL':28} {'p50':>8} {'p95':>8} {'p99':>8} {'sorgu':>6} {'tepe KB':>8}")
+        for name, result in results.items():
+            self.stdout.write(
+                f"{name[:28]:28} {result['p50_ms']:8.2f} {result['p95_ms']:8.2f} {result['p99_ms']:8.2f} "
+                f"{result['queries']:6.1f} {result['alloc_peak_kb']:8.1f}"
+            )
@@ -0,0 +1,127 @@
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from ...models import Article, Category
+from ...warmup import WARMUP_HEADER
+
+
+def benchmark_urls():
+    urls = [reverse('blog:home'), reverse('blog:blog_list')]
+    article = Article.objects.filter(is_published=True).only('slug').first()
+    if article:
+        urls.append(reverse('blog:article_detail', kwargs={'slug': article.slug}))
+    category = Category.objects.only('slug').first()
+    if category:
+        urls.append(reverse('blog:category_detail', kwargs={'slug': category.slug}))
+    urls.append(reverse('blog:search') + '?q=a')
+    return urls
+
+
+def summarize(latencies, elapsed):
+    latencies = sorted(latencies)
+    return {
+        'requests': len(latencies),
+        'rps': round(len(latencies) / elapsed, 1),
+        'p50_ms': round(statistics.median(latencies), 2),
+        'p95_ms': round(latencies[int(len(latencies) * 0.95) - 1], 2),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "WSGI + sync view'lar ile ASGI + async view'ları süreç içinde karşılaştırır. "
+        "--mode both her modu ayrı bir süreçte çalıştırır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--mode', choices=['both', 'wsgi', 'asgi'], default='both')
+        parser.add_argument('--requests', type=int, default=100, help='URL başına istek sayısı')
+        parser.add_argument('--concurrency', type=int, default=8, help='Eşzamanlı istek sayısı')
+        parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yazdır')
+
+    def handle(self, *args, **options):
+        if options['mode'] == 'both':
+            results = {mode: self.run_subprocess(mode, options) for mode in ('wsgi', 'asgi')}
+        else:
+            if (options['mode'] == 'asgi') != settings.ASYNC_VIEWS:
+                raise CommandError('ASGI modu DJANGO_ASYNC_VIEWS=1, WSGI modu DJANGO_ASYNC_VIEWS=0 ister.')
+            host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+            jobs = [url for url in benchmark_urls() for _ in range(options['requests'])]
+            runner = self.run_wsgi if options['mode'] == 'wsgi' else self.run_asgi
+            results = {options['mode']: runner(jobs, host, options['concurrency'])}
+
+        if options['json']:
+            self.stdout.write(json.dumps(results))
+            return
+        for mode, result in results.items():
+            self.stdout.write(
+                f"{mode:5} {result['rps']:8.1f} istek/sn  p50 {result['p50_ms']:7.2f} ms  "
+                f"p95 {result['p95_ms']:7.2f} ms  ({result['requests']} istek)"
+            )
+
+    def run_subprocess(self, mode, options):
+        env = dict(os.environ, DJANGO_ASYNC_VIEWS='1' if mode == 'asgi' else '0')
+        command = [
+            sys.executable, '-m', 'django', 'benchmark_asgi', '--json', '--mode', mode,
+            '--requests', str(options['requests']), '--concurrency', str(options['concurrency']),
+        ]
+        output = subprocess.run(
+            command, env=env, cwd=settings.BASE_DIR, check=True, capture_output=True, text=True,
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])[mode]
+
+    def run_wsgi(self, jobs, host, concurrency):
+        def fetch(url):
+            client = Client(HTTP_HOST=host, headers={WARMUP_HEADER: '1'})
+            started = time.perf_counter()
+            response = client.get(url)
+            if response.status_code != 200:
+                raise CommandError(f'{url} -> {response.status_code}')
+            return (time.perf_counter() - started) * 1000
+
+        def worker(urls):
+            try:
+                return [fetch(url) for url in urls]
+            finally:
+                connection.close()
+
+        chunks = [jobs[index::concurrency] for index in range(concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            latencies = [ms for chunk in pool.map(worker, chunks) for ms in chunk]
+        return summarize(latencies, time.perf_counter() - started)
+
+    def run_asgi(self, jobs, host, concurrency):
+        async def main():
+            client = AsyncClient()
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def fetch(url):
+                async with semaphore:
+                    started = time.perf_counter()
+                    response = await client.get(url, headers={WARMUP_HEADER: '1'})
+                    if response.status_code != 200:
+                        raise CommandError(f'{url} -> {response.status_code}')
+                    return (time.perf_counter() - started) * 1000
+
+            started = time.perf_counter()
+            latencies = await asyncio.gather(*(fetch(url) for url in jobs))
+            return summarize(latencies, time.perf_counter() - started)
+
+        # AsyncClient Host başlığını her zaman 'testserver' olarak gönderir
+        with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+            return async_to_sync(main)()
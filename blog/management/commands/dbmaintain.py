@@ -0,0 +1,82 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "SQLite bakımı: ANALYZE, PRAGMA optimize, artımlı vacuum ve WAL checkpoint"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--database', default='default', help='Veritabanı alias\'ı')
+        parser.add_argument(
+            '--vacuum-pages', type=int, default=1000,
+            help='Tek seferde serbest bırakılacak en fazla sayfa (0: atla)'
+        )
+        parser.add_argument(
+            '--checkpoint', default='TRUNCATE',
+            choices=['PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'],
+            help='WAL checkpoint modu'
+        )
+        parser.add_argument('--skip-analyze', action='store_true', help='ANALYZE adımını atla')
+        parser.add_argument(
+            '--enable-incremental-vacuum', action='store_true',
+            help='auto_vacuum=INCREMENTAL ayarla ve bir kez tam VACUUM çalıştır'
+        )
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Verilirse komut her N saniyede bir tekrar çalışır'
+        )
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        if connection.vendor != 'sqlite':
+            raise CommandError(f"'{options['database']}' bir SQLite veritabanı değil.")
+
+        if options['enable_incremental_vacuum']:
+            self.enable_incremental_vacuum(connection)
+
+        while True:
+            self.run_once(connection, options)
+            if not options['interval']:
+                break
+            connection.close()
+            time.sleep(options['interval'])
+
+    def enable_incremental_vacuum(self, connection):
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA auto_vacuum')
+            if cursor.fetchone()[0] == 2:
+                return
+            # auto_vacuum değişikliği ancak tam VACUUM sonrası geçerli olur
+            cursor.execute('PRAGMA auto_vacuum = INCREMENTAL')
+            cursor.execute('VACUUM')
+        self.stdout.write('auto_vacuum=INCREMENTAL etkinleştirildi.')
+
+    def run_once(self, connection, options):
+        started = time.monotonic()
+        with connection.cursor() as cursor:
+            if not options['skip_analyze']:
+                cursor.execute('ANALYZE')
+            cursor.execute('PRAGMA optimize')
+
+            cursor.execute('PRAGMA freelist_count')
+            free_pages = cursor.fetchone()[0]
+            if options['vacuum_pages'] and free_pages:
+                cursor.execute('PRAGMA auto_vacuum')
+                if cursor.fetchone()[0] == 2:
+                    cursor.execute(f"PRAGMA incremental_vacuum({options['vacuum_pages']})")
+                    cursor.fetchall()
+
+            cursor.execute('PRAGMA journal_mode')
+            checkpoint = None
+            if cursor.fetchone()[0].lower() == 'wal':
+                cursor.execute(f"PRAGMA wal_checkpoint({options['checkpoint']})")
+                checkpoint = cursor.fetchone()
+
+        elapsed = (time.monotonic() - started) * 1000
+        message = f'Bakım tamamlandı ({elapsed:.0f} ms, boş sayfa: {free_pages}'
+        if checkpoint:
+            busy, log_frames, checkpointed = checkpoint
+            message += f', WAL: {checkpointed}/{log_frames} çerçeve, meşgul={busy}'
+        self.stdout.write(self.style.SUCCESS(message + ')'))
@@ -0,0 +1,67 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...prerender import (
+    LANGUAGES, all_urls, diff, file_for, get_root, load_manifest,
+    make_client, remove_pages, render_page, save_manifest, snapshot,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Herkese açık sayfaları iki dilde HTML olarak PRERENDER_ROOT altına yazar. "
+        "Varsayılan olarak yalnızca son çalıştırmadan bu yana değişen makalelerin "
+        "etkilediği sayfalar (makale, kategori, liste ve gerekirse anasayfa) yeniden üretilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Tüm sayfaları yeniden render et')
+        parser.add_argument('--output', help='Hedef klasör (varsayılan: PRERENDER_ROOT)')
+        parser.add_argument('--dry-run', action='store_true', help='Sadece yapılacakları listele')
+
+    def handle(self, *args, **options):
+        root = Path(options['output']) if options['output'] else get_root()
+        if root is None:
+            raise CommandError('PRERENDER_ROOT ayarlı değil, --output verin.')
+        root.mkdir(parents=True, exist_ok=True)
+
+        previous = None if options['full'] else load_manifest(root)
+        current = snapshot()
+        to_render, to_remove = diff(previous, current)
+
+        # Kayıt sinyalleriyle silinmiş dosyaları da tamamla
+        for url_path in all_urls(current):
+            if any(not file_for(url_path, language, root).exists() for language in LANGUAGES):
+                to_render.add(url_path)
+
+        if options['dry_run']:
+            for url_path in sorted(to_render):
+                self.stdout.write(f'render  {url_path}')
+            for url_path in sorted(to_remove):
+                self.stdout.write(f'sil     {url_path}')
+            return
+
+        remove_pages(to_remove, root)
+
+        client = make_client()
+        started = time.perf_counter()
+        failed = 0
+        for url_path in sorted(to_render):
+            for language in LANGUAGES:
+                page_started = time.perf_counter()
+                status = render_page(client, url_path, language, root)
+                elapsed = (time.perf_counter() - page_started) * 1000
+                if status != 200:
+                    failed += 1
+                    self.stderr.write(f'{status} [{language}] {url_path}')
+                elif options['verbosity'] > 1:
+                    self.stdout.write(f'{elapsed:8.1f} ms  [{language}] {url_path}')
+
+        save_manifest(root, current)
+        total = (time.perf_counter() - started) * 1000
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(to_render)} sayfa render edildi, {len(to_remove)} sayfa silindi, '
+            f'{failed} hata ({total:.0f} ms)'
+        ))
@@ -0,0 +1,71 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import override_settings
+
+from ... import index_audit
+from ...warmup import WARMUP_HEADER
+
+
+class Command(BaseCommand):
+    help = (
+        "blog/urls.py'deki her GET sayfasının ORM sorgularına EXPLAIN QUERY PLAN "
+        "uygular; indekssiz tablo taramalarını ve geçici B-tree sıralamalarını "
+        "raporlar. Sorun bulunursa --strict ile hata koduyla çıkar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', default='', help='Virgülle ayrılmış URL adları')
+        parser.add_argument(
+            '--ignore', default=','.join(sorted(index_audit.SMALL_TABLES)),
+            help='Taranması sorun sayılmayan tablolar (virgülle ayrılmış)'
+        )
+        parser.add_argument('--plans', action='store_true', help='Sorunsuz sorguların planlarını da yazdır')
+        parser.add_argument('--strict', action='store_true', help='Sorun varsa hata koduyla çık')
+        parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yazdır')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('Sorgu planı denetimi yalnızca SQLite için destekleniyor.')
+
+        host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+        # Denetim istekleri görüntülenme sayacını artırmasın
+        client = Client(HTTP_HOST=host, headers={WARMUP_HEADER: '1'})
+        only = {name.strip() for name in options['only'].split(',') if name.strip()}
+        ignore = frozenset(table.strip() for table in options['ignore'].split(',') if table.strip())
+
+        # Önbellekten dönen sayfa sorgu çalıştırmaz; gerçek önbelleğe de dokunma
+        with override_settings(
+            CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}},
+            PRERENDER_ROOT=None,
+        ):
+            report, skipped = index_audit.audit(client, only=only, ignore_tables=ignore)
+
+        problems = sum(len(query['problems']) for page in report.values() for query in page['queries'])
+        if options['json']:
+            self.stdout.write(json.dumps(
+                {'urls': report, 'skipped': skipped, 'problems': problems}, indent=2, ensure_ascii=False,
+            ))
+        else:
+            self.print_report(report, options['plans'])
+            style = self.style.WARNING if problems else self.style.SUCCESS
+            self.stdout.write(style(f'{len(report)} sayfa denetlendi, {problems} sorun bulundu.'))
+
+        if problems and options['strict']:
+            raise CommandError(f'{problems} sorgu planı sorunu bulundu.')
+
+    def print_report(self, report, show_plans):
+        for name, page in report.items():
+            flagged = [query for query in page['queries'] if query['problems']]
+            if not flagged and not show_plans:
+                continue
+            self.stdout.write(f"\n{name} ({page['url']}, {len(page['queries'])} sorgu)")
+            for query in page['queries'] if show_plans else flagged:
+                self.stdout.write(f"  {query['sql'][:160]}")
+                for detail in query['plan']:
+                    self.stdout.write(f'    | {detail}')
+                for problem in query['problems']:
+                    self.stdout.write(self.style.WARNING(f'    ! {problem}'))
@@ -0,0 +1,56 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from ... import benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "Ölçeklenme ölçümleri için iki dilli sentetik içerik üretir (kategori, makale, "
+        "paragraf, görsel, abone, mesaj). Kayıtlar 'bench-' önekiyle oluşturulur ve "
+        "--clear ile gerçek içeriğe dokunmadan silinir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--categories', type=int, default=10, help='Kategori sayısı')
+        parser.add_argument('--articles', type=int, default=1000, help='Makale sayısı')
+        parser.add_argument('--paragraphs', type=int, default=12, help='Makale başına paragraf')
+        parser.add_argument('--images', type=int, default=2, help='Makale başına görsel')
+        parser.add_argument('--subscribers', type=int, default=10000, help='Bülten abonesi sayısı')
+        parser.add_argument('--messages', type=int, default=2000, help='İletişim mesajı sayısı')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create parti boyutu')
+        parser.add_argument('--seed', type=int, default=42, help='Tekrarlanabilir veri için rastgele tohum')
+        parser.add_argument('--start', type=int, default=0, help='Mevcut veriyi büyütmek için numara başlangıcı')
+        parser.add_argument('--clear', action='store_true', help='Önce eski benchmark verisini sil')
+        parser.add_argument('--clear-only', action='store_true', help='Yalnızca benchmark verisini sil')
+        parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yazdır')
+
+    def handle(self, *args, **options):
+        if options['clear'] or options['clear_only']:
+            benchmark.clear()
+            if not options['json']:
+                self.stdout.write('Eski benchmark verisi silindi.')
+            if options['clear_only']:
+                return
+
+        started = time.perf_counter()
+        counts = benchmark.generate(
+            categories=options['categories'],
+            articles=options['articles'],
+            paragraphs=options['paragraphs'],
+            images=options['images'],
+            subscribers=options['subscribers'],
+            messages=options['messages'],
+            batch_size=options['batch_size'],
+            seed=options['seed'],
+            start=options['start'],
+            log=None if options['json'] else self.stdout.write,
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if options['json']:
+            self.stdout.write(json.dumps({'ms': round(elapsed, 1), 'counts': counts}))
+            return
+        self.stdout.write(self.style.SUCCESS(f'Benchmark verisi {elapsed:.0f} ms içinde oluşturuldu.'))
@@ -0,0 +1,56 @@
+import json
+import time
+
+from django.core.management.base import BaseCommand
+
+from ...analytics import compact, compute_trending, get_view_counter
+
+
+class Command(BaseCommand):
+    help = (
+        "Görüntülenme analitiğini günceller: eski gün kovalarını haftalık, eski "
+        "haftalıkları aylık kovalara sıkıştırır ve trend tablosunu yeniden hesaplar. "
+        "Zamanlanmış olarak (ör. saatte bir) ya da --interval ile çalıştırın."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-compact', action='store_true', help='Sıkıştırma adımını atla')
+        parser.add_argument('--window', type=int, help='Trend penceresi (gün)')
+        parser.add_argument('--half-life', type=float, help='Skorun yarılanma süresi (gün)')
+        parser.add_argument('--size', type=int, help='Kategori ve dil başına makale sayısı')
+        parser.add_argument(
+            '--interval', type=int, default=0,
+            help='Verilirse komut her N saniyede bir tekrar çalışır'
+        )
+        parser.add_argument('--json', action='store_true', help='Sonucu JSON olarak yazdır')
+
+    def handle(self, *args, **options):
+        while True:
+            self.run_once(options)
+            if not options['interval']:
+                break
+            time.sleep(options['interval'])
+
+    def run_once(self, options):
+        started = time.perf_counter()
+        # Bu süreçte bekleyen sayımlar da hesaba girsin
+        flushed = get_view_counter().flush()
+        compacted = {} if options['skip_compact'] else compact()
+        rows = compute_trending(
+            window_days=options['window'],
+            half_life_days=options['half_life'],
+            size=options['size'],
+        )
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if options['json']:
+            self.stdout.write(json.dumps({
+                'ms': round(elapsed, 1), 'flushed': flushed, 'compacted': compacted, 'trending_rows': rows,
+            }))
+            return
+        if compacted:
+            self.stdout.write(
+                f"Sıkıştırma: {compacted['days']} gün kovası haftalığa, "
+                f"{compacted['weeks']} hafta kovası aylığa taşındı."
+            )
+        self.stdout.write(self.style.SUCCESS(f'Trend tablosu {rows} satır, {elapsed:.0f} ms.'))
@@ -0,0 +1,128 @@
+import json
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test import Client
+
+from ...language import LANGUAGE_COOKIE, LANGUAGES, language_cookie_value, language_path, url_routing
+from ...models import Article
+from ...sitemaps import ArticleSitemap, CategorySitemap, StaticViewSitemap
+from ...warmup import WARMUP_HEADER
+
+
+def collect_urls():
+    """Sitemap'lerdeki URL'leri öncelik sırasıyla (yol, öncelik) olarak döndür"""
+    featured = set(
+        Article.objects.filter(is_published=True, is_featured=True)
+        .values_list('slug', flat=True)
+    )
+    urls = {}
+
+    # Anasayfa en önce, sonra öne çıkanlar ve en yeni makaleler
+    static_sitemap = StaticViewSitemap()
+    for item in static_sitemap.items():
+        urls.setdefault(static_sitemap.location(item), (0 if item == 'blog:home' else 3, 0))
+
+    article_sitemap = ArticleSitemap()
+    for rank, article in enumerate(article_sitemap.items().only('slug', 'published_date')):
+        group = 1 if article.slug in featured else 2
+        urls.setdefault(article_sitemap.location(article), (group, rank))
+
+    category_sitemap = CategorySitemap()
+    for category in category_sitemap.items():
+        urls.setdefault(category_sitemap.location(category), (3, 0))
+
+    return sorted(urls.items(), key=lambda item: (item[1], item[0]))
+
+
+class Command(BaseCommand):
+    help = (
+        "Sitemap'teki tüm sayfaları iki dilde render ederek önbelleği ısıtır. "
+        "Varsayılan olarak istekler bu süreçte Django test client ile yapılır "
+        "(paylaşılan önbellek, ör. Redis, ısınır); --base-url verilirse çalışan "
+        "sunucuya HTTP ile gidilir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--concurrency', type=int, default=4, help='Eşzamanlı istek sayısı')
+        parser.add_argument('--base-url', help='Örn: https://edebai.com.tr (boşsa süreç içi)')
+        parser.add_argument('--languages', default=','.join(LANGUAGES), help='Virgülle ayrılmış diller')
+        parser.add_argument('--limit', type=int, default=0, help='En fazla bu kadar URL ısıt')
+        parser.add_argument('--json', action='store_true', help='Sonuçları JSON olarak yazdır')
+
+    def handle(self, *args, **options):
+        languages = [code.strip() for code in options['languages'].split(',') if code.strip()]
+        paths = [path for path, _ in collect_urls()]
+        if options['limit']:
+            paths = paths[:options['limit']]
+        jobs = [(path, language) for path in paths for language in languages]
+        if url_routing():
+            jobs = [(language_path(path, language), language) for path, language in jobs]
+
+        fetch = self.fetch_http if options['base_url'] else self.fetch_local
+        self.base_url = (options['base_url'] or '').rstrip('/')
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(1, options['concurrency'])) as pool:
+            results = list(pool.map(lambda job: fetch(*job), jobs))
+        total = (time.perf_counter() - started) * 1000
+
+        if options['json']:
+            self.stdout.write(json.dumps({'total_ms': round(total, 1), 'results': results}, indent=2))
+            return
+
+        for result in results:
+            style = self.style.SUCCESS if result['status'] == 200 else self.style.ERROR
+            self.stdout.write(style(
+                f"{result['status']:>4} {result['ms']:8.1f} ms  [{result['language']}] {result['path']}"
+            ))
+        failed = sum(1 for result in results if result['status'] != 200)
+        self.stdout.write(f'{len(results)} sayfa, {failed} hata, toplam {total:.0f} ms')
+
+    def get_host(self):
+        host = urlsplit(getattr(settings, 'SITE_URL', '')).hostname
+        if host and host in settings.ALLOWED_HOSTS:
+            return host
+        return settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+
+    def fetch_local(self, path, language):
+        client = Client(HTTP_HOST=self.get_host(), headers={WARMUP_HEADER: '1'})
+        client.cookies[LANGUAGE_COOKIE] = language_cookie_value(language)
+        started = time.perf_counter()
+        try:
+            status = client.get(path).status_code
+        except Exception as exc:
+            status = f'ERR {exc.__class__.__name__}'
+        finally:
+            # Her thread kendi veritabanı bağlantısını açar
+            connection.close()
+        return self.result(path, language, status, started)
+
+    def fetch_http(self, path, language):
+        request = urllib.request.Request(self.base_url + path, headers={
+            'Cookie': f'{LANGUAGE_COOKIE}={language_cookie_value(language)}',
+            WARMUP_HEADER: '1',
+        })
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as exc:
+            status = exc.code
+        except Exception as exc:
+            status = f'ERR {exc.__class__.__name__}'
+        return self.result(path, language, status, started)
+
+    def result(self, path, language, status, started):
+        return {
+            'path': path,
+            'language': language,
+            'status': status,
+            'ms': round((time.perf_counter() - started) * 1000, 1),
+        }
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from ...warmup import compile_templates, prime_config_caches, resolve_urls
+
+
+class Command(BaseCommand):
+    help = (
+        "Şablonları derler, URL'leri çözer ve ayar önbelleklerini doldurur. "
+        "Worker'lar bunu WARMUP_ON_STARTUP ile kendileri yapar; bu komut deploy "
+        "öncesi şablon hatalarını yakalamak ve derleme sürelerini görmek içindir."
+    )
+
+    def handle(self, *args, **options):
+        timings = compile_templates()
+        for name, elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+            self.stdout.write(f'{elapsed:8.1f} ms  {name}')
+
+        url_count = resolve_urls()
+        prime_config_caches()
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(timings)} şablon derlendi ({sum(timings.values()):.0f} ms), {url_count} URL çözüldü.'
+        ))
@@ -0,0 +1,137 @@
+"""
+Markdown belgesinden makale paragrafı içe aktarma.
+
+Belge bloklara ayrılır: # başlıklar 'heading', ``` blokları 'code',
+> satırları 'quote', geri kalanı 'text' paragrafı olur. Paragraflar
+şablonda düz metin olarak gösterildiği için satır içi Markdown
+(kalın, bağlantı vb.) metne çevrilir.
+"""
+import html
+import re
+
+import markdown
+from django.db import transaction
+from django.utils.html import strip_tags
+
+from .models import ArticleParagraph
+
+HEADING_RE = re.compile(r'^#{1,6}\s+(.*?)\s*#*\s*$')
+FENCE_RE = re.compile(r'^(```|~~~)\s*([\w+#.-]*)')
+LIST_ITEM_RE = re.compile(r'^\s*(?:([-*+])|(\d+[.)]))\s+(.*)$')
+
+
+def inline_text(line):
+    return html.unescape(strip_tags(markdown.markdown(line))).strip()
+
+
+def plain_text(text):
+    """Satır içi Markdown'ı düz metne çevir, satır sonlarını ve listeleri koru"""
+    lines = []
+    for line in text.splitlines():
+        item = LIST_ITEM_RE.match(line)
+        if item:
+            bullet, number, rest = item.groups()
+            lines.append(f"{'•' if bullet else number} {inline_text(rest)}")
+        else:
+            lines.append(inline_text(line) if line.strip() else '')
+    return '\n'.join(lines).strip()
+
+
+def parse_blocks(text):
+    """Belgeyi (paragraph_type, metin, kod dili) bloklarına ayır"""
+    blocks = []
+    buffer, kind = [], None
+
+    def flush():
+        nonlocal buffer, kind
+        if buffer:
+            body = '\n'.join(buffer)
+            if kind == 'quote':
+                body = '\n'.join(re.sub(r'^>\s?', '', line) for line in buffer)
+            blocks.append((kind, plain_text(body), ''))
+        buffer, kind = [], None
+
+    lines = text.replace('\r\n', '\n').split('\n')
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        fence = FENCE_RE.match(line.strip())
+        if fence:
+            flush()
+            marker, language = fence.groups()
+            code = []
+            index += 1
+            while index < len(lines) and not lines[index].strip().startswith(marker):
+                code.append(lines[index])
+                index += 1
+            blocks.append(('code', '\n'.join(code), language.lower()))
+        elif HEADING_RE.match(line):
+            flush()
+            blocks.append(('heading', plain_text(HEADING_RE.match(line).group(1)), ''))
+        elif not line.strip():
+            flush()
+        else:
+            line_kind = 'quote' if line.lstrip().startswith('>') else 'text'
+            if kind and kind != line_kind:
+                flush()
+            kind = line_kind
+            buffer.append(line)
+        index += 1
+    flush()
+    return [block for block in blocks if block[1] or block[0] == 'code']
+
+
+def build_paragraph(article, order, kind, body, code_language):
+    paragraph = ArticleParagraph(
+        article=article, order=order, paragraph_type=kind, code_language=code_language,
+    )
+    if kind == 'heading':
+        paragraph.heading_text = body[:200]
+    else:
+        paragraph.content = body
+    return paragraph
+
+
+def set_english(paragraph, kind, body):
+    if kind == 'heading':
+        paragraph.heading_text_en = body[:200]
+    else:
+        paragraph.content_en = body
+
+
+def import_markdown(article, text, language='tr', replace=False):
+    """
+    Markdown belgesini makaleye aktar, oluşturulan/güncellenen paragraf
+    sayısını döndür. Türkçe belge yeni paragraflar oluşturur; İngilizce belge
+    mevcut paragrafların EN alanlarını sırayla doldurur.
+    """
+    blocks = parse_blocks(text)
+    with transaction.atomic():
+        if language == 'en':
+            paragraphs = list(article.paragraphs.order_by('order', 'pk'))
+            if len(paragraphs) != len(blocks):
+                raise ValueError(
+                    f'İngilizce belgede {len(blocks)} blok var, makalede {len(paragraphs)} paragraf var.'
+                )
+            for paragraph, (kind, body, _) in zip(paragraphs, blocks):
+                set_english(paragraph, kind, body)
+            ArticleParagraph.objects.bulk_update(
+                paragraphs, ['content_en', 'heading_text_en'], batch_size=500,
+            )
+        else:
+            start = 0
+            if replace:
+                article.paragraphs.all().delete()
+            else:
+                last = article.paragraphs.order_by('-order').values_list('order', flat=True).first()
+                start = (last or 0) + 1
+            ArticleParagraph.objects.bulk_create(
+                [
+                    build_paragraph(article, start + offset, kind, body, code_language)
+                    for offset, (kind, body, code_language) in enumerate(blocks)
+                ],
+                batch_size=500,
+            )
+        # bulk_* sinyal göndermez; makale önbelleklerini güncelleme tarihi üzerinden tazele
+        article.save(update_fields=['updated_at'])
+    return len(blocks)
@@ -0,0 +1,350 @@
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import FileResponse, HttpResponse, JsonResponse
+from django.urls import Resolver404, resolve
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+
+from . import instrumentation, profiling
+from .analytics import count_view
+from .http_cache import CHROME_KEY, add_surrogate_keys, ensure_csrf_cookie
+from .language import DEFAULT_LANGUAGE, resolve_language, split_language_prefix, url_routing
+from .prerender import file_for, get_root, keys_file
+from .ratelimit import get_client_ip
+from .routers import pin_to_primary, unpin
+from .warmup import is_warmup_request
+
+performance_logger = logging.getLogger('blog.performance')
+
+
+class HybridMiddleware:
+    """
+    Hem WSGI hem ASGI altında thread değiştirmeden çalışan middleware tabanı.
+    Alt sınıflar before() ile erken yanıt döndürebilir, after() ile yanıtı
+    düzenler; ikisi de veritabanına gitmemelidir.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.before(request)
+        if response is None:
+            response = self.get_response(request)
+        return self.after(request, response)
+
+    async def __acall__(self, request):
+        response = self.before(request)
+        if response is None:
+            response = await self.get_response(request)
+        return self.after(request, response)
+
+    def before(self, request):
+        return None
+
+    def after(self, request, response):
+        return response
+
+
+class ReplicaPinningMiddleware(HybridMiddleware):
+    """
+    Okuma-yazma tutarlılığı: admin oturumlarında ve yazma isteklerinden
+    sonraki kısa süre boyunca okumaları birincil veritabanına sabitler.
+    """
+
+    cookie_name = 'db_pin'
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = pin_to_primary(self.should_pin(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            unpin(token)
+        return self.after(request, response)
+
+    async def __acall__(self, request):
+        if self.needs_user(request):
+            pinned = await sync_to_async(self.should_pin)(request)
+        else:
+            pinned = self.should_pin(request)
+        token = pin_to_primary(pinned)
+        try:
+            response = await self.get_response(request)
+        finally:
+            unpin(token)
+        return self.after(request, response)
+
+    def after(self, request, response):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS') and response.status_code < 400:
+            response.set_cookie(
+                self.cookie_name, '1',
+                max_age=getattr(settings, 'REPLICA_PIN_SECONDS', 10),
+                httponly=True, samesite='Lax',
+            )
+        return response
+
+    def should_pin(self, request):
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            return True
+        if self.cookie_name in request.COOKIES:
+            return True
+        if request.path.startswith('/admin/'):
+            return True
+        # Anonim ziyaretçiler için oturum tablosuna gitme
+        if not self.needs_user(request):
+            return False
+        user = getattr(request, 'user', None)
+        return bool(user and user.is_staff)
+
+    def needs_user(self, request):
+        return (
+            request.method in ('GET', 'HEAD', 'OPTIONS')
+            and self.cookie_name not in request.COOKIES
+            and not request.path.startswith('/admin/')
+            and settings.SESSION_COOKIE_NAME in request.COOKIES
+        )
+
+
+class LanguageMiddleware(HybridMiddleware):
+    """
+    request.LANGUAGE_CODE'u URL önekinden ya da (I18N_URLS kapalıysa) imzalı
+    dil çerezinden veya Accept-Language'tan belirler (bkz. language.py);
+    oturuma dokunmaz. i18n_patterns URL'leri etkin dile göre çözüp ürettiği
+    için dil URL çözümlemesinden önce etkinleştirilir; çerez modunda URL'ler
+    öneksiz kalsın diye varsayılan dil etkin olur. Önceden render edilmiş
+    sayfalar da dile göre seçildiği için PrerenderedPageMiddleware'den önce
+    gelmelidir.
+    """
+
+    def before(self, request):
+        request.LANGUAGE_CODE = resolve_language(request)
+        translation.activate(request.LANGUAGE_CODE if url_routing() else DEFAULT_LANGUAGE)
+        return None
+
+    def after(self, request, response):
+        translation.deactivate()
+        return response
+
+
+class PrerenderedPageMiddleware(HybridMiddleware):
+    """
+    export_site ile üretilmiş HTML varsa view'ı çalıştırmadan onu döndürür.
+    Yalnızca sorgu parametresiz GET/HEAD isteklerinde ve oturumu olmayan
+    ziyaretçilerde devreye girer. CSRF çerezinin AJAX formları için yine
+    verilmesi gerektiğinden CsrfViewMiddleware'den sonra gelmelidir.
+    View hiç çalışmadığı için önbellek politikası URL'nin view'ından,
+    sayfaya özgü surrogate key'ler index.keys dosyasından alınır; makale
+    görüntülenmeleri de burada sayılır.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.root = get_root()
+
+    def before(self, request):
+        if self.root is None or request.method not in ('GET', 'HEAD') or request.GET:
+            return None
+        if settings.SESSION_COOKIE_NAME in request.COOKIES or is_warmup_request(request):
+            return None
+
+        _, path = split_language_prefix(request.path)
+        target = file_for(path, request.LANGUAGE_CODE, self.root)
+        if target is None or not target.is_file():
+            return None
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return None
+        request.cache_policy = getattr(match.func, 'cache_policy', None)
+        try:
+            keys = keys_file(target).read_text().split()
+        except OSError:
+            keys = []
+        add_surrogate_keys(request, *keys)
+        if match.url_name == 'article_detail':
+            # View çalışmadığı için görüntülenme burada sayılır; makale
+            # numarası surrogate key'den (article-<pk>) okunur
+            for key in keys:
+                if key.startswith('article-') and key[8:].isdigit():
+                    count_view(int(key[8:]), request.LANGUAGE_CODE)
+                    break
+
+        # Önceden render edilen sayfadaki formlar için
+        ensure_csrf_cookie(request)
+        response = FileResponse(open(target, 'rb'), content_type='text/html; charset=utf-8')
+        response['X-Prerendered'] = '1'
+        return response
+
+
+class CacheHeadersMiddleware(HybridMiddleware):
+    """
+    @cache_policy ile işaretlenmiş view'lara Cache-Control ve surrogate-key
+    başlıklarını ekler. Çerez yazan ya da oturumu olan yanıtlar private kalır.
+    Set-Cookie'yi görebilmek için CSRF ve oturum middleware'lerinden önce
+    (dışta) yer almalıdır.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.header = getattr(settings, 'SURROGATE_KEY_HEADER', 'Surrogate-Key')
+
+    def after(self, request, response):
+        policy = getattr(request, 'cache_policy', None)
+        if policy is None or request.method not in ('GET', 'HEAD'):
+            return response
+        if response.has_header('Cache-Control'):
+            return response
+
+        if (response.status_code != 200 or response.cookies
+                or settings.SESSION_COOKIE_NAME in request.COOKIES):
+            patch_cache_control(response, private=True, max_age=0)
+            return response
+
+        directives = {'public': True, 'max_age': policy['max_age']}
+        if policy['s_maxage'] is not None:
+            directives['s_maxage'] = policy['s_maxage']
+        if policy['stale_while_revalidate']:
+            directives['stale_while_revalidate'] = policy['stale_while_revalidate']
+        patch_cache_control(response, **directives)
+        if not url_routing():
+            # Dil çerezle ya da Accept-Language ile seçildiği için aynı URL iki
+            # farklı içerik döndürebilir
+            patch_vary_headers(response, ['Cookie', 'Accept-Language'])
+
+        keys = [CHROME_KEY, *policy['keys'], *getattr(request, 'surrogate_keys', [])]
+        response[self.header] = ' '.join(dict.fromkeys(keys))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.cache_policy = getattr(view_func, 'cache_policy', None)
+
+
+class RequestTimingMiddleware(HybridMiddleware):
+    """
+    İstek başına sorgu sayısı, veritabanı, şablon ve view sürelerini ölçer
+    (bkz. instrumentation.py). Toplam süreyi doğru ölçmek için listenin
+    başına yakın, WhiteNoise'dan sonra yer almalıdır.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'INSTRUMENTATION_ENABLED', True):
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+        self.server_timing = getattr(settings, 'SERVER_TIMING_HEADER', settings.DEBUG)
+
+    def before(self, request):
+        request._timing_token = instrumentation.start()
+        return None
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = instrumentation.current()
+        if metrics is not None:
+            metrics.view_started = time.perf_counter()
+
+    def after(self, request, response):
+        metrics = instrumentation.current()
+        token = getattr(request, '_timing_token', None)
+        if metrics is None or token is None:
+            return response
+        try:
+            if metrics.view_started is not None:
+                metrics.view_ms = (time.perf_counter() - metrics.view_started) * 1000
+            total_ms = metrics.total_ms()
+            if self.server_timing:
+                response['Server-Timing'] = instrumentation.server_timing(metrics, total_ms)
+
+            match = getattr(request, 'resolver_match', None)
+            view_name = match.view_name if match else None
+            if view_name:
+                instrumentation.view_stats.record(view_name, metrics, total_ms)
+            if total_ms >= instrumentation.slow_request_threshold():
+                performance_logger.warning(
+                    instrumentation.slow_request_record(request, response, view_name, metrics, total_ms)
+                )
+        finally:
+            instrumentation.finish(token)
+        return response
+
+
+class ProfilerMiddleware(HybridMiddleware):
+    """
+    Yöneticilerin ?_profile=1 ya da X-Profile: 1 ile blog sayfalarını canlı
+    ortamda profillemesini sağlar (bkz. profiling.py). Diğer herkes için
+    bayrak yok sayılır. request.user gerektiği için
+    AuthenticationMiddleware'den sonra gelmelidir. ASGI altında yalnızca
+    event loop thread'i örneklenir.
+    """
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        mode = profiling.requested_mode(request)
+        if mode is None:
+            return self.get_response(request)
+        allowed, response = self.check(request)
+        if not allowed:
+            return response or self.get_response(request)
+
+        profiler = profiling.make_profiler(mode)
+        started = time.perf_counter()
+        with profiler:
+            response = self.get_response(request)
+        return self.finish(request, response, profiler, mode, started)
+
+    async def __acall__(self, request):
+        mode = profiling.requested_mode(request)
+        if mode is None:
+            return await self.get_response(request)
+        allowed, response = await sync_to_async(self.check)(request)
+        if not allowed:
+            return response or await self.get_response(request)
+
+        profiler = profiling.make_profiler(mode)
+        started = time.perf_counter()
+        with profiler:
+            response = await self.get_response(request)
+        return self.finish(request, response, profiler, mode, started)
+
+    def check(self, request):
+        """(izinli mi, hemen döndürülecek yanıt) döndür"""
+        user = getattr(request, 'user', None)
+        if not (user and user.is_staff):
+            return False, None
+        try:
+            if resolve(request.path_info).namespace != 'blog':
+                return False, None
+        except Resolver404:
+            return False, None
+
+        allowed, retry_after = profiling.get_limiter().consume(f'user={user.pk}:{get_client_ip(request)}')
+        if not allowed:
+            response = JsonResponse({
+                'success': False,
+                'message': 'Profil sınırı aşıldı. Lütfen biraz sonra tekrar deneyin.'
+            }, status=429)
+            response['Retry-After'] = str(int(retry_after) + 1)
+            return False, response
+        return True, None
+
+    def finish(self, request, response, profiler, mode, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        name = profiling.save_report(profiler, request, elapsed_ms)
+        if mode == 'summary':
+            response = HttpResponse(profiler.summary(), content_type='text/plain; charset=utf-8')
+        response['X-Profile-Report'] = name
+        response['Cache-Control'] = 'private, no-store'
+        return response
@@ -0,0 +1,51 @@
+# Generated by Django 4.2.17 on 2026-10-19 17:22
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_admin_list_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArticleViewBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=5, verbose_name='Dil')),
+                ('period', models.CharField(choices=[('day', 'Gün'), ('week', 'Hafta'), ('month', 'Ay')], default='day', max_length=5, verbose_name='Dönem')),
+                ('start', models.DateField(verbose_name='Başlangıç')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='Görüntülenme')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='view_buckets', to='blog.article', verbose_name='Makale')),
+            ],
+            options={
+                'verbose_name': 'Görüntülenme Kovası',
+                'verbose_name_plural': 'Görüntülenme Kovaları',
+            },
+        ),
+        migrations.CreateModel(
+            name='TrendingArticle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('language', models.CharField(max_length=5, verbose_name='Dil')),
+                ('rank', models.PositiveSmallIntegerField(verbose_name='Sıra')),
+                ('score', models.FloatField(verbose_name='Skor')),
+                ('computed_at', models.DateTimeField(verbose_name='Hesaplanma')),
+                ('article', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog.article', verbose_name='Makale')),
+                ('category', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='blog.category', verbose_name='Kategori')),
+            ],
+            options={
+                'verbose_name': 'Trend Makale',
+                'verbose_name_plural': 'Trend Makaleler',
+                'ordering': ['rank'],
+                'indexes': [models.Index(fields=['language', 'category', 'rank'], name='blog_trending_lookup_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='articleviewbucket',
+            constraint=models.UniqueConstraint(fields=('period', 'start', 'article', 'language'), name='blog_viewbucket_unique'),
+        ),
+    ]
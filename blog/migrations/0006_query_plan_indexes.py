@@ -0,0 +1,37 @@
+# Generated by Django 4.2.17 on 2026-10-19 17:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_view_analytics'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='blog_articl_slug_cc8df7_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['-published_date'], name='blog_article_published_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('is_published', True)), fields=['category', '-published_date', '-id'], name='blog_article_category_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('is_featured', True), ('is_published', True)), fields=['-published_date'], name='blog_article_featured_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articleimage',
+            index=models.Index(fields=['article', 'order'], name='blog_image_order_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='articleparagraph',
+            index=models.Index(fields=['article', 'order'], name='blog_paragraph_order_idx'),
+        ),
+    ]
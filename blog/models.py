@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.query import ValuesIterable
 from django.utils.text import slugify
 from django.urls import reverse
 from django.core.validators import MinLengthValidator
@@ -25,6 +26,9 @@ class Category(models.Model):
         super().save(*args, **kwargs)
     
     def get_article_count(self):
+        # Liste sorgusu sayıyı annotate ettiyse tekrar sorgulama
+        if hasattr(self, 'published_article_count'):
+            return self.published_article_count
         return self.articles.filter(is_published=True).count()
 
 
@@ -106,6 +110,66 @@ class HomepageSEO(SEOMetadata):
         super().save(*args, **kwargs)
 
 
+class ArticleCard:
+    """
+    Liste sayfalarındaki makale kartı. Article'ın ~30 sütunu yerine yalnızca
+    kartın gösterdiği alanları taşır; başlık ve özet etkin dile göre çözülmüştür.
+    """
+    __slots__ = (
+        'pk', 'slug', 'title', 'excerpt', 'thumbnail', 'thumbnail_alt',
+        'published_date', 'reading_time', 'category_id',
+    )
+
+    def __init__(self, row):
+        self.pk = row['id']
+        self.slug = row['slug']
+        # İngilizce alanlar yalnızca 'en' kartlarında seçilir
+        self.title = row.get('title_en') or row['title']
+        self.excerpt = row.get('excerpt_en') or row['excerpt']
+        self.thumbnail = (
+            THUMBNAIL_FIELD.attr_class(None, THUMBNAIL_FIELD, row['thumbnail'])
+            if row['thumbnail'] else None
+        )
+        self.thumbnail_alt = row['thumbnail_alt']
+        self.published_date = row['published_date']
+        self.reading_time = row['reading_time']
+        self.category_id = row['category_id']
+
+    @property
+    def id(self):
+        return self.pk
+
+    def get_absolute_url(self):
+        return reverse('blog:article_detail', kwargs={'slug': self.slug})
+
+    def __eq__(self, other):
+        return isinstance(other, (ArticleCard, Article)) and other.pk == self.pk
+
+    def __hash__(self):
+        return hash(self.pk)
+
+    def __repr__(self):
+        return f'<ArticleCard: {self.slug}>'
+
+
+class ArticleCardIterable(ValuesIterable):
+    """values() satırlarını ArticleCard nesnesine çevirir"""
+
+    def __iter__(self):
+        for row in super().__iter__():
+            yield ArticleCard(row)
+
+
+class ArticleQuerySet(models.QuerySet):
+
+    def cards(self, language='tr'):
+        """Kart alanlarını seçen, ArticleCard döndüren QuerySet (sayfalama ve dilimleme çalışır)"""
+        fields = CARD_FIELDS + (CARD_FIELDS_EN if language == 'en' else ())
+        clone = self.values(*fields)
+        clone._iterable_class = ArticleCardIterable
+        return clone
+
+
 class Article(SEOMetadata):
     """Makale modeli - SEO özellikli"""
     title = models.CharField(max_length=200, verbose_name="Başlık (TR)")
@@ -206,14 +270,29 @@ class Article(SEOMetadata):
     
     # İstatistikler
     view_count = models.IntegerField(default=0, verbose_name="Görüntülenme")
+
+    objects = ArticleQuerySet.as_manager()
     
     class Meta:
         verbose_name = "Makale"
         verbose_name_plural = "Makaleler"
         ordering = ['-published_date', '-created_at']
         indexes = [
+            # Yönetim listesi (filtresiz, tarihe göre)
             models.Index(fields=['-published_date', 'is_published']),
-            models.Index(fields=['slug']),
+            # Public sorgular yalnızca yayındaki makalelere bakar (bkz. index_audit)
+            models.Index(
+                fields=['-published_date'], condition=models.Q(is_published=True),
+                name='blog_article_published_idx',
+            ),
+            models.Index(
+                fields=['category', '-published_date', '-id'], condition=models.Q(is_published=True),
+                name='blog_article_category_pub_idx',
+            ),
+            models.Index(
+                fields=['-published_date'], condition=models.Q(is_published=True, is_featured=True),
+                name='blog_article_featured_idx',
+            ),
         ]
     
     def __str__(self):
@@ -265,6 +344,15 @@ class Article(SEOMetadata):
         self.save(update_fields=['view_count'])
 
 
+# Kartın kullandığı alanlar; İngilizce karşılıklar yalnızca 'en' için seçilir
+CARD_FIELDS = (
+    'id', 'slug', 'title', 'excerpt', 'thumbnail', 'thumbnail_alt',
+    'published_date', 'reading_time', 'category_id',
+)
+CARD_FIELDS_EN = ('title_en', 'excerpt_en')
+THUMBNAIL_FIELD = Article._meta.get_field('thumbnail')
+
+
 class ArticleParagraph(models.Model):
     """Makale paragrafları"""
     article = models.ForeignKey(
@@ -319,9 +407,15 @@ class ArticleParagraph(models.Model):
         verbose_name = "Makale Paragrafı"
         verbose_name_plural = "Makale Paragrafları"
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['article', 'order'], name='blog_paragraph_order_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.article.title} - Paragraf {self.order}"
+        # Makale yüklenmemişse yalnızca bunun için sorgu yapma
+        if ArticleParagraph.article.is_cached(self):
+            return f"{self.article.title} - Paragraf {self.order}"
+        return f"Paragraf {self.order}"
     
     def get_content(self, language='tr'):
         """Dile göre içerik döndür"""
@@ -375,9 +469,14 @@ class ArticleImage(models.Model):
         verbose_name = "Makale Görseli"
         verbose_name_plural = "Makale Görselleri"
         ordering = ['order']
+        indexes = [
+            models.Index(fields=['article', 'order'], name='blog_image_order_idx'),
+        ]
     
     def __str__(self):
-        return f"{self.article.title} - Görsel {self.order}"
+        if ArticleImage.article.is_cached(self):
+            return f"{self.article.title} - Görsel {self.order}"
+        return f"Görsel {self.order}"
 
 
 class NewsletterSubscriber(models.Model):
@@ -390,6 +489,10 @@ class NewsletterSubscriber(models.Model):
         verbose_name = "Bülten Abonesi"
         verbose_name_plural = "Bülten Aboneleri"
         ordering = ['-subscribed_at']
+        indexes = [
+            models.Index(fields=['-subscribed_at'], name='blog_subscr_date_idx'),
+            models.Index(fields=['is_active', '-subscribed_at'], name='blog_subscr_active_date_idx'),
+        ]
     
     def __str__(self):
         return self.email
@@ -407,11 +510,84 @@ class ContactMessage(models.Model):
         verbose_name = "İletişim Mesajı"
         verbose_name_plural = "İletişim Mesajları"
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at'], name='blog_contact_date_idx'),
+            models.Index(fields=['is_read', '-created_at'], name='blog_contact_read_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.created_at.strftime('%d.%m.%Y')}"
 
 
+class ArticleViewBucket(models.Model):
+    """Makale görüntülenmeleri: gün, hafta ve ay kovaları (bkz. analytics.py)"""
+    PERIOD_DAY = 'day'
+    PERIOD_WEEK = 'week'
+    PERIOD_MONTH = 'month'
+    PERIOD_CHOICES = [
+        (PERIOD_DAY, 'Gün'),
+        (PERIOD_WEEK, 'Hafta'),
+        (PERIOD_MONTH, 'Ay'),
+    ]
+
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name='view_buckets',
+        verbose_name="Makale"
+    )
+    language = models.CharField(max_length=5, verbose_name="Dil")
+    period = models.CharField(max_length=5, choices=PERIOD_CHOICES, default=PERIOD_DAY, verbose_name="Dönem")
+    start = models.DateField(verbose_name="Başlangıç")
+    views = models.PositiveIntegerField(default=0, verbose_name="Görüntülenme")
+
+    class Meta:
+        verbose_name = "Görüntülenme Kovası"
+        verbose_name_plural = "Görüntülenme Kovaları"
+        constraints = [
+            # Dönem ve tarih önde: trend ve sıkıştırma sorguları aralık taraması yapar
+            models.UniqueConstraint(
+                fields=['period', 'start', 'article', 'language'], name='blog_viewbucket_unique'
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.article_id} [{self.language}] {self.period} {self.start}: {self.views}"
+
+
+class TrendingArticle(models.Model):
+    """Önceden hesaplanmış trend sıralaması: kategori (boşsa tüm site) ve dil başına ilk N"""
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name="Kategori"
+    )
+    language = models.CharField(max_length=5, verbose_name="Dil")
+    rank = models.PositiveSmallIntegerField(verbose_name="Sıra")
+    article = models.ForeignKey(
+        Article,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name="Makale"
+    )
+    score = models.FloatField(verbose_name="Skor")
+    computed_at = models.DateTimeField(verbose_name="Hesaplanma")
+
+    class Meta:
+        verbose_name = "Trend Makale"
+        verbose_name_plural = "Trend Makaleler"
+        ordering = ['rank']
+        indexes = [
+            models.Index(fields=['language', 'category', 'rank'], name='blog_trending_lookup_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.language} #{self.rank} - {self.article_id}"
+
+
 class CookieConsent(models.Model):
     """Çerez politikası ayarları"""
     is_active = models.BooleanField(default=True, verbose_name="Aktif")
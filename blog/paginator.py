@@ -0,0 +1,50 @@
+"""
+Büyük tablolar için tahmini sayım yapan paginator.
+
+Admin değişiklik listesi filtresiz açıldığında tüm tabloyu COUNT(*) ile
+saymak yerine veritabanının tuttuğu satır tahmini kullanılır. Filtre ya da
+arama varsa sorgu indeksleri kullanabildiği için kesin sayım yapılır.
+"""
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+# Bu sayının altındaki tablolar her zaman kesin sayılır
+ESTIMATE_THRESHOLD = 10000
+
+
+def estimate_row_count(model, using='default'):
+    """Tablonun yaklaşık satır sayısı; desteklenmiyorsa None"""
+    connection = connections[using]
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('SELECT reltuples::bigint FROM pg_class WHERE relname = %s', [table])
+        elif connection.vendor == 'mysql':
+            cursor.execute(
+                'SELECT table_rows FROM information_schema.tables '
+                'WHERE table_schema = DATABASE() AND table_name = %s',
+                [table],
+            )
+        elif connection.vendor == 'sqlite':
+            # rowid B-tree'nin son yaprağı okunur; silinen satırlar kadar fazla sayar
+            cursor.execute(f'SELECT MAX(rowid) FROM {connection.ops.quote_name(table)}')
+        else:
+            return None
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class EstimatedCountPaginator(Paginator):
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where and not query.distinct:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= ESTIMATE_THRESHOLD:
+                return estimate
+        return super().count
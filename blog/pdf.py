@@ -0,0 +1,157 @@
+"""
+Makalelerin PDF çıktısı.
+
+PDF'ler PDF_ROOT altında <id>-<dil>-<updated_at>.pdf adıyla saklanır; makale
+güncellenince ad değişir, eski dosya bir sonraki üretimde silinir. Aynı
+makale için eşzamanlı istekler makale başına bir kilitle sıraya girer ve
+PDF yalnızca bir kez üretilir. weasyprint yalnızca üretim sırasında yüklenir.
+"""
+import logging
+import threading
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.template.loader import render_to_string
+
+try:
+    import fcntl
+except ImportError:  # Windows'ta yalnızca süreç içi kilit kullanılır
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+class PDFUnavailable(Exception):
+    """weasyprint ya da sistem kütüphaneleri kurulu değil"""
+
+
+def get_root():
+    return Path(getattr(settings, 'PDF_ROOT', settings.BASE_DIR / 'pdf_cache'))
+
+
+def pdf_path(article, language):
+    stamp = article.updated_at.strftime('%Y%m%d%H%M%S%f')
+    return get_root() / f'{article.pk}-{language}-{stamp}.pdf'
+
+
+def remove_article_pdfs(article_id, language='*', keep=None):
+    root = get_root()
+    if not root.exists():
+        return
+    for path in root.glob(f'{article_id}-{language}-*.pdf'):
+        if path != keep:
+            path.unlink(missing_ok=True)
+
+
+def article_lock(article_id):
+    with _locks_guard:
+        return _locks.setdefault(article_id, threading.Lock())
+
+
+class FileLock:
+    """Aynı makaleyi üreten diğer worker süreçlerini bekletir"""
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = None
+
+    def __enter__(self):
+        if fcntl is not None:
+            self.handle = open(self.path, 'a')
+            fcntl.flock(self.handle, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.handle is not None:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+
+
+def url_fetcher(url):
+    """
+    Görselleri ve stilleri HTTP yerine diskten oku; dış adreslere ve
+    MEDIA_ROOT/STATIC_ROOT dışına (ör. /media/../settings.py) gitme.
+    """
+    from weasyprint import default_url_fetcher
+
+    path = unquote(urlparse(url).path)
+    if path.startswith(settings.MEDIA_URL):
+        prefix, root = settings.MEDIA_URL, settings.MEDIA_ROOT
+    elif path.startswith(settings.STATIC_URL):
+        prefix, root = settings.STATIC_URL, settings.STATIC_ROOT
+    else:
+        raise ValueError(f'PDF için izin verilmeyen adres: {url}')
+
+    root = Path(root).resolve()
+    relative = path[len(prefix):]
+    local = (root / relative).resolve()
+    if not local.is_relative_to(root):
+        raise ValueError(f'PDF için kök dışına çıkan adres: {url}')
+    if prefix == settings.STATIC_URL:
+        # Geliştirmede collectstatic çalışmamış olabilir; finders kendi
+        # klasörlerinin dışına çıkmaz
+        found = finders.find(relative)
+        if found:
+            local = Path(found).resolve()
+    return default_url_fetcher(local.as_uri())
+
+
+def print_items(paragraphs, images, language):
+    """Şablonun dile göre metni doğrudan kullanabileceği içerik listesi"""
+    from .views import build_content_items
+
+    items = []
+    for item in build_content_items(paragraphs, images):
+        if item['type'] == 'paragraph':
+            paragraph = item['data']
+            kind = paragraph.paragraph_type or 'text'
+            text = paragraph.get_heading(language) if kind == 'heading' else paragraph.get_content(language)
+            if kind == 'code':
+                text = paragraph.content
+            items.append({'type': kind, 'text': text, 'code_language': paragraph.code_language})
+        else:
+            items.append({'type': 'image', 'image': item['data']})
+    return items
+
+
+def render_pdf(request, article, language, target):
+    try:
+        from weasyprint import HTML
+    except (ImportError, OSError) as error:
+        logger.warning('weasyprint yüklenemedi: %s', error)
+        raise PDFUnavailable(str(error)) from error
+
+    context = {
+        'article': article,
+        'language': language,
+        'title': article.get_title(language),
+        'excerpt': article.get_excerpt(language),
+        'items': print_items(article.paragraphs.all(), article.images.all(), language),
+        'source_url': request.build_absolute_uri(article.get_absolute_url()),
+    }
+    html = render_to_string('blog/article_print.html', context, request=request)
+    tmp = target.with_suffix('.tmp')
+    HTML(string=html, base_url=request.build_absolute_uri('/'), url_fetcher=url_fetcher).write_pdf(tmp)
+    tmp.replace(target)
+
+
+def get_article_pdf(request, article, language):
+    """Makalenin PDF dosyasının yolu; yoksa bir kez üretilir"""
+    target = pdf_path(article, language)
+    if target.is_file():
+        return target
+
+    root = get_root()
+    root.mkdir(parents=True, exist_ok=True)
+    with article_lock(article.pk), FileLock(root / f'{article.pk}.lock'):
+        # Kilidi beklerken başka bir istek üretmiş olabilir
+        if not target.is_file():
+            render_pdf(request, article, language, target)
+            remove_article_pdfs(article.pk, language, keep=target)
+            logger.info('PDF üretildi: %s', target.name)
+    return target
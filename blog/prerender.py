@@ -0,0 +1,217 @@
+"""
+Statik önceden render (export) modu.
+
+Herkese açık sayfalar PRERENDER_ROOT altına HTML olarak yazılır:
+Türkçe sayfalar kökte, İngilizce sayfalar en/ altında bulunur
+(ör. makale/<slug>/index.html, en/makale/<slug>/index.html); bu düzen
+I18N_URLS açıkken URL'lerin kendisiyle aynıdır.
+Arama, sayfalama (?page=) ve AJAX uçları Django'da kalır. Sayfaya özgü
+surrogate key'ler (ör. article-<pk>) HTML'in yanındaki index.keys dosyasına
+yazılır; PrerenderedPageMiddleware bunları view'ın önbellek politikasıyla
+birlikte yanıta ekler.
+"""
+import json
+from pathlib import Path
+from urllib.parse import unquote
+
+from django.conf import settings
+from django.test import Client
+from django.urls import reverse
+
+from .language import (
+    DEFAULT_LANGUAGE, LANGUAGE_COOKIE, LANGUAGES, language_cookie_value, language_path, url_routing,
+)
+from .models import Article, Category, CookieConsent, HomepageSEO
+from .warmup import WARMUP_HEADER
+
+MANIFEST_NAME = '.manifest.json'
+
+STATIC_PAGES = [
+    'blog:home', 'blog:blog_list', 'blog:category_list',
+    'blog:about', 'blog:contact', 'blog:cookie_policy',
+]
+LIST_PAGES = ['blog:home', 'blog:blog_list', 'blog:category_list']
+
+
+def get_root():
+    root = getattr(settings, 'PRERENDER_ROOT', None)
+    return Path(root) if root else None
+
+
+def file_for(url_path, language, root=None):
+    """URL yolunun diskteki HTML dosyası; kök dışına çıkan yollar için None"""
+    root = (root or get_root()).resolve()
+    relative = unquote(url_path).strip('/')
+    if language != DEFAULT_LANGUAGE:
+        relative = f'{language}/{relative}'.rstrip('/')
+    target = (root / relative / 'index.html').resolve()
+    if root not in target.parents:
+        return None
+    return target
+
+
+def keys_file(target):
+    """Sayfanın surrogate key'lerini tutan yan dosya"""
+    return target.with_name('index.keys')
+
+
+def article_url(slug):
+    return reverse('blog:article_detail', kwargs={'slug': slug})
+
+
+def category_url(slug):
+    return reverse('blog:category_detail', kwargs={'slug': slug})
+
+
+def snapshot():
+    """Önceden render edilen sayfaları etkileyen içeriğin özeti"""
+    articles = {
+        str(pk): {
+            'slug': slug,
+            'category': category_id,
+            'featured': is_featured,
+            'updated': updated_at.isoformat(),
+        }
+        for pk, slug, category_id, is_featured, updated_at in
+        Article.objects.filter(is_published=True).values_list(
+            'pk', 'slug', 'category_id', 'is_featured', 'updated_at'
+        )
+    }
+    categories = {
+        str(pk): slug for pk, slug in Category.objects.values_list('pk', 'slug')
+    }
+    # Kategori, çerez ve SEO ayarları her sayfanın ortak kısmında
+    chrome = json.dumps([
+        list(Category.objects.values_list('pk', 'name', 'slug', 'icon', 'order')),
+        list(CookieConsent.objects.filter(is_active=True).values_list('pk', flat=True)),
+        [str(ts) for ts in HomepageSEO.objects.filter(is_active=True).values_list('updated_at', flat=True)],
+    ], default=str)
+    return {'articles': articles, 'categories': categories, 'chrome': chrome}
+
+
+def all_urls(state):
+    urls = [reverse(name) for name in STATIC_PAGES]
+    urls += [category_url(slug) for slug in state['categories'].values()]
+    urls += [article_url(entry['slug']) for entry in state['articles'].values()]
+    return urls
+
+
+def urls_for_article(entry, categories):
+    """Bir makale değişince yeniden render edilmesi gereken sayfalar"""
+    urls = {article_url(entry['slug'])}
+    urls.update(reverse(name) for name in LIST_PAGES if name != 'blog:home')
+    if entry['featured']:
+        urls.add(reverse('blog:home'))
+    category_slug = categories.get(str(entry['category']))
+    if category_slug:
+        urls.add(category_url(category_slug))
+    return urls
+
+
+def diff(previous, current):
+    """
+    (render edilecek URL'ler, silinecek URL'ler) döndür.
+    Ortak kısım değiştiyse her şey yeniden render edilir.
+    """
+    if not previous or previous.get('chrome') != current['chrome']:
+        stale = set()
+        if previous:
+            stale = set(all_urls(previous)) - set(all_urls(current))
+        return set(all_urls(current)), stale
+
+    render, remove = set(), set()
+    old_articles, new_articles = previous['articles'], current['articles']
+    for pk, entry in new_articles.items():
+        old = old_articles.get(pk)
+        if old == entry:
+            continue
+        render |= urls_for_article(entry, current['categories'])
+        if old:
+            render |= urls_for_article(old, current['categories'])
+            if old['slug'] != entry['slug']:
+                remove.add(article_url(old['slug']))
+    for pk, old in old_articles.items():
+        if pk not in new_articles:
+            render |= urls_for_article(old, current['categories'])
+            remove.add(article_url(old['slug']))
+    render -= remove
+    return render, remove
+
+
+def load_manifest(root):
+    try:
+        return json.loads((root / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(root, state):
+    (root / MANIFEST_NAME).write_text(json.dumps(state))
+
+
+def render_page(client, url_path, language, root):
+    """Sayfayı render edip dosyaya yaz; HTTP durum kodunu döndür"""
+    client.cookies[LANGUAGE_COOKIE] = language_cookie_value(language)
+    response = client.get(language_path(url_path, language) if url_routing() else url_path)
+    target = file_for(url_path, language, root)
+    if response.status_code == 200 and target is not None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        keys_file(target).write_text(
+            response.get(getattr(settings, 'SURROGATE_KEY_HEADER', 'Surrogate-Key'), '')
+        )
+        tmp = target.with_suffix('.tmp')
+        tmp.write_bytes(response.content)
+        tmp.replace(target)
+    elif target is not None:
+        target.unlink(missing_ok=True)
+        keys_file(target).unlink(missing_ok=True)
+    return response.status_code
+
+
+def remove_pages(url_paths, root=None):
+    root = root or get_root()
+    if not root or not root.exists():
+        return
+    for url_path in url_paths:
+        for language in LANGUAGES:
+            target = file_for(url_path, language, root)
+            if target is not None:
+                target.unlink(missing_ok=True)
+                keys_file(target).unlink(missing_ok=True)
+
+
+def make_client():
+    host = settings.ALLOWED_HOSTS[0] if settings.ALLOWED_HOSTS else 'localhost'
+    return Client(HTTP_HOST=host, headers={WARMUP_HEADER: '1'})
+
+
+def invalidate_article(article):
+    """Kaydedilen makalenin etkilediği dosyaları sil; Django dinamik sunar"""
+    root = get_root()
+    if not root or not root.exists():
+        return
+    manifest = load_manifest(root) or {'articles': {}, 'categories': {}}
+    categories = {str(pk): slug for pk, slug in Category.objects.values_list('pk', 'slug')}
+    entry = {
+        'slug': article.slug,
+        'category': article.category_id,
+        'featured': article.is_featured,
+    }
+    urls = urls_for_article(entry, categories)
+    old = manifest['articles'].get(str(article.pk))
+    if old:
+        urls |= urls_for_article(old, categories)
+    remove_pages(urls, root)
+
+
+def invalidate_all():
+    """
+    Ortak kısım değişti; önceden render edilen tüm sayfaları kaldır.
+    Manifesto kalır: sonraki export_site eski sayfaları ondan bulur.
+    """
+    root = get_root()
+    if not root or not root.exists():
+        return
+    for target in root.rglob('index.html'):
+        target.unlink(missing_ok=True)
+        keys_file(target).unlink(missing_ok=True)
@@ -0,0 +1,211 @@
+"""
+Yöneticiler için istek bazında profil çıkarma.
+
+?_profile=1 (ya da X-Profile: 1 başlığı) ile gelen bir blog isteği
+örnekleyici profiler altında çalıştırılır; ?_profile=cprofile cProfile
+kullanır. Rapor PROFILE_ROOT altına yazılır:
+
+- <ad>.collapsed: flame graph araçlarının (flamegraph.pl, speedscope)
+  okuduğu "çerçeve;çerçeve;çerçeve örnek_sayısı" satırları
+- <ad>.txt: en çok zaman harcayan fonksiyonların sıralı özeti
+
+Dosya adı X-Profile-Report başlığında döner; ?_profile=summary özeti
+sayfa yerine doğrudan gösterir. Kullanıcı başına hız sınırı ve rapor
+boyutu / sayısı sınırı vardır.
+"""
+import cProfile
+import io
+import os
+import pstats
+import sys
+import sysconfig
+import threading
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.text import slugify
+
+from .ratelimit import TokenBucketLimiter
+
+QUERY_PARAM = '_profile'
+HEADER = 'HTTP_X_PROFILE'
+
+# Dosya yollarını kısaltmak için çıkarılacak önekler
+_PATH_PREFIXES = sorted(
+    {str(Path(path)) + os.sep for path in (
+        sysconfig.get_paths()['purelib'], sysconfig.get_paths()['stdlib'], settings.BASE_DIR,
+    )},
+    key=len, reverse=True,
+)
+
+_limiter = None
+
+
+def get_limiter():
+    global _limiter
+    if _limiter is None:
+        _limiter = TokenBucketLimiter(getattr(settings, 'PROFILER_RATE', '6/m'), prefix='rl:profiler')
+    return _limiter
+
+
+def requested_mode(request):
+    """İstenen profil modu ('sample', 'cprofile', 'summary') ya da None"""
+    value = request.GET.get(QUERY_PARAM) or request.META.get(HEADER)
+    if not value or value == '0':
+        return None
+    return value if value in ('cprofile', 'summary') else 'sample'
+
+
+def short_path(filename):
+    for prefix in _PATH_PREFIXES:
+        if filename.startswith(prefix):
+            return filename[len(prefix):]
+    return filename
+
+
+def frame_name(code):
+    return f'{code.co_name} ({short_path(code.co_filename)}:{code.co_firstlineno})'
+
+
+class StackSampler:
+    """Bir thread'in yığınını sabit aralıklarla örnekleyen düşük maliyetli profiler"""
+
+    def __init__(self, thread_id=None, interval=None):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval or getattr(settings, 'PROFILER_INTERVAL', 0.002)
+        # Profiler'ı başlatan çerçevenin üstündekiler (sunucu döngüsü vb.) atılır
+        self.skip = 0
+        self.stacks = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='blog-profiler', daemon=True)
+
+    def _run(self):
+        names = {}
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                name = names.get(code)
+                if name is None:
+                    name = names[code] = frame_name(code)
+                stack.append(name)
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[';'.join(stack[self.skip:])] += 1
+            self.samples += 1
+
+    def __enter__(self):
+        frame = sys._getframe(1)
+        while frame.f_back is not None:
+            self.skip += 1
+            frame = frame.f_back
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def collapsed(self):
+        return self.stacks
+
+    def summary(self, limit=40):
+        own, total = Counter(), Counter()
+        for stack, count in self.stacks.items():
+            frames = stack.split(';')
+            own[frames[-1]] += count
+            for name in set(frames):
+                total[name] += count
+        if not self.samples:
+            return 'Örnek alınamadı (istek örnekleme aralığından kısa sürdü).'
+        lines = [f'{self.samples} örnek, {self.interval * 1000:.1f} ms aralık', '', 'Kendi süresi:']
+        lines += [f'{count:6d}  {count / self.samples:6.1%}  {name}' for name, count in own.most_common(limit)]
+        lines += ['', 'Toplam süre:']
+        lines += [f'{count:6d}  {count / self.samples:6.1%}  {name}' for name, count in total.most_common(limit)]
+        return '\n'.join(lines)
+
+
+class CProfiler:
+    """cProfile sarmalayıcı; çağrı grafiğinden collapsed yığın üretir"""
+
+    def __init__(self):
+        self.profile = cProfile.Profile()
+
+    def __enter__(self):
+        self.profile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profile.disable()
+
+    def collapsed(self):
+        # cProfile yığın tutmaz: çağıran -> çağrılan kenarları iki seviyeli
+        # yığın olarak yazılır, değerler mikrosaniye cinsinden kendi süresidir
+        stats = pstats.Stats(self.profile).stats
+        stacks = Counter()
+        for func, (_, _, own_time, _, callers) in stats.items():
+            name = f'{func[2]} ({short_path(func[0])}:{func[1]})'
+            if not callers:
+                stacks[name] += int(own_time * 1e6)
+            for caller, (_, _, caller_own, _) in callers.items():
+                parent = f'{caller[2]} ({short_path(caller[0])}:{caller[1]})'
+                stacks[f'{parent};{name}'] += int(caller_own * 1e6)
+        return +stacks
+
+    def summary(self, limit=40):
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats('cumulative').print_stats(limit)
+        stats.sort_stats('tottime').print_stats(limit)
+        return stream.getvalue()
+
+
+def make_profiler(mode):
+    return CProfiler() if mode == 'cprofile' else StackSampler()
+
+
+def get_root():
+    return Path(getattr(settings, 'PROFILE_ROOT', settings.BASE_DIR / 'profiles'))
+
+
+def write_collapsed(stacks, path, max_bytes):
+    """En ağır yığınlardan başlayarak boyut sınırına kadar yaz"""
+    written = 0
+    with open(path, 'w', encoding='utf-8') as handle:
+        for stack, count in stacks.most_common():
+            line = f'{stack} {count}\n'
+            written += len(line.encode('utf-8'))
+            if written > max_bytes:
+                break
+            handle.write(line)
+
+
+def prune(root, keep):
+    """En eski raporları silip en fazla 'keep' rapor bırak"""
+    reports = sorted(root.glob('*.txt'), key=lambda path: path.stat().st_mtime, reverse=True)
+    for report in reports[keep:]:
+        report.unlink(missing_ok=True)
+        report.with_suffix('.collapsed').unlink(missing_ok=True)
+
+
+def save_report(profiler, request, elapsed_ms):
+    """Raporu diske yaz ve dosya adını (uzantısız) döndür"""
+    root = get_root()
+    root.mkdir(parents=True, exist_ok=True)
+    match = getattr(request, 'resolver_match', None)
+    view = slugify((match.view_name if match else request.path).replace(':', '-')) or 'istek'
+    name = f"{timezone.now():%Y%m%d-%H%M%S}-{view}-{os.getpid()}-{threading.get_ident() % 10000}"
+
+    max_bytes = getattr(settings, 'PROFILER_MAX_BYTES', 1024 * 1024)
+    write_collapsed(profiler.collapsed(), root / f'{name}.collapsed', max_bytes)
+    header = f'{request.method} {request.get_full_path()}\n{elapsed_ms:.1f} ms\n\n'
+    (root / f'{name}.txt').write_text(header + profiler.summary()[:max_bytes], encoding='utf-8')
+    prune(root, getattr(settings, 'PROFILER_MAX_REPORTS', 50))
+    return name
+
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import math
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import JsonResponse
+
+logger = logging.getLogger(__name__)
+
+
+def parse_rate(rate):
+    """'5/m' biçimindeki oranı (istek sayısı, saniye) olarak döndür"""
+    count, _, period = rate.partition('/')
+    seconds = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}[period[:1] or 's']
+    return int(count), seconds
+
+
+def get_client_ip(request):
+    """İstemci IP adresini döndür (proxy arkasında X-Forwarded-For'un son adresi)"""
+    if getattr(settings, 'RATELIMIT_USE_FORWARDED_FOR', False):
+        forwarded = request.META.get('HTTP_X_FORWARDED_FOR', '')
+        if forwarded:
+            return forwarded.split(',')[-1].strip()
+    return request.META.get('REMOTE_ADDR', '')
+
+
+class TokenBucketLimiter:
+    """
+    Önbellekte tutulan token bucket hız sınırlayıcı.
+
+    Her kimliğin kovası en fazla capacity (burst, verilmezse oran) token
+    alır ve ortalama oranla dolar: '3/m' ve burst=2, art arda 2 istek, sonra
+    20 saniyede bir istek demektir. Sabit pencerenin aksine pencere sınırında
+    iki katı istek geçemez.
+
+    Kova durumu (token, zaman) tek bir önbellek değeridir; oku-hesapla-yaz
+    adımları kimlik başına cache.add ile alınan kısa bir kilit altında
+    yapılır, böylece aynı anda gelen istekler birbirinin harcamasını ezemez
+    (Redis ve LocMem'de add atomiktir). Kilit LOCK_WAIT içinde alınamazsa
+    (ör. Redis erişilemiyor) istek geçirilir: sınırlayıcı siteyi
+    durdurmamalı.
+    """
+
+    LOCK_TIMEOUT = 2  # kilidi tutan süreç ölürse en geç bu kadar saniye sonra düşer
+    LOCK_WAIT = 0.2
+    LOCK_POLL = 0.002
+
+    def __init__(self, rate, burst=None, prefix='rl'):
+        count, seconds = parse_rate(rate)
+        self.capacity = burst or count
+        self.rate = count / seconds  # saniyede dolan token
+        self.prefix = prefix
+        # Tamamen dolmuş kova, hiç olmayan kovayla aynıdır
+        self.timeout = math.ceil(self.capacity / self.rate) + 1
+
+    @property
+    def cache(self):
+        # Sayaçlar tüm worker'larda ortak olmalı, yerel LRU katmanını atla
+        return caches[getattr(settings, 'RATELIMIT_CACHE', 'default')]
+
+    def _cache_key(self, identity):
+        digest = hashlib.sha1(identity.encode('utf-8')).hexdigest()
+        return f'{self.prefix}:{digest}'
+
+    def _lock(self, key):
+        deadline = time.monotonic() + self.LOCK_WAIT
+        while not self.cache.add(f'{key}:lock', 1, self.LOCK_TIMEOUT):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.LOCK_POLL)
+        return True
+
+    def _unlock(self, key):
+        self.cache.delete(f'{key}:lock')
+
+    def _available(self, state, now):
+        if state is None:
+            return self.capacity
+        tokens, updated_at = state
+        return min(self.capacity, tokens + max(0.0, now - updated_at) * self.rate)
+
+    def consume(self, *identities, tokens=1):
+        """
+        Her kimliğin kovasından token harca. Biri yetmezse hiçbirinden
+        harcanmaz ve (False, bekleme süresi) döner.
+        """
+        keys = sorted({self._cache_key(identity) for identity in identities})
+        locked = []
+        try:
+            # Kilitler hep aynı sırayla alınır, iki istek birbirini kilitlemez
+            for key in keys:
+                if not self._lock(key):
+                    logger.warning('Hız sınırı kilidi alınamadı, istek sınırlanmadı: %s', key)
+                    return True, 0
+                locked.append(key)
+
+            now = time.time()
+            states = self.cache.get_many(keys)
+            available = {key: self._available(states.get(key), now) for key in keys}
+            missing = max((tokens - value for value in available.values()), default=0)
+            if missing > 0:
+                return False, missing / self.rate
+
+            self.cache.set_many(
+                {key: (value - tokens, now) for key, value in available.items()}, self.timeout,
+            )
+            return True, 0
+        finally:
+            for key in locked:
+                self._unlock(key)
+
+
+def ratelimit(rate, burst=None, keys=('ip',), group=None):
+    """
+    View'ı token bucket ile sınırla.
+
+    keys: 'ip' istemci adresine, 'post:<alan>' ise POST alanına göre
+    ayrı kovalar açar. Önce tüm kovalar kontrol edilir, token yalnızca hepsi
+    izin verirse harcanır; kovalardan biri boşsa 429 döner.
+    """
+    def decorator(view_func):
+        limiter = TokenBucketLimiter(rate, burst, prefix=f'rl:{group or view_func.__name__}')
+
+        @wraps(view_func)
+        def wrapped(request, *args, **kwargs):
+            if not getattr(settings, 'RATELIMIT_ENABLED', True):
+                return view_func(request, *args, **kwargs)
+
+            identities = []
+            for key in keys:
+                if key == 'ip':
+                    identity = get_client_ip(request)
+                elif key.startswith('post:'):
+                    identity = request.POST.get(key[5:], '').strip().lower()
+                else:
+                    raise ValueError(f'Bilinmeyen ratelimit anahtarı: {key}')
+                if identity:
+                    identities.append(f'{key}={identity}')
+
+            allowed, retry_after = limiter.consume(*identities)
+            if not allowed:
+                response = JsonResponse({
+                    'success': False,
+                    'message': 'Çok fazla istek gönderdiniz. Lütfen biraz sonra tekrar deneyin.'
+                }, status=429)
+                response['Retry-After'] = str(math.ceil(retry_after))
+                return response
+
+            return view_func(request, *args, **kwargs)
+        return wrapped
+    return decorator
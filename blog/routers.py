@@ -0,0 +1,102 @@
+import functools
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+
+
+# İstek boyunca okumaların birincil veritabanına gitmesi gerekiyor mu?
+_pinned = ContextVar('blog_db_pinned', default=False)
+
+# Sağlıksız replikalar bu kadar saniye devre dışı kalır
+HEALTH_CHECK_INTERVAL = 30
+
+_replica_health = {}
+
+
+def pin_to_primary(value=True):
+    """Geçerli istek/iş parçacığındaki okumaları birincil veritabanına sabitle"""
+    return _pinned.set(value)
+
+
+def unpin(token):
+    _pinned.reset(token)
+
+
+def is_pinned():
+    return _pinned.get()
+
+
+def primary_reads(func):
+    """
+    Fonksiyonun okumalarını da birincilden yap. Okuyup ardından yazan toplu
+    işler için: replika gecikmesi yüzünden yeni yazılmış satırlar kaçmasın.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = pin_to_primary()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            unpin(token)
+    return wrapper
+
+
+def get_replicas():
+    return getattr(settings, 'DATABASE_REPLICAS', [])
+
+
+def replica_is_healthy(alias):
+    """Replika bağlantısını kontrol et, sonucu bir süre hatırla"""
+    now = time.monotonic()
+    checked_at, healthy = _replica_health.get(alias, (0, True))
+    if now - checked_at < HEALTH_CHECK_INTERVAL:
+        return healthy
+
+    connection = connections[alias]
+    try:
+        if connection.connection is None:
+            connection.ensure_connection()
+        healthy = connection.is_usable()
+    except Exception:
+        healthy = False
+        connection.close()
+    _replica_health[alias] = (now, healthy)
+    return healthy
+
+
+class PrimaryReplicaRouter:
+    """
+    blog uygulamasının okumalarını replikalara, yazmalarını birincil
+    veritabanına yönlendirir. Sabitlenmiş isteklerde (admin oturumu,
+    yeni bir yazma sonrası) okumalar da birincilden yapılır.
+    """
+
+    app_labels = {'blog'}
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label not in self.app_labels or is_pinned():
+            return None
+        replicas = [alias for alias in get_replicas() if replica_is_healthy(alias)]
+        if not replicas:
+            return 'default'
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        if model._meta.app_label in self.app_labels:
+            return 'default'
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replikalar birincilin kopyası, aralarındaki ilişkiler geçerli
+        databases = {'default', *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db in get_replicas():
+            return False
+        return None
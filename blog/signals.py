@@ -0,0 +1,44 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_content_version
+from .http_cache import CHROME_KEY, article_keys, purge
+from .pdf import remove_article_pdfs
+from .models import Article, Category, CookieConsent, HomepageSEO, TrendingArticle
+from .prerender import invalidate_all, invalidate_article
+
+
+@receiver([post_save, post_delete], sender=Article)
+def invalidate_article_caches(sender, instance, **kwargs):
+    """Makale değişince makalelerden türetilen önbellekleri temizle"""
+    from .views import TAG_CLOUD_CACHE_KEY
+
+    # Yalnızca görüntülenme sayacı güncellendiyse etiketler değişmez
+    update_fields = kwargs.get('update_fields')
+    if update_fields and set(update_fields) <= {'view_count'}:
+        return
+    cache.delete(TAG_CLOUD_CACHE_KEY)
+    bump_content_version('articles')
+    # Yayından kalkan makale trend kutularından da çıksın
+    if not instance.is_published or kwargs['signal'] is post_delete:
+        TrendingArticle.objects.filter(article_id=instance.pk).delete()
+        bump_content_version('trending')
+    invalidate_article(instance)
+    purge(*article_keys(instance))
+
+
+@receiver(post_delete, sender=Article)
+def remove_deleted_article_pdfs(sender, instance, **kwargs):
+    """Silinen makalenin PDF çıktılarını kaldır"""
+    remove_article_pdfs(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Category)
+@receiver([post_save, post_delete], sender=CookieConsent)
+@receiver([post_save, post_delete], sender=HomepageSEO)
+def invalidate_chrome_fragments(sender, instance, **kwargs):
+    """Navbar, footer ve kenar çubuklarının önbelleğini geçersiz kıl"""
+    bump_content_version('chrome')
+    invalidate_all()
+    purge(CHROME_KEY)
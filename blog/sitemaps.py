@@ -1,15 +1,34 @@
 from django.contrib.sitemaps import Sitemap
 from django.urls import reverse
+from .language import url_routing
 from .models import Article, Category
 
 
-class ArticleSitemap(Sitemap):
+class LocalizedSitemap(Sitemap):
+    """
+    Dil URL önekliyken (I18N_URLS) her sayfa her dilde, hreflang
+    alternatifleriyle listelenir; location() etkin dile göre reverse eder.
+    """
+    alternates = True
+    x_default = True
+
+    @property
+    def i18n(self):
+        return url_routing()
+
+
+class ArticleSitemap(LocalizedSitemap):
     """Makale sitemap'i"""
     changefreq = "weekly"
     priority = 0.9
     
     def items(self):
-        return Article.objects.filter(is_published=True, noindex=False).order_by('-published_date')
+        # Tüm arşiv listelenir; yalnızca URL ve lastmod için gereken alanlar okunur
+        return (
+            Article.objects.filter(is_published=True, noindex=False)
+            .only('slug', 'updated_at')
+            .order_by('-published_date')
+        )
     
     def lastmod(self, obj):
         return obj.updated_at
@@ -18,7 +37,7 @@ class ArticleSitemap(Sitemap):
         return obj.get_absolute_url()
 
 
-class CategorySitemap(Sitemap):
+class CategorySitemap(LocalizedSitemap):
     """Kategori sitemap'i"""
     changefreq = "weekly"
     priority = 0.7
@@ -30,7 +49,7 @@ class CategorySitemap(Sitemap):
         return reverse('blog:category_detail', args=[obj.slug])
 
 
-class StaticViewSitemap(Sitemap):
+class StaticViewSitemap(LocalizedSitemap):
     """Statik sayfalar sitemap'i"""
     priority = 0.5
     changefreq = 'monthly'
@@ -0,0 +1,35 @@
+from django import template
+
+from ..analytics import trending_articles
+from ..cache import get_content_version
+from ..highlight import highlight_code
+
+register = template.Library()
+
+
+@register.simple_tag
+def content_version(*scopes):
+    """{% cache %} anahtarına eklenecek içerik sürümü"""
+    return get_content_version(*(scopes or ('chrome',)))
+
+
+@register.filter
+def highlight(code, language=''):
+    """Kod bloğunu sunucuda renklendir"""
+    return highlight_code(code, language)
+
+
+@register.filter
+def page_window(page_obj, on_each_side=2):
+    """Geçerli sayfanın çevresindeki sayfa numaraları (tüm sayfaları dolaşmadan)"""
+    on_each_side = int(on_each_side)
+    first = max(1, page_obj.number - on_each_side)
+    last = min(page_obj.paginator.num_pages, page_obj.number + on_each_side)
+    return range(first, last + 1)
+
+
+@register.inclusion_tag('blog/includes/trending.html', takes_context=True)
+def trending_widget(context, category_id=None):
+    """Trend makaleler kutusu (kategori verilmezse tüm site)"""
+    language = context.get('LANGUAGE_CODE', 'tr')
+    return {'articles': trending_articles(language, category_id), 'language': language}
@@ -1,3 +1,1670 @@
-from django.test import TestCase
+import gc
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache, caches
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models import Count
+from django.http import Http404, HttpResponse
+from django.test import AsyncRequestFactory, Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.template import engines
+from django.urls import get_resolver, reverse
+from django.utils import timezone, translation
+
+from . import analytics, async_views, benchmark, http_cache, index_audit, profiling, views
+from .analytics import ViewCounter, compact, compute_trending, get_view_counter, trending_articles
+from .cache import TwoTierCache
+from .exports import format_value, iter_csv_rows
+from .highlight import highlight_code
+from .instrumentation import LatencyHistogram, view_stats
+from .language import LANGUAGE_COOKIE, language_cookie_value, language_path
+from .markdown_import import import_markdown, parse_blocks
+from .middleware import ReplicaPinningMiddleware
+from .models import (
+    Article, ArticleImage, ArticleParagraph, ArticleViewBucket, Category, ContactMessage,
+    CookieConsent, HomepageSEO, NewsletterSubscriber, TrendingArticle,
+)
+from .paginator import EstimatedCountPaginator
+from .pdf import PDFUnavailable, get_article_pdf, print_items, url_fetcher
+from .prerender import file_for
+from .ratelimit import TokenBucketLimiter
+from .routers import PrimaryReplicaRouter, is_pinned, pin_to_primary, unpin
+from .thumbnails import thumbnail_url
+from .warmup import WARMUP_HEADER, compile_templates, resolve_urls
+
+
+def create_content(categories=4, articles_per_category=6, paragraphs=12, images=3, start=0):
+    """Gerçekçi boyutta test içeriği oluştur (iki dilli makaleler, paragraflar, görseller)"""
+    now = timezone.now()
+    category_objs = Category.objects.bulk_create([
+        Category(name=f'Kategori {start + index}', slug=f'kategori-{start + index}', order=index)
+        for index in range(categories)
+    ])
+    articles = []
+    for category in category_objs:
+        for index in range(articles_per_category):
+            number = len(articles) + start * 1000
+            articles.append(Article(
+                title=f'Yapay zeka yazısı {number}',
+                title_en=f'AI article {number}',
+                slug=f'yazi-{number}',
+                category=category,
+                excerpt='Prompt mühendisliği ve üretken modeller üzerine bir yazı. ' * 2,
+                excerpt_en='An article about prompt engineering and generative models. ' * 2,
+                author_name='EdebAi',
+                is_published=index != 0,
+                is_featured=index == 1,
+                published_date=now - timezone.timedelta(days=number),
+                meta_description='Yapay zeka ve edebiyat üzerine.',
+                meta_keywords='yapay zeka, prompt, edebiyat',
+                meta_keywords_en='ai, prompt, literature',
+            ))
+    articles = Article.objects.bulk_create(articles)
+
+    paragraph_objs = ArticleParagraph.objects.bulk_create([
+        ArticleParagraph(
+            article=article,
+            order=order,
+            paragraph_type='heading' if order % 5 == 0 else ('code' if order % 7 == 0 else 'text'),
+            heading_text=f'Başlık {order}',
+            content=f'Paragraf {order} içeriği.',
+            content_en=f'Paragraph {order} content.',
+            code_language='python',
+        )
+        for article in articles for order in range(paragraphs)
+    ])
+    first_paragraph = {}
+    for paragraph in paragraph_objs:
+        first_paragraph.setdefault(paragraph.article_id, paragraph)
+    ArticleImage.objects.bulk_create([
+        ArticleImage(
+            article=article,
+            image=f'articles/content_images/test-{article.pk}-{order}.png',
+            alt_text='görsel',
+            order=order,
+            after_paragraph=first_paragraph[article.pk] if order == 0 else None,
+        )
+        for article in articles for order in range(images)
+    ])
+    NewsletterSubscriber.objects.bulk_create([
+        NewsletterSubscriber(email=f'okur{start}-{index}@example.com') for index in range(20)
+    ])
+    ContactMessage.objects.bulk_create([
+        ContactMessage(name='Okur', email='okur@example.com', message='Merhaba ' * 30) for _ in range(20)
+    ])
+    return articles
+
+
+class QueryBudgetMixin:
+    """Sayfa başına sorgu bütçesi ve veri büyüdükçe sabit kalma kontrolleri"""
+
+    def tearDown(self):
+        # Bekleyen görüntülenmeler test transaction'ı içinde yazılsın
+        get_view_counter().flush()
+        super().tearDown()
+
+    def count_queries(self, url):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return len(queries)
+
+    def assertQueryBudget(self, url, budget):
+        count = self.count_queries(url)
+        self.assertLessEqual(count, budget, f'{url}: {count} sorgu (bütçe {budget})')
+
+    def assertConstantQueries(self, urls):
+        """Veri miktarı artınca sorgu sayısı değişmemeli"""
+        # Süreç içi önbellekler (Site, ContentType) ölçüme karışmasın
+        for url in urls:
+            self.client.get(url)
+        before = {url: self.count_queries(url) for url in urls}
+        create_content(categories=3, articles_per_category=9, paragraphs=30, images=6, start=50)
+        after = {url: self.count_queries(url) for url in urls}
+        self.assertEqual(before, after)
+
+
+@override_settings(PRERENDER_ROOT=None)
+class PublicPageTestCase(TestCase):
+    """
+    Sayfa testlerinin ortak kurulumu: önceden render edilmiş dosyalar
+    kapalı, her test boş önbellekle başlar, istekler önbellek ısıtma
+    başlığıyla gelip görüntülenme saymaz, PDF kilitleri geçici klasöre
+    yazılır. İçerik miktarı content ile (create_content argümanları) seçilir.
+    """
+
+    content = {'categories': 1, 'articles_per_category': 3, 'paragraphs': 2, 'images': 0}
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.enterClassContext(override_settings(PDF_ROOT=cls.enterClassContext(tempfile.TemporaryDirectory())))
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(**cls.content)
+        cls.article = Article.objects.filter(is_published=True).order_by('-published_date').first()
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(headers={WARMUP_HEADER: '1'})
+
+
+@override_settings(PRERENDER_ROOT=None)
+class PublicViewQueryTests(QueryBudgetMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.articles = create_content()
+        cls.article = Article.objects.filter(is_published=True).first()
+        cls.category = cls.article.category
+        HomepageSEO.objects.create(meta_title='EdebAi', meta_description='Yapay zeka', is_active=True)
+        CookieConsent.objects.create(is_active=True)
+
+    def urls(self):
+        return {
+            'home': reverse('blog:home'),
+            'blog_list': reverse('blog:blog_list'),
+            'blog_list_page': reverse('blog:blog_list') + '?page=2',
+            'category_list': reverse('blog:category_list'),
+            'category_detail': reverse('blog:category_detail', args=[self.category.slug]),
+            'article_detail': reverse('blog:article_detail', args=[self.article.slug]),
+            'search': reverse('blog:search') + '?q=yapay',
+            'sitemap': '/sitemap.xml',
+        }
+
+    def test_home(self):
+        self.assertQueryBudget(self.urls()['home'], 4)
+
+    def test_blog_list(self):
+        # Kenar çubuğundaki trend widget'ı tek sorgu ekler
+        self.assertQueryBudget(self.urls()['blog_list'], 6)
+
+    def test_category_list(self):
+        self.assertQueryBudget(self.urls()['category_list'], 3)
+
+    def test_category_detail(self):
+        self.assertQueryBudget(self.urls()['category_detail'], 4)
+
+    def test_article_detail(self):
+        self.assertQueryBudget(self.urls()['article_detail'], 6)
+
+    def test_search(self):
+        self.assertQueryBudget(self.urls()['search'], 4)
+
+    def test_sitemap(self):
+        self.assertQueryBudget(self.urls()['sitemap'], 3)
+
+    def test_cached_fragments_skip_queries(self):
+        url = self.urls()['blog_list']
+        cold = self.count_queries(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertLess(len(queries), cold)
+
+    def test_queries_do_not_grow_with_data(self):
+        self.assertConstantQueries(list(self.urls().values()))
+
+
+@override_settings(PRERENDER_ROOT=None)
+class AdminQueryTests(QueryBudgetMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content()
+        cls.user = User.objects.create_superuser('admin', 'admin@example.com', 'parola')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def urls(self):
+        article = Article.objects.first()
+        return {
+            'article': reverse('admin:blog_article_changelist'),
+            'article_change': reverse('admin:blog_article_change', args=[article.pk]),
+            'category': reverse('admin:blog_category_changelist'),
+            'subscriber': reverse('admin:blog_newslettersubscriber_changelist'),
+            'message': reverse('admin:blog_contactmessage_changelist'),
+        }
+
+    def test_article_changelist(self):
+        self.assertQueryBudget(self.urls()['article'], 9)
+
+    def test_article_change_form(self):
+        self.assertQueryBudget(self.urls()['article_change'], 10)
+
+    def test_category_changelist(self):
+        self.assertQueryBudget(self.urls()['category'], 6)
+
+    def test_subscriber_changelist(self):
+        self.assertQueryBudget(self.urls()['subscriber'], 7)
+
+    def test_message_changelist(self):
+        self.assertQueryBudget(self.urls()['message'], 7)
+
+    def test_queries_do_not_grow_with_data(self):
+        self.assertConstantQueries(list(self.urls().values()))
+
+
+class BenchmarkDatasetTests(TestCase):
+
+    def test_generate_and_collect_urls(self):
+        counts = benchmark.generate(
+            categories=3, articles=30, paragraphs=4, images=1, subscribers=50, messages=10, batch_size=7,
+        )
+        self.assertEqual(counts['paragraphs'], 120)
+        self.assertEqual(Article.objects.filter(slug__startswith=benchmark.BENCH_PREFIX).count(), 30)
+        self.assertTrue(Article.objects.exclude(title_en='').exists())
+
+        urls, skipped = benchmark.collect_urls()
+        names = {name.split('?')[0] for name, _ in urls}
+        self.assertIn('article_detail', names)
+        self.assertIn('category_detail', names)
+        self.assertIn('newsletter_subscribe', skipped)
+
+        benchmark.clear()
+        self.assertFalse(Article.objects.filter(slug__startswith=benchmark.BENCH_PREFIX).exists())
+        self.assertFalse(NewsletterSubscriber.objects.filter(email__startswith=benchmark.BENCH_PREFIX).exists())
+
+    def test_generate_without_bulk_insert_pks(self):
+        # MySQL'de olduğu gibi bulk_create nesnelere pk yazmasın
+        with mock.patch.object(type(connection.features), 'can_return_rows_from_bulk_insert', False):
+            benchmark.generate(
+                categories=2, articles=12, paragraphs=3, images=1, subscribers=0, messages=0, batch_size=5,
+            )
+        articles = Article.objects.filter(slug__startswith=benchmark.BENCH_PREFIX)
+        self.assertFalse(articles.filter(category=None).exists())
+        counts = articles.annotate(
+            paragraph_count=Count('paragraphs', distinct=True), image_count=Count('images', distinct=True),
+        ).values_list('paragraph_count', 'image_count')
+        self.assertEqual(set(counts), {(3, 1)})
+
+        # Mevcut kategoriler içinde büyütme
+        benchmark.generate(categories=0, articles=4, paragraphs=1, images=0, subscribers=0, messages=0, start=12)
+        self.assertEqual(articles.count(), 16)
+        self.assertFalse(articles.filter(category=None).exists())
+
+
+def measure_memory(func):
+    """func'ı tracemalloc altında çalıştır; (tepe, kalıcı) bayt döndür"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        func()
+        # Önbelleğe yazılanlar kalıcı bellek sayılmasın
+        cache.clear()
+        gc.collect()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before, current - before
+
+
+class MemoryBudgetMixin:
+    """Tepe ve kalıcı bellek bütçeleri; tepe sayfa boyutuyla ölçeklenmeli, arşivle değil"""
+
+    # Arşiv büyütülürken eklenen makale sayısı
+    growth_articles = 540
+
+    def tearDown(self):
+        get_view_counter().flush()
+        super().tearDown()
+
+    def memory(self, func):
+        # Şablon derleme ve süreç içi önbellekler ölçüme karışmasın
+        func()
+        cache.clear()
+        return measure_memory(func)
+
+    def assertMemoryBudget(self, label, func, peak_kb, retained_kb):
+        peak, retained = self.memory(func)
+        self.assertLessEqual(peak, peak_kb * 1024, f'{label}: tepe {peak // 1024} KB (bütçe {peak_kb} KB)')
+        self.assertLessEqual(
+            retained, retained_kb * 1024, f'{label}: kalıcı {retained // 1024} KB (bütçe {retained_kb} KB)'
+        )
+
+    def grow_archive(self):
+        benchmark.generate(
+            categories=0, articles=self.growth_articles, paragraphs=6, images=1,
+            subscribers=3000, messages=500, start=10000,
+        )
+
+    def assertPeakIndependentOfArchive(self, cases):
+        """
+        cases: {ad: (func, makale başına izin verilen bayt)}. Sitemap gibi tüm
+        arşivi listeleyen çıktılar için makale başına pay verilir; diğerleri 0.
+        """
+        before = {label: self.memory(func)[0] for label, (func, _) in cases.items()}
+        self.grow_archive()
+        for label, (func, per_article) in cases.items():
+            after = self.memory(func)[0]
+            allowed = before[label] * 1.10 + 16 * 1024 + per_article * self.growth_articles
+            self.assertLessEqual(
+                after, allowed,
+                f'{label}: tepe {before[label] // 1024} KB -> {after // 1024} KB '
+                f'({self.growth_articles} makale eklenince)',
+            )
+
+
+# tracemalloc istekleri yavaşlatır; yavaş istek log'u test çıktısına karışmasın
+@override_settings(PRERENDER_ROOT=None, SLOW_REQUEST_MS=60000)
+class MemoryBudgetTests(MemoryBudgetMixin, TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        benchmark.generate(
+            categories=4, articles=60, paragraphs=12, images=2, subscribers=300, messages=100,
+        )
+        # Sayfalar baştan dolu olsun; büyüme yalnızca arşivden gelsin
+        featured = Article.objects.filter(is_published=True).order_by('-published_date')[:3]
+        Article.objects.filter(pk__in=list(featured.values_list('pk', flat=True))).update(is_featured=True)
+        HomepageSEO.objects.create(meta_title='EdebAi', meta_description='Yapay zeka', is_active=True)
+        CookieConsent.objects.create(is_active=True)
+        # update_analytics için iki aylık gün kovaları
+        today = timezone.localdate()
+        ArticleViewBucket.objects.bulk_create([
+            ArticleViewBucket(
+                article_id=pk, language='tr', period=ArticleViewBucket.PERIOD_DAY,
+                start=today - timezone.timedelta(days=days_ago), views=days_ago + 1,
+            )
+            for pk in Article.objects.values_list('pk', flat=True) for days_ago in range(60)
+        ])
+
+    def setUp(self):
+        # export_site PRERENDER_ROOT yerine --output ile yazar; ölçülen
+        # sayfalar yine view'lardan gelir
+        self.export_root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        # Makale görüntülenmeleri test boyunca tamponda kalsın; zamanlayıcı
+        # thread'i ölçüm sürerken test veritabanına yazmaya çalışmasın
+        self.enterContext(mock.patch.object(get_view_counter(), 'flush_interval', 3600))
+        self.addCleanup(get_view_counter().flush)
+
+    def get(self, url):
+        return lambda: self.assertEqual(self.client.get(url).status_code, 200, url)
+
+    def view_cases(self):
+        article = Article.objects.filter(is_published=True).order_by('-published_date').first()
+        return {
+            'home': reverse('blog:home'),
+            'blog_list': reverse('blog:blog_list'),
+            'blog_list_page': reverse('blog:blog_list') + '?page=3',
+            'category_list': reverse('blog:category_list'),
+            'category_detail': reverse('blog:category_detail', args=[article.category.slug]),
+            'article_detail': reverse('blog:article_detail', args=[article.slug]),
+            'search': reverse('blog:search') + '?q=yapay',
+            'about': reverse('blog:about'),
+        }
+
+    def export_subscribers(self):
+        for _ in iter_csv_rows(NewsletterSubscriber.objects.order_by('pk'), ['email', 'is_active'], chunk_size=200):
+            pass
+
+    def command(self, name, *args):
+        return lambda: call_command(name, *args, stdout=io.StringIO(), stderr=io.StringIO())
+
+    def export_site(self):
+        """Tüm sitenin gerçek export'u, her seferinde boş klasöre"""
+        with tempfile.TemporaryDirectory() as root:
+            call_command('export_site', '--output', root, stdout=io.StringIO())
+
+    def export_changes(self):
+        """Zamanlanmış artımlı export: bir makale değişti, etkilediği sayfalar yazılır"""
+        Article.objects.filter(pk=self.changed_pk).update(updated_at=timezone.now())
+        call_command('export_site', '--output', str(self.export_root), stdout=io.StringIO())
+
+    def grow_archive(self):
+        super().grow_archive()
+        # Yeni makalelerin sayfaları zaten yazılmış olsun (render etmeden);
+        # ölçülen artımlı export yalnızca değişen makaleyi yazar
+        def write_placeholder(client, url_path, language, root):
+            target = file_for(url_path, language, root)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_text('')
+            return 200
+
+        with mock.patch('blog.management.commands.export_site.render_page', side_effect=write_placeholder):
+            self.export_changes()
+        # Büyüyen manifest ilk gerçek export'ta bir kez kurulur; ölçüme karışmasın
+        self.export_changes()
+
+    def test_view_budgets(self):
+        # (tepe KB, kalıcı KB); ölçülen değerlerin yaklaşık iki katı
+        budgets = {
+            'home': (400, 200),
+            'blog_list': (800, 250),
+            'blog_list_page': (800, 250),
+            'category_list': (800, 250),
+            'category_detail': (600, 250),
+            'article_detail': (800, 250),
+            'search': (600, 250),
+            'about': (300, 100),
+        }
+        for label, url in self.view_cases().items():
+            with self.subTest(label):
+                self.assertMemoryBudget(label, self.get(url), *budgets[label])
+
+    def test_command_budgets(self):
+        # (tepe KB, kalıcı KB); ölçülen değerlerin yaklaşık iki katı
+        self.assertMemoryBudget('csv_export', self.export_subscribers, 300, 50)
+        self.assertMemoryBudget('export_site', self.export_site, 3500, 400)
+        self.assertMemoryBudget('warm_cache', self.command('warm_cache', '--limit', '5', '--concurrency', '1'), 3600, 150)
+        self.assertMemoryBudget('update_analytics', self.command('update_analytics'), 400, 50)
+        self.assertMemoryBudget('index_audit', self.command('index_audit'), 2500, 700)
+
+    def test_peak_does_not_grow_with_archive(self):
+        cases = {label: (self.get(url), 0) for label, url in self.view_cases().items()}
+        # Sitemap tüm arşivi listeler; makale başına sabit pay verilir (iki dil
+        # ve her URL için hreflang alternatifleri)
+        cases['sitemap'] = (self.get('/sitemap.xml'), 8192)
+        cases['csv_export'] = (self.export_subscribers, 0)
+        # Eski ve yeni manifesto ile URL listesi tüm makaleleri içerir
+        # (makale başına ~1,2 KB ölçüldü)
+        self.changed_pk = Article.objects.filter(is_published=True).order_by('pk').values_list('pk', flat=True)[0]
+        self.export_changes()
+        cases['export_site'] = (self.export_changes, 1536)
+        # URL listesi sitemap'teki tüm makalelerden kurulur, --limit sonra
+        # uygulanır (makale başına ~1,2 KB ölçüldü)
+        cases['warm_cache'] = (self.command('warm_cache', '--limit', '5', '--concurrency', '1'), 1536)
+        self.assertPeakIndependentOfArchive(cases)
+
+
+class ViewAnalyticsTests(PublicPageTestCase):
+
+    content = {'categories': 2, 'articles_per_category': 4, 'paragraphs': 2, 'images': 0}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.articles = list(Article.objects.filter(is_published=True).order_by('pk'))
+        cls.today = timezone.localdate()
+
+    def bucket(self, article, days_ago, views, language='tr', period=ArticleViewBucket.PERIOD_DAY):
+        return ArticleViewBucket.objects.create(
+            article=article, language=language, period=period,
+            start=self.today - timezone.timedelta(days=days_ago), views=views,
+        )
+
+    def test_views_are_written_in_batches(self):
+        article = self.articles[0]
+        counter = ViewCounter(batch_size=1000, flush_interval=60)
+        for _ in range(30):
+            counter.add(article.pk, 'tr')
+        counter.add(article.pk, 'en')
+        counter.add(self.articles[1].pk, 'tr')
+        self.assertFalse(ArticleViewBucket.objects.exists())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(counter.flush(), 32)
+        writes = [query for query in queries if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))]
+        self.assertLessEqual(len(writes), 4)
+
+        counter.add(article.pk, 'tr')
+        counter.flush()
+        self.assertEqual(ArticleViewBucket.objects.get(article=article, language='tr').views, 31)
+        self.assertEqual(ArticleViewBucket.objects.get(article=article, language='en').views, 1)
+        article.refresh_from_db()
+        self.assertEqual(article.view_count, 32)
+
+    def test_article_detail_does_not_write_per_request(self):
+        url = reverse('blog:article_detail', args=[self.articles[0].slug])
+        # Ziyaretçi istekleri görüntülenme sayar
+        self.client = Client()
+        self.client.get(url)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertFalse([query for query in queries if 'UPDATE' in query['sql']])
+        get_view_counter().flush()
+        self.assertEqual(ArticleViewBucket.objects.get(article=self.articles[0]).views, 2)
+
+    def test_compact_rolls_old_buckets_up(self):
+        article = self.articles[0]
+        for days_ago in range(0, 400, 3):
+            self.bucket(article, days_ago, 2)
+        total = 2 * len(range(0, 400, 3))
+
+        moved = compact(self.today)
+        self.assertGreater(moved['days'], 0)
+        self.assertGreater(moved['weeks'], 0)
+        buckets = ArticleViewBucket.objects.filter(article=article)
+        self.assertEqual(sum(buckets.values_list('views', flat=True)), total)
+        self.assertFalse(buckets.filter(
+            period=ArticleViewBucket.PERIOD_DAY, start__lt=self.today - timezone.timedelta(days=42),
+        ).exists())
+        self.assertTrue(buckets.filter(period=ArticleViewBucket.PERIOD_MONTH).exists())
+        self.assertFalse(buckets.filter(period=ArticleViewBucket.PERIOD_MONTH).exclude(start__day=1).exists())
+        # Tekrar çalıştırmak toplamı değiştirmez
+        compact(self.today)
+        self.assertEqual(sum(buckets.values_list('views', flat=True)), total)
+
+    def test_trending_is_decayed_and_grouped(self):
+        old_hit, fresh, english = self.articles[0], self.articles[1], self.articles[2]
+        self.bucket(old_hit, 10, 500)
+        self.bucket(fresh, 0, 60)
+        self.bucket(fresh, 1, 40)
+        self.bucket(english, 0, 30, language='en')
+
+        compute_trending(self.today, window_days=14, half_life_days=2, size=5)
+        with CaptureQueriesContext(connection) as queries:
+            sitewide = trending_articles('tr')
+        self.assertEqual(len(queries), 1)
+        self.assertEqual(sitewide, [fresh, old_hit])
+        self.assertEqual(trending_articles('en'), [english])
+        self.assertEqual(trending_articles('tr', fresh.category_id)[0], fresh)
+        self.assertEqual(
+            TrendingArticle.objects.filter(category=None, language='tr').count(), 2
+        )
+
+    def test_sidebar_shows_trending(self):
+        self.bucket(self.articles[3], 0, 10)
+        compute_trending(self.today)
+        response = self.client.get(reverse('blog:blog_list'))
+        self.assertContains(response, reverse('blog:article_detail', args=[self.articles[3].slug]))
+        self.assertContains(response, 'Gündemde')
+
+    def test_sidebar_trending_follows_language(self):
+        article = self.articles[3]
+        self.bucket(article, 0, 10)
+        self.bucket(article, 0, 10, language='en')
+        compute_trending(self.today)
+        turkish = self.client.get('/blog/')
+        english = self.client.get('/en/blog/')
+        self.assertContains(turkish, 'Gündemde')
+        self.assertContains(turkish, f'<span>{article.title}</span>')
+        self.assertContains(english, 'Trending')
+        self.assertContains(english, f'<span>{article.title_en}</span>')
+        self.assertNotContains(english, 'Gündemde')
+
+    def test_unpublished_articles_leave_trending(self):
+        hidden, shown = self.articles[0], self.articles[1]
+        self.bucket(hidden, 0, 50)
+        self.bucket(shown, 0, 10)
+        compute_trending(self.today)
+        detail = reverse('blog:article_detail', args=[shown.slug])
+        self.assertContains(self.client.get(detail), f'<span>{hidden.title}</span>')
+
+        # Hesaplamayla yarışan yayından kaldırma (sinyalsiz) de gösterilmez
+        Article.objects.filter(pk=hidden.pk).update(is_published=False)
+        self.assertEqual(trending_articles('tr'), [shown])
+
+        hidden.is_published = False
+        hidden.save()
+        self.assertFalse(TrendingArticle.objects.filter(article=hidden).exists())
+        self.assertNotContains(self.client.get(detail), f'<span>{hidden.title}</span>')
+
+    def test_batch_jobs_read_from_primary(self):
+        article = self.articles[0]
+        self.bucket(article, 100, 5)
+        counter = ViewCounter(batch_size=1000, flush_interval=60)
+        counter.add(article.pk, 'tr')
+        # 'replica' tanımlı bir bağlantı değil; replikaya giden okuma hata verir
+        with override_settings(DATABASE_REPLICAS=['replica']), \
+                mock.patch('blog.routers.replica_is_healthy', return_value=True):
+            self.assertEqual(counter.flush(), 1)
+            compact(self.today)
+            compute_trending(self.today)
+        buckets = ArticleViewBucket.objects.filter(article=article)
+        self.assertEqual(sum(buckets.values_list('views', flat=True)), 6)
+        self.assertFalse(buckets.filter(period=ArticleViewBucket.PERIOD_DAY, views=5).exists())
+        self.assertTrue(TrendingArticle.objects.filter(article=article).exists())
+
+    def test_failed_flush_keeps_counts(self):
+        article = self.articles[0]
+        counter = ViewCounter(batch_size=1000, flush_interval=60)
+        for _ in range(3):
+            counter.add(article.pk, 'tr')
+        write_buckets = analytics.add_to_buckets
+
+        def fail_after_buckets(period, counts):
+            write_buckets(period, counts)
+            raise DatabaseError('disk dolu')
+
+        with mock.patch('blog.analytics.add_to_buckets', side_effect=fail_after_buckets), \
+                self.assertLogs('blog.writebuffer', 'ERROR'):
+            self.assertEqual(counter.flush(), 0)
+        # Yarım kalan yazma geri alındı, sayılar bellekte duruyor
+        self.assertFalse(ArticleViewBucket.objects.exists())
+
+        counter.add(article.pk, 'tr')
+        self.assertEqual(counter.flush(), 4)
+        self.assertEqual(ArticleViewBucket.objects.get(article=article).views, 4)
+        article.refresh_from_db()
+        self.assertEqual(article.view_count, 4)
+
+
+class ArticleCardTests(PublicPageTestCase):
+
+    content = {'categories': 2, 'articles_per_category': 4, 'paragraphs': 2, 'images': 0}
+
+    def card_queries(self, url, language='tr'):
+        url = language_path(url, language)
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        # Kart listeleri yayın tarihine göre sıralanır (etiket bulutu gibi sorgular hariç)
+        return response, [
+            query['sql'].split(' FROM ')[0] for query in queries
+            if 'FROM "blog_article"' in query['sql'] and '"published_date" DESC' in query['sql']
+        ]
+
+    def test_listings_select_only_card_columns(self):
+        for url in (
+            reverse('blog:home'),
+            reverse('blog:blog_list'),
+            reverse('blog:category_detail', args=[self.article.category.slug]),
+            reverse('blog:search') + '?q=yapay',
+        ):
+            _, queries = self.card_queries(url)
+            self.assertTrue(queries, url)
+            for sql in queries:
+                self.assertNotIn('"author_bio"', sql, url)
+                self.assertNotIn('"meta_keywords"', sql, url)
+                self.assertNotIn('"title_en"', sql, url)
+
+    def test_english_cards(self):
+        response, queries = self.card_queries(reverse('blog:blog_list'), language='en')
+        self.assertContains(response, self.article.title_en)
+        self.assertNotContains(response, self.article.title)
+        self.assertTrue(any('"title_en"' in sql for sql in queries))
+
+    def test_card_object(self):
+        card = Article.objects.filter(pk=self.article.pk).cards('en').get()
+        self.assertEqual(card.title, self.article.title_en)
+        self.assertEqual(card.get_absolute_url(), self.article.get_absolute_url())
+        self.assertIsNone(card.thumbnail)
+        self.assertFalse(hasattr(card, '__dict__'))
+        # İngilizcesi boş alanlar Türkçeye döner
+        Article.objects.filter(pk=self.article.pk).update(excerpt_en='')
+        card = Article.objects.filter(pk=self.article.pk).cards('en').get()
+        self.assertEqual(card.excerpt, self.article.excerpt)
+
+
+class QueryPlanTests(PublicPageTestCase):
+
+    content = {'categories': 3, 'articles_per_category': 6, 'paragraphs': 4, 'images': 2}
+
+    def plans(self, url):
+        cache.clear()
+        status, queries = index_audit.audit_url(self.client, url)
+        self.assertEqual(status, 200, url)
+        return queries
+
+    def assertUsesIndex(self, url, table, index):
+        queries = [query for query in self.plans(url) if f'FROM "{table}"' in query['sql']]
+        self.assertTrue(
+            any(f'USING INDEX {index}' in detail for query in queries for detail in query['plan']),
+            f'{url}: {index} kullanılmadı',
+        )
+        for query in queries:
+            self.assertEqual(query['problems'], [], query['plan'])
+
+    def test_public_pages_have_no_plan_problems(self):
+        report, _ = index_audit.audit(self.client)
+        problems = {
+            name: query['problems']
+            for name, page in report.items() for query in page['queries'] if query['problems']
+        }
+        self.assertEqual(problems, {})
+
+    def test_listing_indexes(self):
+        self.assertUsesIndex(reverse('blog:home'), 'blog_article', 'blog_article_featured_idx')
+        self.assertUsesIndex(reverse('blog:blog_list'), 'blog_article', 'blog_article_published_idx')
+        self.assertUsesIndex(
+            reverse('blog:category_detail', args=[self.article.category.slug]),
+            'blog_article', 'blog_article_category_pub_idx',
+        )
+        self.assertUsesIndex(reverse('blog:category_list'), 'blog_article', 'blog_article_category_pub_idx')
+
+    def test_article_detail_indexes(self):
+        url = reverse('blog:article_detail', args=[self.article.slug])
+        self.assertUsesIndex(url, 'blog_articleparagraph', 'blog_paragraph_order_idx')
+        self.assertUsesIndex(url, 'blog_articleimage', 'blog_image_order_idx')
+
+    def test_plan_problems(self):
+        self.assertEqual(
+            index_audit.plan_problems(['SCAN blog_article', 'USE TEMP B-TREE FOR ORDER BY']),
+            ['tam tarama: blog_article', 'geçici B-tree: ORDER BY'],
+        )
+        # Tüm satırları okuyan sorguda tarama beklenir; küçük tablolar yok sayılır
+        self.assertEqual(index_audit.plan_problems(['SCAN blog_article'], limited=False), [])
+        self.assertEqual(index_audit.plan_problems(['SCAN blog_category', 'USE TEMP B-TREE FOR ORDER BY']), [])
+        self.assertEqual(
+            index_audit.plan_problems(['SCAN blog_article USING INDEX blog_article_published_idx']), []
+        )
+
+
+@override_settings(I18N_URLS=False)
+class LanguageResolutionTests(PublicPageTestCase):
+
+    def test_anonymous_requests_do_not_touch_sessions(self):
+        # Dil seçimi oturum açmaz; sonraki istekler oturum tablosuna gitmez
+        response = self.client.get(reverse('blog:set_language', args=['en']))
+        self.assertFalse(response.wsgi_request.session.accessed)
+        for url in (
+            reverse('blog:home'), reverse('blog:blog_list'),
+            reverse('blog:article_detail', args=[self.article.slug]),
+        ):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.wsgi_request.LANGUAGE_CODE, 'en')
+            self.assertFalse(response.wsgi_request.session.accessed, url)
+            self.assertFalse([query for query in queries if 'django_session' in query['sql']], url)
+            self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+
+    def test_set_language_uses_signed_cookie(self):
+        response = self.client.get(reverse('blog:set_language', args=['en']))
+        self.assertNotIn(settings.SESSION_COOKIE_NAME, response.cookies)
+        self.assertNotEqual(response.cookies[LANGUAGE_COOKIE].value, 'en')
+        self.assertContains(self.client.get(reverse('blog:blog_list')), self.article.title_en)
+
+        self.client.get(reverse('blog:set_language', args=['de']))
+        self.assertContains(self.client.get(reverse('blog:blog_list')), self.article.title_en)
+
+    def test_accept_language_and_cookie_precedence(self):
+        url = reverse('blog:blog_list')
+        response = self.client.get(url, HTTP_ACCEPT_LANGUAGE='de-DE,en-US;q=0.8,tr;q=0.5')
+        self.assertContains(response, self.article.title_en)
+        self.assertIn('Accept-Language', response['Vary'])
+
+        self.client.cookies[LANGUAGE_COOKIE] = language_cookie_value('tr')
+        response = self.client.get(url, HTTP_ACCEPT_LANGUAGE='en')
+        self.assertContains(response, self.article.title)
+        self.assertNotContains(response, self.article.title_en)
+
+        # Geçersiz çerez yok sayılır, başlığa dönülür
+        self.client.cookies[LANGUAGE_COOKIE] = 'fr'
+        self.assertContains(self.client.get(url, HTTP_ACCEPT_LANGUAGE='en'), self.article.title_en)
+
+
+@override_settings(I18N_URLS=True)
+class LanguageUrlTests(PublicPageTestCase):
+
+    content = {'categories': 1, 'articles_per_category': 4, 'paragraphs': 2, 'images': 0}
+
+    def test_prefixed_urls_select_language(self):
+        url = reverse('blog:article_detail', args=[self.article.slug])
+        self.assertEqual(url, f'/makale/{self.article.slug}/')
+        with translation.override('en'):
+            en_url = reverse('blog:article_detail', args=[self.article.slug])
+        self.assertEqual(en_url, f'/en/makale/{self.article.slug}/')
+
+        # Çerez ve başlık URL'nin dilini değiştirmez
+        self.client.cookies[LANGUAGE_COOKIE] = language_cookie_value('en')
+        response = self.client.get(url, HTTP_ACCEPT_LANGUAGE='en')
+        self.assertContains(response, '<html lang="tr"')
+        response = self.client.get(reverse('blog:blog_list'), HTTP_ACCEPT_LANGUAGE='en')
+        self.assertNotContains(response, self.article.title_en)
+
+        response = self.client.get('/en/blog/')
+        self.assertContains(response, '<html lang="en"')
+        self.assertContains(response, self.article.title_en)
+        self.assertContains(response, f'href="{en_url}"')
+        self.assertEqual(self.client.get('/en/yok/').status_code, 404)
+
+    def test_responses_do_not_vary_on_cookie(self):
+        response = self.client.get('/en/blog/')
+        self.assertIn('public', response['Cache-Control'])
+        self.assertNotIn('Cookie', response.get('Vary', ''))
+        self.assertNotIn('Accept-Language', response.get('Vary', ''))
+
+    def test_set_language_redirects_to_prefixed_url(self):
+        url = reverse('blog:article_detail', args=[self.article.slug])
+        response = self.client.get(
+            reverse('blog:set_language', args=['en']), HTTP_REFERER=f'http://testserver{url}',
+        )
+        self.assertRedirects(response, f'http://testserver/en{url}', fetch_redirect_response=False)
+        response = self.client.get('/en/dil/tr/', HTTP_REFERER='http://testserver/en/blog/?page=2')
+        self.assertRedirects(response, 'http://testserver/blog/?page=2', fetch_redirect_response=False)
+
+    def test_sitemap_lists_both_languages(self):
+        response = self.client.get('/sitemap.xml')
+        self.assertContains(response, f'/makale/{self.article.slug}/</loc>')
+        self.assertContains(response, f'/en/makale/{self.article.slug}/</loc>')
+        self.assertContains(response, 'hreflang="en"')
+        self.assertContains(response, 'hreflang="x-default"')
+
+
+@override_settings(RATELIMIT_ENABLED=False)
+class ContactSubmitTests(TestCase):
+
+    def post(self, **data):
+        data = {'name': 'Ayşe', 'email': 'ayse@example.com', 'message': 'Merhaba', **data}
+        return self.client.post(reverse('blog:contact_submit'), data)
+
+    def test_message_is_saved_before_success(self):
+        response = self.post()
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(ContactMessage.objects.get().email, 'ayse@example.com')
+
+    def test_failed_write_is_not_reported_as_success(self):
+        with mock.patch.object(ContactMessage.objects, 'create', side_effect=DatabaseError):
+            response = self.post()
+        self.assertEqual(response.status_code, 503)
+        self.assertFalse(response.json()['success'])
+
+    def test_missing_fields_are_rejected(self):
+        self.assertEqual(self.post(message='').status_code, 400)
+        self.assertFalse(ContactMessage.objects.exists())
+
+
+class RateLimitTests(TestCase):
+
+    def setUp(self):
+        caches[settings.RATELIMIT_CACHE].clear()
+        clock = mock.patch('blog.ratelimit.time.time', return_value=3600.0)
+        self.now = clock.start()
+        self.addCleanup(clock.stop)
+
+    def test_bucket_refills_at_average_rate(self):
+        limiter = TokenBucketLimiter('3/m', burst=2)
+        self.assertEqual([limiter.consume('a')[0] for _ in range(3)], [True, True, False])
+        self.assertEqual(limiter.consume('a'), (False, 20.0))
+        self.assertTrue(limiter.consume('b')[0])
+        self.now.return_value += 20
+        self.assertEqual([limiter.consume('a')[0] for _ in range(2)], [True, False])
+        # Uzun bekleme kovayı burst'ten fazla doldurmaz
+        self.now.return_value += 3600
+        self.assertEqual([limiter.consume('a')[0] for _ in range(3)], [True, True, False])
+
+    def test_denied_request_spends_no_tokens(self):
+        limiter = TokenBucketLimiter('3/m', burst=2)
+        limiter.consume('ip=1', 'email=a')
+        limiter.consume('ip=1', 'email=a')
+        self.assertFalse(limiter.consume('ip=2', 'email=a')[0])
+        self.assertEqual([limiter.consume('ip=2', f'email={i}')[0] for i in range(3)], [True, True, False])
+
+    def test_concurrent_consumers_share_one_counter(self):
+        limiter = TokenBucketLimiter('5/m')
+        barrier = threading.Barrier(20)
+        results = []
+
+        def consume():
+            barrier.wait()
+            results.append(limiter.consume('ip=1.2.3.4')[0])
+
+        threads = [threading.Thread(target=consume) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results.count(True), 5)
+
+    def test_view_returns_429_with_retry_after(self):
+        url = reverse('blog:newsletter_subscribe')
+        for i in range(3):
+            self.client.post(url, {'email': f'okur{i}@example.com'})
+        response = self.client.post(url, {'email': 'okur9@example.com'})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response['Retry-After'], '12')
+
+    def test_blocked_email_does_not_spend_ip_tokens(self):
+        url = reverse('blog:newsletter_subscribe')
+        for _ in range(3):
+            self.client.post(url, {'email': 'hedef@example.com'}, REMOTE_ADDR='10.0.0.1')
+        statuses = [
+            self.client.post(url, {'email': email}, REMOTE_ADDR='10.0.0.2').status_code
+            for email in ('hedef@example.com', 'a@example.com', 'b@example.com', 'c@example.com')
+        ]
+        self.assertEqual(statuses, [429, 200, 200, 200])
+
+
+@override_settings(RATELIMIT_ENABLED=False)
+class NewsletterSubscribeTests(TestCase):
+
+    def subscribe(self, email):
+        return self.client.post(reverse('blog:newsletter_subscribe'), {'email': email})
+
+    def test_new_subscriber_is_created(self):
+        self.assertTrue(self.subscribe('okur@example.com').json()['success'])
+        self.assertTrue(NewsletterSubscriber.objects.get(email='okur@example.com').is_active)
+
+    def test_duplicate_email_is_rejected(self):
+        self.subscribe('okur@example.com')
+        response = self.subscribe('okur@example.com')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(NewsletterSubscriber.objects.count(), 1)
+
+    def test_inactive_subscriber_is_reactivated_in_one_update(self):
+        NewsletterSubscriber.objects.create(email='okur@example.com', is_active=False)
+        with self.assertNumQueries(1):
+            response = self.subscribe('okur@example.com')
+        self.assertIn('yeniden', response.json()['message'])
+        self.assertTrue(NewsletterSubscriber.objects.get().is_active)
+
+
+class SQLiteTuningTests(TestCase):
+
+    def pragma(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    def test_pragmas_are_applied_on_connect(self):
+        self.assertEqual(self.pragma('synchronous'), 1)  # NORMAL
+        self.assertEqual(self.pragma('busy_timeout'), 5000)
+        self.assertEqual(self.pragma('temp_store'), 2)  # MEMORY
+        self.assertEqual(self.pragma('cache_size'), -20000)
+
+    def test_dbmaintain_runs_once(self):
+        out = io.StringIO()
+        call_command('dbmaintain', '--skip-analyze', stdout=out)
+        self.assertIn('Bakım tamamlandı', out.getvalue())
+
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTests(TestCase):
+
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+        health = mock.patch('blog.routers.replica_is_healthy', return_value=True)
+        self.healthy = health.start()
+        self.addCleanup(health.stop)
+
+    def test_reads_go_to_healthy_replicas(self):
+        self.assertEqual(self.router.db_for_read(Article), 'replica')
+        self.healthy.return_value = False
+        self.assertEqual(self.router.db_for_read(Article), 'default')
+        self.assertIsNone(self.router.db_for_read(User))
+
+    def test_writes_and_migrations_stay_on_primary(self):
+        self.assertEqual(self.router.db_for_write(Article), 'default')
+        self.assertFalse(self.router.allow_migrate('replica', 'blog'))
+        self.assertIsNone(self.router.allow_migrate('default', 'blog'))
+
+    def test_pinned_reads_use_primary(self):
+        token = pin_to_primary()
+        try:
+            self.assertIsNone(self.router.db_for_read(Article))
+        finally:
+            unpin(token)
+        self.assertEqual(self.router.db_for_read(Article), 'replica')
+
+    def test_middleware_pins_after_writes(self):
+        seen = []
+
+        def get_response(request):
+            seen.append(is_pinned())
+            return HttpResponse()
+
+        middleware = ReplicaPinningMiddleware(get_response)
+        factory = RequestFactory()
+        response = middleware(factory.post('/ajax/bulten-abone/'))
+        self.assertIn(ReplicaPinningMiddleware.cookie_name, response.cookies)
+
+        middleware(factory.get('/blog/'))
+        request = factory.get('/blog/')
+        request.COOKIES[ReplicaPinningMiddleware.cookie_name] = '1'
+        middleware(request)
+        middleware(factory.get('/admin/'))
+        self.assertEqual(seen, [True, False, True, True])
+        self.assertFalse(is_pinned())
+
+
+class TwoTierCacheTests(TestCase):
+
+    def setUp(self):
+        caches['shared'].clear()
+        self.cache = TwoTierCache('shared', {'OPTIONS': {'LOCAL_TIMEOUT': 5}})
+
+    def test_remote_hits_fill_local_copy(self):
+        self.cache.set('anahtar', 'değer', 60)
+        self.cache.local.clear()
+        self.assertEqual(self.cache.get('anahtar'), 'değer')
+        self.assertEqual(self.cache.get('anahtar'), 'değer')
+        self.assertIsNone(self.cache.get('yok'))
+        stats = self.cache.stats()
+        self.assertEqual((stats['remote_hits'], stats['local_hits'], stats['misses']), (1, 1, 1))
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+        barrier = threading.Barrier(8)
+        results = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return 'değer'
+
+        def read():
+            barrier.wait()
+            results.append(self.cache.get_or_set('sıcak', compute, 60))
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ['değer'] * 8)
+
+    def test_values_near_expiry_are_refreshed_early(self):
+        now = time.time()
+        with mock.patch('blog.cache.random.random', return_value=0.5):
+            # -ln(0.5) * 10 sn ≈ 6.9 sn erken
+            self.assertTrue(self.cache._should_refresh_early(('x', now + 5, 10)))
+            self.assertFalse(self.cache._should_refresh_early(('x', now + 100, 10)))
+            self.assertFalse(self.cache._should_refresh_early(('x', now + 5, 0)))
+
+            self.cache._store('trend', 'eski', 60, None, delta=100)
+            self.assertEqual(self.cache.get_or_set('trend', lambda: 'yeni', 60), 'yeni')
+        self.assertEqual(self.cache.stats()['early_refreshes'], 1)
+
+
+class FragmentCacheTests(PublicPageTestCase):
+
+    content = {'categories': 2, 'articles_per_category': 2, 'paragraphs': 1, 'images': 0}
+
+    def test_same_page_renders_in_both_languages(self):
+        turkish = self.client.get('/blog/')
+        english = self.client.get('/en/blog/')
+        self.assertContains(turkish, 'Hakkında')
+        self.assertContains(english, 'About')
+        self.assertNotContains(english, 'Hakkında')
+        # Türkçe parçalar önbellekte kalsa da tekrar Türkçe gelir
+        self.assertContains(self.client.get('/blog/'), 'Hakkında')
+
+    def test_saving_content_bumps_fragment_version(self):
+        self.client.get('/blog/')
+        category = Category.objects.first()
+        category.name = 'Yeni Kategori Adı'
+        category.save()
+        self.assertContains(self.client.get('/blog/'), 'Yeni Kategori Adı')
+
+
+class WarmUpTests(TestCase):
+
+    def test_templates_land_in_cached_loader(self):
+        timings = compile_templates()
+        self.assertIn('blog/base.html', timings)
+        loader = engines['django'].engine.template_loaders[0]
+        self.assertIn('blog/base.html', {key.split('-')[0] for key in loader.get_template_cache})
+
+    def test_resolve_urls_counts_every_language(self):
+        resolver = get_resolver()
+        expected = 0
+        for language in ('tr', 'en'):
+            with translation.override(language):
+                expected += len(resolver.reverse_dict) + sum(
+                    len(namespace.reverse_dict) for _, namespace in resolver.namespace_dict.values()
+                )
+        self.assertEqual(resolve_urls(), expected)
+
+
+class WarmCacheTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=2, articles_per_category=3, paragraphs=1, images=0)
+        # En eski makaleyi tek öne çıkan yap; yeni makalelerin önüne geçmeli
+        cls.featured = Article.objects.filter(is_published=True).order_by('published_date').first()
+        Article.objects.update(is_featured=False)
+        Article.objects.filter(pk=cls.featured.pk).update(is_featured=True)
+
+    def test_home_and_featured_articles_come_first(self):
+        from .management.commands.warm_cache import collect_urls
+
+        paths = [path for path, _ in collect_urls()]
+        self.assertEqual(paths[0], reverse('blog:home'))
+        self.assertEqual(paths[1], reverse('blog:article_detail', args=[self.featured.slug]))
+        self.assertIn(reverse('blog:about'), paths)
+
+    def test_every_page_is_fetched_in_every_language(self):
+        from .management.commands.warm_cache import Command
+
+        def fetch(command, path, language):
+            return command.result(path, language, 200, time.perf_counter())
+
+        out = io.StringIO()
+        with mock.patch.object(Command, 'fetch_local', autospec=True, side_effect=fetch):
+            call_command('warm_cache', '--limit', '2', '--json', stdout=out)
+        jobs = [(result['path'], result['language']) for result in json.loads(out.getvalue())['results']]
+        self.assertEqual(jobs, [
+            ('/', 'tr'), ('/en/', 'en'),
+            (self.featured.get_absolute_url(), 'tr'), ('/en' + self.featured.get_absolute_url(), 'en'),
+        ])
+
+
+class PrerenderTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=2, articles_per_category=3, paragraphs=1, images=0)
+        cls.article = Article.objects.filter(is_published=True, is_featured=False).first()
+
+    def setUp(self):
+        cache.clear()
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(PRERENDER_ROOT=self.root))
+
+    def export(self, *args):
+        out = io.StringIO()
+        call_command('export_site', *args, stdout=out, stderr=io.StringIO())
+        return out.getvalue()
+
+    def test_pages_are_written_in_both_languages(self):
+        self.assertIn('0 hata', self.export())
+        url = self.article.get_absolute_url().strip('/')
+        self.assertIn('Yapay zeka', (self.root / url / 'index.html').read_text())
+        self.assertIn('AI article', (self.root / 'en' / url / 'index.html').read_text())
+        self.assertTrue((self.root / '.manifest.json').exists())
+        self.assertIn('0 sayfa render edildi', self.export())
+
+    def test_changed_article_rerenders_only_affected_pages(self):
+        self.export()
+        Article.objects.filter(pk=self.article.pk).update(updated_at=timezone.now())
+        planned = self.export('--dry-run').split()
+        self.assertIn(self.article.get_absolute_url(), planned)
+        self.assertIn(reverse('blog:blog_list'), planned)
+        self.assertIn(reverse('blog:category_detail', args=[self.article.category.slug]), planned)
+        self.assertNotIn(reverse('blog:home'), planned)
+        self.assertNotIn(reverse('blog:about'), planned)
+
+    def test_middleware_serves_files_until_article_is_saved(self):
+        self.export()
+        self.addCleanup(get_view_counter().flush)
+        url = self.article.get_absolute_url()
+        response = self.client.get(url)
+        self.assertEqual(response['X-Prerendered'], '1')
+        self.assertEqual(self.client.get('/en' + url)['X-Prerendered'], '1')
+
+        self.article.save()
+        self.assertFalse(self.client.get(url).has_header('X-Prerendered'))
+
+    def test_prerendered_article_views_are_counted(self):
+        self.export()
+        url = self.article.get_absolute_url()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url)['X-Prerendered'], '1')
+            self.assertEqual(self.client.get('/en' + url)['X-Prerendered'], '1')
+            self.client.get(reverse('blog:blog_list'))
+        get_view_counter().flush()
+        self.assertEqual(
+            dict(ArticleViewBucket.objects.values_list('language', 'views')), {'tr': 1, 'en': 1},
+        )
+        self.assertFalse(ArticleViewBucket.objects.exclude(article=self.article).exists())
+
+    def test_chrome_change_keeps_manifest(self):
+        self.export()
+        Category.objects.first().save()
+        self.assertFalse(list(self.root.rglob('index.html')))
+        self.assertTrue((self.root / '.manifest.json').exists())
+        self.assertIn('0 hata', self.export())
+        self.assertTrue((self.root / 'blog' / 'index.html').exists())
+
+
+@override_settings(PURGE_BACKEND='blog.http_cache.LocalPurger', PURGE_ASYNC=False)
+class CacheHeadersTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=1, articles_per_category=3, paragraphs=1, images=0)
+        cls.article = Article.objects.filter(is_published=True).first()
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client(headers={WARMUP_HEADER: '1'})
+        # Geçerli CSRF çerezi: yanıt yeni çerez yazmasın, public kalsın
+        self.client.cookies[settings.CSRF_COOKIE_NAME] = 'a' * 32
+        http_cache._purger = None
+        self.addCleanup(setattr, http_cache, '_purger', None)
+
+    def assertArticleHeaders(self, response):
+        self.assertIn('public', response['Cache-Control'])
+        self.assertIn('s-maxage=600', response['Cache-Control'])
+        keys = response['Surrogate-Key'].split()
+        self.assertIn(f'article-{self.article.pk}', keys)
+        self.assertIn(f'category-{self.article.category_id}', keys)
+        self.assertIn('chrome', keys)
+
+    def test_article_page_gets_policy_and_keys(self):
+        self.assertArticleHeaders(self.client.get(self.article.get_absolute_url()))
+
+    def test_pages_with_forms_stay_public(self):
+        for url in (reverse('blog:home'), reverse('blog:contact')):
+            response = self.client.get(url)
+            self.assertIn('public', response['Cache-Control'], url)
+            self.assertNotIn(settings.CSRF_COOKIE_NAME, response.cookies, url)
+        # Çerezi olmayan ilk ziyaretçi AJAX formları için token'ı alır
+        response = Client(headers={WARMUP_HEADER: '1'}).get(reverse('blog:home'))
+        self.assertIn(settings.CSRF_COOKIE_NAME, response.cookies)
+        self.assertIn('private', response['Cache-Control'])
+
+    def test_session_responses_stay_private(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = 'oturum'
+        response = self.client.get(self.article.get_absolute_url())
+        self.assertIn('private', response['Cache-Control'])
+        self.assertFalse(response.has_header('Surrogate-Key'))
+
+    def test_prerendered_page_gets_same_headers(self):
+        root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(PRERENDER_ROOT=root))
+        call_command('export_site', stdout=io.StringIO())
+
+        client = Client()
+        client.cookies[settings.CSRF_COOKIE_NAME] = 'a' * 32
+        for url in (self.article.get_absolute_url(), '/en' + self.article.get_absolute_url()):
+            response = client.get(url)
+            self.assertEqual(response['X-Prerendered'], '1')
+            self.assertArticleHeaders(response)
+
+    def test_saving_article_purges_its_keys(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.article.save()
+        self.assertIn(
+            sorted(['article-%d' % self.article.pk, 'category-%d' % self.article.category_id, 'home', 'list']),
+            http_cache.get_purger().purged,
+        )
+
+
+class AsyncViewTests(TestCase):
+
+    READ_VIEWS = ['home', 'blog_list', 'article_detail', 'category_detail', 'search']
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=2, articles_per_category=3, paragraphs=3, images=1)
+        cls.article = (
+            Article.objects.select_related('category').filter(is_published=True, is_featured=True).first()
+        )
+
+    def setUp(self):
+        cache.clear()
+
+    def request(self, path, **params):
+        request = AsyncRequestFactory().get(path, params, headers={WARMUP_HEADER: '1'})
+        request.LANGUAGE_CODE = 'en'
+        request.user = AnonymousUser()
+        return request
+
+    def test_async_views_share_sync_cache_policies(self):
+        for name in self.READ_VIEWS:
+            with self.subTest(name):
+                self.assertEqual(
+                    getattr(async_views, name).cache_policy, getattr(views, name).cache_policy,
+                )
+
+    async def test_pages_render(self):
+        slug, category_slug = self.article.slug, self.article.category.slug
+        pages = [
+            (async_views.home, self.request('/'), {}, self.article.title_en),
+            (async_views.blog_list, self.request('/blog/', page=1), {}, 'AI article'),
+            (async_views.article_detail, self.request('/'), {'slug': slug}, 'Paragraf 1 içeriği.'),
+            (async_views.category_detail, self.request('/'), {'slug': category_slug}, 'AI article'),
+            (async_views.search, self.request('/ara/', q='AI'), {}, 'AI article'),
+        ]
+        for view, request, kwargs, text in pages:
+            with self.subTest(view.__name__):
+                self.assertContains(await view(request, **kwargs), text)
+
+    async def test_missing_article_is_404(self):
+        with self.assertRaises(Http404):
+            await async_views.article_detail(self.request('/'), slug='yok')
+
+
+class CSVExportTests(TestCase):
+
+    def test_formula_cells_are_escaped(self):
+        for value in ('=HYPERLINK("http://x")', '+1', '-2+3', '@SUM(A1)', '\tx', '\rx'):
+            with self.subTest(value=value):
+                self.assertEqual(format_value(value), "'" + value)
+        self.assertEqual(format_value('Merhaba = selam'), 'Merhaba = selam')
+        self.assertEqual(format_value(-5), -5)
+        self.assertEqual(format_value(True), '1')
+
+    def test_admin_action_streams_messages(self):
+        admin = User.objects.create_superuser('admin', 'admin@example.com', 'parola')
+        ContactMessage.objects.create(name='Ali', email='ali@example.com', message='=1+1')
+        ContactMessage.objects.create(name='Ayşe', email='ayse@example.com', message='Merhaba')
+        self.client.force_login(admin)
+        response = self.client.post(reverse('admin:blog_contactmessage_changelist'), {
+            'action': 'export_csv',
+            '_selected_action': ContactMessage.objects.values_list('pk', flat=True),
+        })
+        self.assertTrue(response.streaming)
+        self.assertIn('mesajlar-', response['Content-Disposition'])
+        rows = b''.join(response.streaming_content).decode('utf-8-sig').splitlines()
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(rows[1].startswith("Ali,ali@example.com,'=1+1,"))
+
+
+class AdminListTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        NewsletterSubscriber.objects.bulk_create([
+            NewsletterSubscriber(email=f'okur{index}@example.com', is_active=index % 2 == 0)
+            for index in range(30)
+        ])
+
+    def test_unfiltered_large_tables_use_estimate(self):
+        queryset = NewsletterSubscriber.objects.order_by('pk')
+        with mock.patch('blog.paginator.ESTIMATE_THRESHOLD', 10):
+            NewsletterSubscriber.objects.filter(pk=queryset.last().pk).delete()
+            # MAX(rowid) silinen son satırı saymaz, aradakileri sayar
+            NewsletterSubscriber.objects.filter(pk=queryset.first().pk).delete()
+            self.assertEqual(EstimatedCountPaginator(queryset, 10).count, 29)
+            filtered = queryset.filter(is_active=True)
+            self.assertEqual(EstimatedCountPaginator(filtered, 10).count, filtered.count())
+        self.assertEqual(EstimatedCountPaginator(queryset, 10).count, 28)
+
+    def test_thumbnail_is_generated_once(self):
+        from PIL import Image
+
+        media = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(MEDIA_ROOT=media))
+        cache.clear()
+        buffer = io.BytesIO()
+        Image.new('RGB', (400, 300), 'teal').save(buffer, 'PNG')
+        article = Article(thumbnail=default_storage.save('articles/kapak.png', ContentFile(buffer.getvalue())))
+
+        url = thumbnail_url(article.thumbnail)
+        self.assertTrue(url.endswith('.webp'))
+        with Image.open(Path(media) / url.removeprefix(settings.MEDIA_URL)) as thumb:
+            self.assertLessEqual(max(thumb.size), 80)
+        with mock.patch('blog.thumbnails.make_thumbnail') as make:
+            self.assertEqual(thumbnail_url(article.thumbnail), url)
+        make.assert_not_called()
+        self.assertIsNone(thumbnail_url(Article().thumbnail))
+
+
+MARKDOWN_TR = """# Giriş
+
+Prompt yazmak **zanaattir**, [bağlantı](https://example.com) değil.
+
+> Alıntı satırı
+
+```Python
+print("merhaba")
+```
+
+- birinci
+- ikinci
+"""
+
+MARKDOWN_EN = """# Introduction
+
+Writing prompts is a **craft**.
+
+> A quote
+
+```python
+print("hello")
+```
+
+- first
+- second
+"""
+
+
+class MarkdownImportTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=1, articles_per_category=2, paragraphs=0, images=0)
+        cls.article = Article.objects.first()
+
+    def test_blocks_keep_structure_as_plain_text(self):
+        self.assertEqual(parse_blocks(MARKDOWN_TR), [
+            ('heading', 'Giriş', ''),
+            ('text', 'Prompt yazmak zanaattir, bağlantı değil.', ''),
+            ('quote', 'Alıntı satırı', ''),
+            ('code', 'print("merhaba")', 'python'),
+            ('text', '• birinci\n• ikinci', ''),
+        ])
+
+    def test_english_document_fills_existing_paragraphs(self):
+        self.assertEqual(import_markdown(self.article, MARKDOWN_TR), 5)
+        import_markdown(self.article, MARKDOWN_EN, language='en')
+        paragraphs = list(self.article.paragraphs.order_by('order'))
+        self.assertEqual([p.order for p in paragraphs], [1, 2, 3, 4, 5])
+        self.assertEqual(paragraphs[0].heading_text_en, 'Introduction')
+        self.assertEqual(paragraphs[1].content_en, 'Writing prompts is a craft.')
+
+        with self.assertRaises(ValueError):
+            import_markdown(self.article, '# Tek başlık', language='en')
+        import_markdown(self.article, '# Yeni', replace=True)
+        self.assertEqual(list(self.article.paragraphs.values_list('heading_text', flat=True)), ['Yeni'])
+
+    def test_admin_page_imports_uploaded_file(self):
+        self.client.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'parola'))
+        url = reverse('admin:blog_article_import_markdown', args=[self.article.pk])
+        self.assertEqual(self.client.get(url).status_code, 200)
+        document = ContentFile(MARKDOWN_TR.encode(), name='yazi.md')
+        response = self.client.post(url, {'document': document, 'language': 'tr'})
+        self.assertRedirects(response, reverse('admin:blog_article_change', args=[self.article.pk]))
+        self.assertEqual(self.article.paragraphs.count(), 5)
+
+
+class CodeHighlightTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_known_language_is_highlighted_once(self):
+        html = highlight_code('def f():\n    return 1\n', 'Python')
+        self.assertIn('class="highlight"', html)
+        self.assertIn('<span class="k">def</span>', html)
+        with mock.patch('blog.highlight.highlight') as pygments:
+            self.assertEqual(highlight_code('def f():\n    return 1\n', 'python'), html)
+        pygments.assert_not_called()
+
+    def test_unknown_language_is_escaped(self):
+        self.assertEqual(highlight_code('<b>x</b>', 'yok'), '<pre><code>&lt;b&gt;x&lt;/b&gt;</code></pre>')
+        self.assertEqual(highlight_code('<b>x</b>'), '<pre><code>&lt;b&gt;x&lt;/b&gt;</code></pre>')
+
+    def test_code_stylesheet_loads_only_with_code(self):
+        create_content(categories=1, articles_per_category=3, paragraphs=8, images=0)
+        with_code, without_code = Article.objects.filter(is_published=True)[:2]
+        ArticleParagraph.objects.filter(article=without_code, paragraph_type='code').update(paragraph_type='text')
+        client = Client(headers={WARMUP_HEADER: '1'})
+        response = client.get(with_code.get_absolute_url())
+        self.assertContains(response, 'css/code.css')
+        self.assertContains(response, '<div class="highlight">')
+        self.assertNotContains(client.get(without_code.get_absolute_url()), 'css/code.css')
+
+
+class ArticlePDFTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=1, articles_per_category=2, paragraphs=6, images=1)
+        cls.article = Article.objects.filter(is_published=True).first()
+
+    def setUp(self):
+        cache.clear()
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(PDF_ROOT=self.root, PRERENDER_ROOT=None))
+        self.renders = []
+
+        def fake_render(request, article, language, target):
+            self.renders.append(language)
+            time.sleep(0.05)
+            target.write_bytes(b'%PDF-1.7 ' + language.encode())
+
+        render = mock.patch('blog.pdf.render_pdf', side_effect=fake_render)
+        render.start()
+        self.addCleanup(render.stop)
+
+    def test_concurrent_requests_render_once(self):
+        request = RequestFactory().get('/')
+        paths = []
+        threads = [
+            threading.Thread(target=lambda: paths.append(get_article_pdf(request, self.article, 'tr')))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.renders, ['tr'])
+        self.assertEqual(len(set(paths)), 1)
+
+    def test_view_serves_cached_file_per_language(self):
+        url = reverse('blog:article_pdf', args=[self.article.slug])
+        response = self.client.get(url, {'lang': 'en', 'indir': '1'})
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertIn('attachment', response['Content-Disposition'])
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF-1.7 en')
+        self.client.get(url, {'lang': 'en'}).close()
+        self.client.get(url, {'lang': 'xx'}).close()
+        self.assertEqual(self.renders, ['en', 'tr'])
+
+    def test_updated_article_replaces_old_file(self):
+        request = RequestFactory().get('/')
+        old = get_article_pdf(request, self.article, 'tr')
+        self.article.updated_at += timezone.timedelta(seconds=1)
+        new = get_article_pdf(request, self.article, 'tr')
+        self.assertNotEqual(old, new)
+        self.assertFalse(old.exists())
+        self.assertTrue(new.exists())
+
+    def test_missing_weasyprint_returns_503(self):
+        with mock.patch('blog.pdf.render_pdf', side_effect=PDFUnavailable('libpango')):
+            response = self.client.get(reverse('blog:article_pdf', args=[self.article.slug]))
+        self.assertEqual(response.status_code, 503)
+
+    def test_print_items_use_requested_language(self):
+        items = print_items(self.article.paragraphs.all(), self.article.images.all(), 'en')
+        self.assertEqual(items[0], {'type': 'heading', 'text': 'Başlık 0', 'code_language': 'python'})
+        self.assertEqual(items[2]['text'], 'Paragraph 1 content.')
+        self.assertEqual(items[1]['type'], 'image')
+
+    def test_url_fetcher_stays_inside_roots(self):
+        media = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        (media / 'a.webp').write_bytes(b'RIFF')
+        self.enterContext(override_settings(MEDIA_ROOT=media))
+        # weasyprint yüklü olmasa da yalnızca adres çözümlemesi sınanır
+        weasyprint = mock.Mock(default_url_fetcher=lambda uri: uri)
+        self.enterContext(mock.patch.dict(sys.modules, {'weasyprint': weasyprint}))
+
+        self.assertEqual(url_fetcher('http://testserver/media/a.webp'), (media / 'a.webp').resolve().as_uri())
+        for url in (
+            '/media/../edebai/settings.py', '/media/%2E%2E/%2E%2E/etc/passwd',
+            '/static/../../etc/passwd', 'https://example.com/x.png',
+        ):
+            with self.subTest(url), self.assertRaises(ValueError):
+                url_fetcher(url)
+
+
+@override_settings(PRERENDER_ROOT=None)
+class InstrumentationTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=1, articles_per_category=3, paragraphs=2, images=0)
+
+    def setUp(self):
+        cache.clear()
+        view_stats.reset()
+        self.client = Client(headers={WARMUP_HEADER: '1'})
+
+    def test_histogram_percentiles_within_bucket_error(self):
+        histogram = LatencyHistogram()
+        for value in range(1, 101):
+            histogram.add(float(value))
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertAlmostEqual(summary['p50_ms'], 50, delta=50 * 0.05)
+        self.assertAlmostEqual(summary['p95_ms'], 95, delta=95 * 0.05)
+        self.assertEqual(summary['max_ms'], 100)
+
+    @override_settings(SERVER_TIMING_HEADER=False)
+    def test_server_timing_is_off_by_default_in_production(self):
+        response = self.client.get(reverse('blog:blog_list'))
+        self.assertIn('public', response['Cache-Control'])
+        self.assertFalse(response.has_header('Server-Timing'))
+
+    @override_settings(SERVER_TIMING_HEADER=True)
+    def test_server_timing_reports_queries(self):
+        response = self.client.get(reverse('blog:blog_list'))
+        self.assertRegex(response['Server-Timing'], r'^db;dur=[\d.]+;desc="\d+ sorgu", tpl;dur=')
+
+    def test_views_are_recorded_and_slow_requests_logged(self):
+        with override_settings(SLOW_REQUEST_MS=0), self.assertLogs('blog.performance', 'WARNING') as logs:
+            self.client.get(reverse('blog:blog_list'))
+        record = json.loads(logs.records[0].getMessage())
+        self.assertEqual(record['view'], 'blog:blog_list')
+        self.assertGreater(record['queries'], 0)
+        self.assertEqual(view_stats.snapshot()['blog:blog_list']['count'], 1)
+
+    def test_stats_are_staff_only(self):
+        url = reverse('blog:performance_stats')
+        self.assertNotEqual(self.client.get(url).status_code, 200)
+        self.client.force_login(User.objects.create_user('editor', password='parola', is_staff=True))
+        self.assertIn('views', self.client.get(url).json())
+
+
+@override_settings(PRERENDER_ROOT=None)
+class ProfilerTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        create_content(categories=1, articles_per_category=3, paragraphs=2, images=0)
+        cls.staff = User.objects.create_user('editor', password='parola', is_staff=True)
+
+    def setUp(self):
+        cache.clear()
+        caches[settings.RATELIMIT_CACHE].clear()
+        self.root = Path(self.enterContext(tempfile.TemporaryDirectory()))
+        self.enterContext(override_settings(PROFILE_ROOT=self.root))
+        self.client = Client(headers={WARMUP_HEADER: '1'})
+        self.url = reverse('blog:blog_list')
+
+    def test_flag_is_ignored_for_visitors(self):
+        response = self.client.get(self.url, {'_profile': '1'})
+        self.assertFalse(response.has_header('X-Profile-Report'))
+        self.assertFalse(any(self.root.iterdir()))
+
+    def test_staff_request_writes_report(self):
+        self.client.force_login(self.staff)
+        response = self.client.get(self.url, {'_profile': 'cprofile'})
+        name = response['X-Profile-Report']
+        self.assertEqual(response['Cache-Control'], 'private, no-store')
+        self.assertIn('GET /blog/?_profile=cprofile', (self.root / f'{name}.txt').read_text())
+        self.assertTrue((self.root / f'{name}.collapsed').read_text())
+
+        response = self.client.get(self.url, HTTP_X_PROFILE='summary')
+        self.assertEqual(response['Content-Type'], 'text/plain; charset=utf-8')
+
+    def test_staff_profiles_are_rate_limited(self):
+        self.client.force_login(self.staff)
+        limiter = profiling.get_limiter()
+        # Sayaç penceresi test ortasında dönmesin
+        self.enterContext(mock.patch('blog.ratelimit.time.time', return_value=3600.0))
+        statuses = [
+            self.client.get(self.url, {'_profile': 'cprofile'}).status_code
+            for _ in range(limiter.capacity + 1)
+        ]
+        self.assertEqual(statuses[-1], 429)
+        self.assertEqual(statuses.count(200), limiter.capacity)
+
+    def test_reports_are_size_and_count_bounded(self):
+        stacks = Counter({f'a;b;{index}': 100 - index for index in range(100)})
+        profiling.write_collapsed(stacks, self.root / 'x.collapsed', max_bytes=50)
+        lines = (self.root / 'x.collapsed').read_text().splitlines()
+        self.assertEqual(lines[0], 'a;b;0 100')
+        self.assertLessEqual(sum(len(line) + 1 for line in lines), 50)
+
+        for index in range(5):
+            (self.root / f'{index}.txt').write_text('')
+            os.utime(self.root / f'{index}.txt', (index, index))
+        profiling.prune(self.root, keep=2)
+        self.assertEqual(sorted(path.name for path in self.root.glob('*.txt')), ['3.txt', '4.txt'])
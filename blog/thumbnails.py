@@ -0,0 +1,62 @@
+"""
+Admin listeleri için küçük önizleme görselleri.
+
+Küçük görsel ilk istendiğinde Pillow ile üretilip MEDIA_ROOT/thumbs altına
+yazılır, adresi önbellekte tutulur. Sonraki listelerde ne disk ne de
+tam boy görsel okunur.
+"""
+import hashlib
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = 'thumbs'
+THUMBNAIL_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def thumbnail_name(name, size):
+    digest = hashlib.md5(name.encode()).hexdigest()[:10]
+    stem = PurePosixPath(name).stem[:40]
+    return f'{THUMBNAIL_DIR}/{size[0]}x{size[1]}/{stem}-{digest}.webp'
+
+
+def make_thumbnail(field_file, size):
+    from PIL import Image
+
+    with field_file.open('rb') as source:
+        image = Image.open(source)
+        image.thumbnail(size)
+        if image.mode not in ('RGB', 'RGBA'):
+            image = image.convert('RGBA')
+        buffer = BytesIO()
+        image.save(buffer, 'WEBP', quality=80)
+    return buffer.getvalue()
+
+
+def thumbnail_url(field_file, size=(80, 80)):
+    """Görselin küçük kopyasının adresi; üretilemezse None"""
+    if not field_file:
+        return None
+    name = thumbnail_name(field_file.name, size)
+    cache_key = f'blog:thumb:{name}'
+    url = cache.get(cache_key)
+    if url is not None:
+        return url or None
+
+    try:
+        if not default_storage.exists(name):
+            default_storage.save(name, ContentFile(make_thumbnail(field_file, size)))
+        url = default_storage.url(name)
+    except Exception:
+        logger.warning('Küçük görsel üretilemedi: %s', field_file.name)
+        # Eksik ya da bozuk görsel her listede yeniden denenmesin
+        cache.set(cache_key, '', 60 * 60)
+        return None
+    cache.set(cache_key, url, THUMBNAIL_TIMEOUT)
+    return url
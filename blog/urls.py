@@ -1,17 +1,24 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# ASGI altında okuma sayfaları async view'larla sunulur (bkz. async_views.py)
+if settings.ASYNC_VIEWS:
+    from . import async_views as read_views
+else:
+    read_views = views
+
 app_name = 'blog'
 
 urlpatterns = [
     # Ana sayfalar
-    path('', views.home, name='home'),
-    path('blog/', views.blog_list, name='blog_list'),
+    path('', read_views.home, name='home'),
+    path('blog/', read_views.blog_list, name='blog_list'),
     path('kategoriler/', views.category_list, name='category_list'),
-    path('kategori/<slug:slug>/', views.category_detail, name='category_detail'),
+    path('kategori/<slug:slug>/', read_views.category_detail, name='category_detail'),
     path('hakkinda/', views.about, name='about'),
     path('iletisim/', views.contact, name='contact'),
-    path('ara/', views.search, name='search'),
+    path('ara/', read_views.search, name='search'),
     path('cerez-politikasi/', views.cookie_policy, name='cookie_policy'),
     path("robots.txt", views.robots_txt),
     
@@ -19,11 +26,15 @@ urlpatterns = [
     path('dil/<str:language>/', views.set_language, name='set_language'),
     
     # Makale detay
-    path('makale/<slug:slug>/', views.article_detail, name='article_detail'),
+    path('makale/<slug:slug>/', read_views.article_detail, name='article_detail'),
+    path('makale/<slug:slug>/pdf/', views.article_pdf, name='article_pdf'),
     
     # AJAX endpoints
     path('ajax/bulten-abone/', views.newsletter_subscribe, name='newsletter_subscribe'),
     path('ajax/iletisim-gonder/', views.contact_submit, name='contact_submit'),
+    
+    # Performans ölçümleri (yalnızca yönetici)
+    path('yonetim/performans/', views.performance_stats, name='performance_stats'),
 ]
 
 
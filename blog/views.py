@@ -1,39 +1,120 @@
+from operator import attrgetter
+from urllib.parse import urlsplit, urlunsplit
+
 from django.shortcuts import render, get_object_or_404, redirect
-from django.http import JsonResponse,HttpResponse
+from django.http import FileResponse, JsonResponse, HttpResponse
 from django.views.decorators.http import require_POST
 from django.contrib import messages
-from django.db.models import Count
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.cache import cache
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
 from django.db import models
 from django.core.paginator import Paginator
 from django.db.models import Q
-from django.utils.translation import get_language
+from django.db import DatabaseError, IntegrityError, transaction
+from django.utils.functional import SimpleLazyObject
 from .models import (
     Article, Category, HomepageSEO, 
     NewsletterSubscriber, ContactMessage,
     CookieConsent, CookiePolicy
 )
+from .analytics import record_view
+from .context_processors import request_language
+from .language import DEFAULT_LANGUAGE, LANGUAGES, language_path, set_language_cookie, url_routing
+from .http_cache import add_surrogate_keys, cache_policy, ensure_csrf_cookie
+from .instrumentation import view_stats
+from .pdf import PDFUnavailable, get_article_pdf
+from .ratelimit import ratelimit
+from .warmup import is_warmup_request
 
 
 def get_seo_context():
     """Anasayfa SEO verilerini getir"""
     homepage_seo = HomepageSEO.objects.filter(is_active=True).first()
-    cookie_consent = CookieConsent.objects.filter(is_active=True).first()
+    # Banner önbellekteki footer parçasında; sorgu yalnızca parça yeniden üretilirken çalışır
+    cookie_consent = SimpleLazyObject(lambda: CookieConsent.objects.filter(is_active=True).first())
     return {
         'seo': homepage_seo,
         'cookie_consent': cookie_consent,
     }
 
 
+TAG_CLOUD_CACHE_KEY = 'blog:tag_cloud'
+
+
+def build_tag_cloud():
+    """Yayındaki makalelerin anahtar kelimelerinden etiket listesi üret"""
+    raw_keywords = (
+        Article.objects
+        .filter(is_published=True)
+        .exclude(meta_keywords__isnull=True)
+        .exclude(meta_keywords__exact="")
+        .order_by()
+        .values_list('meta_keywords', flat=True)
+    )
+
+    # Arşiv büyüdükçe bellek sabit kalsın: satırlar parça parça okunur,
+    # tekrarları set ayıklar (DISTINCT geçici B-tree ile sıralardı)
+    tag_set = set()
+    for keywords in raw_keywords.iterator(chunk_size=200):
+        for keyword in keywords.split(','):
+            tag_set.add(keyword.strip().lower())
+
+    return sorted(tag_set)
+
+
+def has_code_blocks(paragraphs):
+    """Kod renklendirme stilinin yüklenmesi gerekiyor mu"""
+    return any(paragraph.paragraph_type == 'code' for paragraph in paragraphs)
+
+
+def build_content_items(paragraphs, images):
+    """Paragrafları ve görselleri tek listede sırala (ek sorgu yapmaz)"""
+    images_after = {}
+    unlinked_images = []
+    for image in images:
+        if image.after_paragraph_id:
+            images_after.setdefault(image.after_paragraph_id, []).append(image)
+        else:
+            unlinked_images.append(image)
+    
+    content_items = []
+    for paragraph in paragraphs:
+        content_items.append({
+            'type': 'paragraph',
+            'data': paragraph
+        })
+        
+        # Bu paragraftan sonra gelen görseller
+        for image in images_after.get(paragraph.id, []):
+            content_items.append({
+                'type': 'image',
+                'data': image
+            })
+    
+    # Belirli bir paragrafla ilişkilendirilmemiş görseller (sırasına göre)
+    for image in unlinked_images:
+        content_items.append({
+            'type': 'image',
+            'data': image
+        })
+    return content_items
+
+
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['home', 'list'])
 def home(request):
     """Anasayfa"""
     # Öne çıkan makaleler
     featured_articles = Article.objects.filter(
         is_published=True, 
         is_featured=True
-    ).select_related('category').order_by('-published_date')[:3]
+    ).order_by('-published_date').cards(request_language(request))[:3]
     
-    # Kategoriler
-    categories = Category.objects.all()[:4]
+    # Kategoriler (makale sayısı tek sorguda)
+    categories = Category.objects.annotate(
+        published_article_count=Count('articles', filter=Q(articles__is_published=True))
+    )[:4]
     
     # SEO context
     context = get_seo_context()
@@ -43,17 +124,20 @@ def home(request):
         'page_title': 'Ana Sayfa',
     })
     
+    # Bülten formu için
+    ensure_csrf_cookie(request)
     return render(request, 'blog/home.html', context)
 
 
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['list'])
 def blog_list(request):
     """Tüm makaleler listesi"""
 
     articles = (
         Article.objects
         .filter(is_published=True)
-        .select_related('category')
         .order_by('-published_date')
+        .cards(request_language(request))
     )
 
     # Pagination
@@ -74,20 +158,10 @@ def blog_list(request):
     )
 
     # === HASHTAG / KEYWORD ÜRETİMİ ===
-    raw_keywords = (
-        Article.objects
-        .filter(is_published=True)
-        .exclude(meta_keywords__isnull=True)
-        .exclude(meta_keywords__exact="")
-        .values_list('meta_keywords', flat=True)
-    )
-
-    tag_set = set()
-    for keywords in raw_keywords:
-        for keyword in keywords.split(','):
-            tag_set.add(keyword.strip().lower())
-
-    tags = sorted(tag_set)
+    # Tüm makaleleri taradığı için önbellekte tutulur (bkz. signals.py).
+    # Şablon bu fonksiyonu yalnızca sidebar parçası önbellekte yoksa çağırır.
+    def tags():
+        return cache.get_or_set(TAG_CLOUD_CACHE_KEY, build_tag_cloud, 60 * 60)
 
     context = {
         'page_obj': page_obj,
@@ -100,6 +174,7 @@ def blog_list(request):
     return render(request, 'blog/blog_list.html', context)
 
 
+@cache_policy(max_age=60, s_maxage=600, stale_while_revalidate=86400)
 def article_detail(request, slug):
     """Makale detay sayfası"""
     article = get_object_or_404(
@@ -110,44 +185,26 @@ def article_detail(request, slug):
         is_published=True
     )
     
-    # Görüntülenme sayısını artır
-    article.increment_view_count()
+    add_surrogate_keys(request, f'article-{article.pk}', f'category-{article.category_id}' if article.category_id else None)
+    
+    # Görüntülenmeyi say (önbellek ısıtma istekleri hariç); partiler halinde yazılır
+    if not is_warmup_request(request):
+        record_view(article, request_language(request))
     
     # Paragrafları ve görselleri birleştir
-    content_items = []
     paragraphs = article.paragraphs.all()
-    
-    for paragraph in paragraphs:
-        content_items.append({
-            'type': 'paragraph',
-            'data': paragraph
-        })
-        
-        # Bu paragraftan sonra gelen görseller
-        following_images = article.images.filter(after_paragraph=paragraph)
-        for image in following_images:
-            content_items.append({
-                'type': 'image',
-                'data': image
-            })
-    
-    # Belirli bir paragrafla ilişkilendirilmemiş görseller (sırasına göre)
-    unlinked_images = article.images.filter(after_paragraph__isnull=True)
-    for image in unlinked_images:
-        content_items.append({
-            'type': 'image',
-            'data': image
-        })
+    content_items = build_content_items(paragraphs, article.images.all())
     
     # İlgili makaleler
     related_articles = Article.objects.filter(
         category=article.category,
         is_published=True
-    ).exclude(id=article.id).order_by('-published_date')[:3]
+    ).exclude(id=article.id).order_by('-published_date').cards(request_language(request))[:3]
     
     context = {
         'article': article,
         'content_items': content_items,
+        'has_code': has_code_blocks(paragraphs),
         'related_articles': related_articles,
         'page_title': article.meta_title or article.title,
     }
@@ -155,18 +212,35 @@ def article_detail(request, slug):
     return render(request, 'blog/article_detail.html', context)
 
 
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['list'])
 def category_list(request):
     """Kategoriler sayfası"""
-    categories = Category.objects.all()
+    categories = Category.objects.annotate(
+        published_article_count=Count('articles', filter=Q(articles__is_published=True))
+    )
+    
+    # Her kategorinin son 3 makalesi tek sorguda (kategori başına sorgu yerine)
+    latest_articles = (
+        Article.objects
+        .filter(is_published=True, category__isnull=False)
+        .annotate(category_rank=Window(
+            RowNumber(),
+            partition_by=F('category_id'),
+            order_by=[F('published_date').desc(nulls_last=True), F('id').desc()],
+        ))
+        .filter(category_rank__lte=3)
+        # Kategori başına en fazla 3 satır; sıralaması Python'da yapılır
+        .order_by()
+    )
+    articles_by_category = {}
+    for article in sorted(latest_articles, key=attrgetter('category_rank')):
+        articles_by_category.setdefault(article.category_id, []).append(article)
     
-    # Her kategori için makaleleri getir
     categories_with_articles = []
     for category in categories:
-        articles = Article.objects.filter(
-            category=category,
-            is_published=True
-        ).order_by('-published_date')[:3]
-        
+        articles = articles_by_category.get(category.id, [])
+        for article in articles:
+            article.category = category
         categories_with_articles.append({
             'category': category,
             'articles': articles
@@ -181,14 +255,43 @@ def category_list(request):
     return render(request, 'blog/categories.html', context)
 
 
+@cache_policy(max_age=3600, s_maxage=86400)
+def article_pdf(request, slug):
+    """Makalenin PDF çıktısı"""
+    article = get_object_or_404(
+        Article.objects.select_related('category').prefetch_related('paragraphs', 'images'),
+        slug=slug,
+        is_published=True
+    )
+    add_surrogate_keys(request, f'article-{article.pk}')
+    
+    language = request.GET.get('lang') or request_language(request)
+    if language not in LANGUAGES:
+        language = DEFAULT_LANGUAGE
+    
+    try:
+        path = get_article_pdf(request, article, language)
+    except PDFUnavailable:
+        return HttpResponse('PDF çıktısı şu anda kullanılamıyor.', status=503, content_type='text/plain; charset=utf-8')
+    
+    return FileResponse(
+        open(path, 'rb'),
+        content_type='application/pdf',
+        as_attachment=request.GET.get('indir') == '1',
+        filename=f'{article.slug}.pdf',
+    )
+
+
+@cache_policy(max_age=60, s_maxage=300, stale_while_revalidate=600, keys=['list'])
 def category_detail(request, slug):
     """Kategori detay sayfası"""
     category = get_object_or_404(Category, slug=slug)
+    add_surrogate_keys(request, f'category-{category.pk}')
     
     articles = Article.objects.filter(
         category=category,
         is_published=True
-    ).order_by('-published_date')
+    ).order_by('-published_date').cards(request_language(request))
     
     # Sayfalama
     paginator = Paginator(articles, 9)
@@ -205,6 +308,7 @@ def category_detail(request, slug):
     return render(request, 'blog/category_detail.html', context)
 
 
+@cache_policy(max_age=300, s_maxage=3600, stale_while_revalidate=86400, keys=['static'])
 def about(request):
     """Hakkında sayfası"""
     context = {
@@ -214,16 +318,19 @@ def about(request):
     return render(request, 'blog/about.html', context)
 
 
+@cache_policy(max_age=300, s_maxage=3600, stale_while_revalidate=86400, keys=['static'])
 def contact(request):
     """İletişim sayfası"""
     context = {
         'page_title': 'İletişim - EdebAi',
         'meta_description': 'EdebAi ile iletişime geçin. Sorularınız, önerileriniz ve iş birliği teklifleriniz için bize ulaşın.',
     }
+    ensure_csrf_cookie(request)
     return render(request, 'blog/contact.html', context)
 
 
 @require_POST
+@ratelimit('5/m', burst=3, keys=('ip', 'post:email'), group='newsletter')
 def newsletter_subscribe(request):
     """Bülten aboneliği (AJAX)"""
     email = request.POST.get('email', '').strip()
@@ -234,26 +341,27 @@ def newsletter_subscribe(request):
             'message': 'E-posta adresi gereklidir.'
         }, status=400)
     
-    # E-posta zaten kayıtlı mı?
-    subscriber, created = NewsletterSubscriber.objects.get_or_create(
+    # Pasif aboneyi tek sorguda tekrar aktif et
+    reactivated = NewsletterSubscriber.objects.filter(
         email=email,
-        defaults={'is_active': True}
-    )
+        is_active=False
+    ).update(is_active=True)
     
-    if not created:
-        if subscriber.is_active:
-            return JsonResponse({
-                'success': False,
-                'message': 'Bu e-posta adresi zaten kayıtlı.'
-            }, status=400)
-        else:
-            # Pasif aboneyi tekrar aktif et
-            subscriber.is_active = True
-            subscriber.save()
-            return JsonResponse({
-                'success': True,
-                'message': 'Aboneliğiniz yeniden aktif edildi!'
-            })
+    if reactivated:
+        return JsonResponse({
+            'success': True,
+            'message': 'Aboneliğiniz yeniden aktif edildi!'
+        })
+    
+    # Yeni kayıt; e-posta zaten varsa unique kısıtı yakalar
+    try:
+        with transaction.atomic():
+            NewsletterSubscriber.objects.create(email=email, is_active=True)
+    except IntegrityError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Bu e-posta adresi zaten kayıtlı.'
+        }, status=400)
     
     return JsonResponse({
         'success': True,
@@ -262,6 +370,7 @@ def newsletter_subscribe(request):
 
 
 @require_POST
+@ratelimit('3/m', burst=2, keys=('ip', 'post:email'), group='contact')
 def contact_submit(request):
     """İletişim formu gönderimi (AJAX)"""
     name = request.POST.get('name', '').strip()
@@ -275,12 +384,18 @@ def contact_submit(request):
             'message': 'Lütfen tüm alanları doldurun.'
         }, status=400)
     
-    # Mesajı kaydet
-    ContactMessage.objects.create(
-        name=name,
-        email=email,
-        message=message
-    )
+    # Mesajı kaydet; yazılamadıysa başarı bildirilmez
+    try:
+        ContactMessage.objects.create(
+            name=name,
+            email=email,
+            message=message
+        )
+    except DatabaseError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Mesajınız şu anda kaydedilemedi, lütfen daha sonra tekrar deneyin.'
+        }, status=503)
     
     return JsonResponse({
         'success': True,
@@ -288,6 +403,7 @@ def contact_submit(request):
     })
 
 
+@cache_policy(max_age=0, s_maxage=60, stale_while_revalidate=60, keys=['list'])
 def search(request):
     """Arama sayfası"""
     query = request.GET.get('q', '').strip()
@@ -300,7 +416,7 @@ def search(request):
             Q(excerpt_en__icontains=query) |
             Q(meta_description__icontains=query),
             is_published=True
-        ).select_related('category').order_by('-published_date')
+        ).order_by('-published_date').cards(request_language(request))
         
         # Sayfalama
         paginator = Paginator(articles, 9)
@@ -320,6 +436,7 @@ def search(request):
     return render(request, 'blog/search.html', context)
 
 
+@cache_policy(max_age=300, s_maxage=3600, stale_while_revalidate=86400, keys=['static'])
 def cookie_policy(request):
     """Çerez politikası sayfası"""
     policy = CookiePolicy.objects.filter(is_active=True).first()
@@ -339,7 +456,7 @@ def cookie_policy(request):
     context = get_seo_context()
     context.update({
         'policy': policy,
-        'page_title': policy.title_tr if get_language() == 'tr' else policy.title_en,
+        'page_title': policy.title_tr if request_language(request) == 'tr' else policy.title_en,
         'meta_description': policy.meta_description_tr or 'EdebAi çerez politikası',
     })
     
@@ -348,19 +465,38 @@ def cookie_policy(request):
 
 def set_language(request, language):
     """Dil değiştirme"""
-    if language in ['tr', 'en']:
-        response = redirect(request.META.get('HTTP_REFERER', '/'))
-        response.set_cookie('language', language, max_age=365*24*60*60)  # 1 yıl
-        if hasattr(request, 'session'):
-            request.session['language'] = language
+    if language in LANGUAGES:
+        next_url = request.META.get('HTTP_REFERER', '/')
+        if url_routing():
+            # Eski dil bağlantıları: aynı sayfanın o dildeki URL'sine yönlendir
+            parts = urlsplit(next_url)
+            next_url = urlunsplit(parts._replace(path=language_path(parts.path or '/', language)))
+        response = redirect(next_url)
+        # Yalnızca imzalı çerez; anonim ziyaretçi için oturum açılmaz
+        set_language_cookie(response, language)
         return response
     return redirect('/')
 
 
+@cache_policy(max_age=3600, s_maxage=86400, keys=['static'])
 def robots_txt(request):
     content = """User-agent: *
 Disallow: /admin/
 
 Sitemap: https://edebai.com.tr/sitemap.xml
 """
-    return HttpResponse(content, content_type="text/plain")
\ No newline at end of file
+    return HttpResponse(content, content_type="text/plain")
+
+@staff_member_required
+def performance_stats(request):
+    """View başına gecikme yüzdelikleri ve önbellek sayaçları (yalnızca yönetici)"""
+    if request.method == 'POST' and request.POST.get('reset'):
+        view_stats.reset()
+    data = {
+        'success': True,
+        'views': view_stats.snapshot(),
+        'cache': cache.stats() if hasattr(cache, 'stats') else None,
+    }
+    response = JsonResponse(data, json_dumps_params={'ensure_ascii': False})
+    response['Cache-Control'] = 'private, no-store'
+    return response
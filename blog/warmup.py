@@ -0,0 +1,82 @@
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django.urls import get_resolver
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+# Önbellek ısıtma istekleri bu başlıkla gelir; görüntülenme sayılmaz
+WARMUP_HEADER = 'X-Cache-Warmup'
+
+
+def is_warmup_request(request):
+    return bool(request.headers.get(WARMUP_HEADER))
+
+
+def iter_template_names(prefix='blog'):
+    """DIRS altındaki prefix klasöründe bulunan tüm şablon adları"""
+    for directory in engines['django'].engine.dirs:
+        root = Path(directory)
+        for path in sorted((root / prefix).rglob('*.html')):
+            yield path.relative_to(root).as_posix()
+
+
+def compile_templates(prefix='blog'):
+    """Şablonları derleyip cached loader'a yerleştir; {ad: ms} döndür"""
+    engine = engines['django']
+    timings = {}
+    for name in iter_template_names(prefix):
+        started = time.perf_counter()
+        engine.get_template(name)
+        timings[name] = (time.perf_counter() - started) * 1000
+    return timings
+
+
+def resolve_urls():
+    """URL çözümleyiciyi ve reverse tablolarını doldur"""
+    resolver = get_resolver()
+    count = 0
+    for language in ('tr', 'en'):
+        with translation.override(language):
+            count += len(resolver.reverse_dict)
+            for _, namespace_resolver in resolver.namespace_dict.values():
+                count += len(namespace_resolver.reverse_dict)
+    return count
+
+
+def prime_config_caches():
+    """Çeviri kataloglarını, context processor'ları ve site kaydını önceden yükle"""
+    for language in ('tr', 'en'):
+        with translation.override(language):
+            translation.gettext('')
+    engines['django'].engine.template_context_processors
+
+    try:
+        from django.contrib.sites.models import Site
+        from .cache import get_content_version
+
+        Site.objects.get_current()
+        get_content_version('chrome', 'articles')
+    except Exception as exc:
+        # Veritabanı henüz hazır değilse (ör. ilk migrate) atla
+        logger.warning('Warm-up: veritabanı/önbellek ön yüklemesi atlandı (%s)', exc)
+
+
+def warm_up():
+    """Worker trafik almadan önce şablon, URL ve ayar önbelleklerini ısıt"""
+    started = time.perf_counter()
+    timings = compile_templates()
+    url_count = resolve_urls()
+    prime_config_caches()
+    elapsed = (time.perf_counter() - started) * 1000
+    logger.info('Warm-up tamamlandı: %d şablon, %d URL, %.0f ms', len(timings), url_count, elapsed)
+    return timings
+
+
+def warm_up_on_startup():
+    if getattr(settings, 'WARMUP_ON_STARTUP', False):
+        warm_up()
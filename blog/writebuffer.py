@@ -0,0 +1,91 @@
+import atexit
+import logging
+import threading
+
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """
+    Bellekte biriken yazmaları partiler halinde boşaltan temel sınıf.
+
+    batch_size kayda ulaşınca ya da ilk kayıttan flush_interval saniye sonra
+    flush() çağrılır. Yazılamayan parti kaybolmaz: yeni bekleyenlerle
+    birleştirilip bir sonraki denemeye bırakılır. Alt sınıflar _new_batch,
+    _size, _merge ve _write'ı tanımlar.
+    """
+
+    def __init__(self, batch_size=10, flush_interval=2.0):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._batch = self._new_batch()
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._timer = None
+        atexit.register(self.flush)
+
+    def _new_batch(self):
+        raise NotImplementedError
+
+    def _size(self, batch):
+        return len(batch)
+
+    def _merge(self, failed, batch):
+        """Yazılamayan partiyi yeni bekleyenlerle birleştir"""
+        raise NotImplementedError
+
+    def _write(self, batch):
+        raise NotImplementedError
+
+    def _append(self, update, count=1):
+        """update(parti) kilit altında çalışır; parti dolduysa True döndür"""
+        with self._lock:
+            update(self._batch)
+            self._pending += count
+            full = self._pending >= self.batch_size
+            if not full:
+                self._schedule()
+        return full
+
+    def _schedule(self):
+        # Kilit altında çağrılır
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._flush_from_timer)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self):
+        """Bekleyenleri yaz ve yazılan kayıt sayısını döndür"""
+        with self._lock:
+            batch, self._batch = self._batch, self._new_batch()
+            self._pending = 0
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        size = self._size(batch)
+        if not size:
+            return 0
+
+        try:
+            self._write(batch)
+        except Exception:
+            logger.exception('%s: %d kayıt yazılamadı, tekrar denenecek', type(self).__name__, size)
+            with self._lock:
+                self._batch = self._merge(batch, self._batch)
+                self._pending += size
+                self._schedule()
+            return 0
+        return size
+
+    def flush_in_background(self):
+        """İstek thread'ini bekletmeden (ve veritabanına gitmeden) yaz"""
+        threading.Thread(target=self._flush_from_timer, daemon=True).start()
+
+    def _flush_from_timer(self):
+        try:
+            self.flush()
+        finally:
+            # Zamanlayıcı thread'i kendi bağlantısını açar, açık bırakma
+            connection.close()
@@ -12,5 +12,11 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'edebai.settings')
+os.environ.setdefault('DJANGO_ASYNC_VIEWS', '1')
 
 application = get_asgi_application()
+
+# Worker ilk isteği almadan önce şablon ve URL önbelleklerini ısıt
+from blog.warmup import warm_up_on_startup  # noqa: E402
+
+warm_up_on_startup()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -11,7 +12,8 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY = 'django-insecure-1#r%)xsj8^qs)^+oa_&y^-papc5n+y-r*=8f@!&hq4+dg5!4yk'
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+# Üretimde DJANGO_DEBUG=0 verilmeli
+DEBUG = os.environ.get('DJANGO_DEBUG', '1') == '1'
 
 ALLOWED_HOSTS = ["edebai.onrender.com","127.0.0.1","edebai.com.tr","www.edebai.com.tr"]
 
@@ -34,10 +36,16 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'blog.middleware.RequestTimingMiddleware',
+    'blog.middleware.CacheHeadersMiddleware',
+    'blog.middleware.LanguageMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
+    'blog.middleware.PrerenderedPageMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'blog.middleware.ReplicaPinningMiddleware',
+    'blog.middleware.ProfilerMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -48,8 +56,15 @@ TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
         'DIRS': [BASE_DIR / "templates"],
-        'APP_DIRS': True,
         'OPTIONS': {
+            # Şablonlar süreç başına bir kez derlenir (DEBUG'da da geçerli,
+            # runserver dosya değişince önbelleği sıfırlar)
+            'loaders': [
+                ('django.template.loaders.cached.Loader', [
+                    'django.template.loaders.filesystem.Loader',
+                    'django.template.loaders.app_directories.Loader',
+                ]),
+            ],
             'context_processors': [
                 'django.template.context_processors.debug',
                 'django.template.context_processors.request',
@@ -63,6 +78,13 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'edebai.wsgi.application'
+ASGI_APPLICATION = 'edebai.asgi.application'
+
+# Okuma sayfaları için async view'lar (asgi.py bunu varsayılan olarak açar)
+ASYNC_VIEWS = os.environ.get('DJANGO_ASYNC_VIEWS', '0') == '1'
+
+# WSGI/ASGI worker'ları açılırken şablonları derle ve URL'leri çöz (blog/warmup.py)
+WARMUP_ON_STARTUP = not DEBUG
 
 
 # Database
@@ -72,7 +94,47 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'timeout': 5,  # kilitli veritabanında hata vermeden önce bekle (saniye)
+        },
+    }
+}
+
+# DB_ENGINE=mysql ise birincil MySQL + DB_REPLICA_HOSTS içindeki okuma replikaları
+if os.environ.get('DB_ENGINE') == 'mysql':
+    import pymysql
+    pymysql.install_as_MySQLdb()
+
+    _mysql = {
+        'ENGINE': 'django.db.backends.mysql',
+        'NAME': os.environ.get('DB_NAME', 'edebai'),
+        'USER': os.environ.get('DB_USER', 'edebai'),
+        'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+        'PORT': os.environ.get('DB_PORT', '3306'),
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 60)),  # kalıcı bağlantılar
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {'charset': 'utf8mb4'},
+    }
+    DATABASES = {
+        'default': {**_mysql, 'HOST': os.environ.get('DB_HOST', 'localhost')},
     }
+    for _index, _host in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), 1):
+        DATABASES[f'replica{_index}'] = {
+            **_mysql,
+            'HOST': _host.strip(),
+            'CONN_MAX_AGE': int(os.environ.get('DB_REPLICA_CONN_MAX_AGE', 300)),
+            'TEST': {'MIRROR': 'default'},
+        }
+
+DATABASE_REPLICAS = [alias for alias in DATABASES if alias != 'default']
+DATABASE_ROUTERS = ['blog.routers.PrimaryReplicaRouter']
+REPLICA_PIN_SECONDS = 10  # yazma sonrası okumalar bu süre birincilden yapılır
+
+# Her SQLite bağlantısında uygulanan pragmalar (varsayılanlar: blog/db.py)
+# WAL modu okuma ve yazmaların aynı anda yapılabilmesini sağlar
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
 }
 
 
@@ -100,6 +162,16 @@ AUTH_PASSWORD_VALIDATORS = [
 
 LANGUAGE_CODE = 'tr'
 
+LANGUAGES = [
+    ('tr', 'Türkçe'),
+    ('en', 'English'),
+]
+
+# Dil URL önekiyle seçilir: Türkçe kökte, İngilizce /en/ altında; her URL tek
+# bir içerik döndürür ve paylaşılan önbelleklerde saklanabilir. False ise dil
+# imzalı çerezden ya da Accept-Language'tan okunur (bkz. blog/language.py).
+I18N_URLS = os.environ.get('DJANGO_I18N_URLS', '1') == '1'
+
 TIME_ZONE = 'Europe/Istanbul'
 
 USE_I18N = True
@@ -119,6 +191,55 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedStaticFilesStorage"
 
 
 
+# CDN / reverse proxy purge ayarları (blog/http_cache.py)
+SURROGATE_KEY_HEADER = 'Surrogate-Key'
+PURGE_BACKEND = 'blog.http_cache.HTTPPurger'
+PURGE_URL = os.environ.get('PURGE_URL')  # boşsa purge gönderilmez
+PURGE_TOKEN = os.environ.get('PURGE_TOKEN')
+
+# export_site komutunun ürettiği statik HTML sayfaları
+PRERENDER_ROOT = BASE_DIR / 'prerendered'
+
+# Makale PDF çıktılarının saklandığı klasör
+PDF_ROOT = BASE_DIR / 'pdf_cache'
+
+# İstek ölçümleri (Server-Timing başlığı, yavaş istek log'u, view histogramları)
+INSTRUMENTATION_ENABLED = os.environ.get('DJANGO_INSTRUMENTATION', '1') == '1'
+# Süreler paylaşılan önbelleklere ve ziyaretçilere gitmesin; yalnızca geliştirmede
+SERVER_TIMING_HEADER = os.environ.get('DJANGO_SERVER_TIMING', '1' if DEBUG else '0') == '1'
+SLOW_REQUEST_MS = int(os.environ.get('SLOW_REQUEST_MS', '500'))
+# Yavaş istekler JSON satırları olarak bu dosyaya yazılır (boşsa konsola)
+SLOW_REQUEST_LOG = os.environ.get('SLOW_REQUEST_LOG', '')
+
+# Yönetici profil raporları (?_profile=1)
+PROFILE_ROOT = BASE_DIR / 'profiles'
+PROFILER_RATE = '6/m'
+PROFILER_INTERVAL = 0.002  # örnekleme aralığı (sn)
+PROFILER_MAX_BYTES = 1024 * 1024  # rapor dosyası başına
+PROFILER_MAX_REPORTS = 50
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'performance': {
+            'class': 'logging.handlers.WatchedFileHandler' if SLOW_REQUEST_LOG else 'logging.StreamHandler',
+            **({'filename': SLOW_REQUEST_LOG} if SLOW_REQUEST_LOG else {}),
+            'formatter': 'message',
+        },
+    },
+    'loggers': {
+        'blog.performance': {
+            'handlers': ['performance'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
+
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
@@ -151,3 +272,48 @@ DEFAULT_FROM_EMAIL = 'EdebAi <noreply@edebai.com>'
 
 # Sitemap ve robots.txt için
 SITE_ID = 1
+
+# Önbellek: süreç içi LRU + paylaşılan önbellek (REDIS_URL yoksa locmem)
+REDIS_URL = os.environ.get('REDIS_URL')
+
+CACHES = {
+    'default': {
+        'BACKEND': 'blog.cache.TwoTierCache',
+        'TIMEOUT': 300,
+        'OPTIONS': {
+            'REMOTE': 'shared',
+            'LOCAL_MAX_ENTRIES': 1000,
+            'LOCAL_TIMEOUT': 5,  # yerel kopya en fazla bu kadar eski olabilir
+        },
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'edebai-shared',
+    },
+}
+if REDIS_URL:
+    CACHES['shared'] = {
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'edebai',
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'IGNORE_EXCEPTIONS': True,  # Redis düşerse site çalışmaya devam etsin
+        },
+    }
+
+# AJAX yazma uçları için hız sınırlama
+RATELIMIT_ENABLED = True
+RATELIMIT_CACHE = 'shared'
+RATELIMIT_USE_FORWARDED_FOR = True  # Render proxy'si arkasında çalışıyoruz
+
+# Makale görüntülenmeleri bellekte sayılıp partiler halinde gün kovalarına yazılır
+VIEW_BUFFER_BATCH_SIZE = 100
+VIEW_BUFFER_FLUSH_INTERVAL = 10.0  # saniye
+
+# Trend sıralaması ve kova sıkıştırma (update_analytics komutu, ör. saatte bir)
+TRENDING_WINDOW_DAYS = 14
+TRENDING_HALF_LIFE_DAYS = 2  # skor her 2 günde yarıya iner
+TRENDING_SIZE = 5  # kategori ve dil başına saklanan makale
+VIEW_DAILY_RETENTION_DAYS = 35  # daha eski gün kovaları haftalığa toplanır
+VIEW_WEEKLY_RETENTION_WEEKS = 26  # daha eski hafta kovaları aylığa toplanır
@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
+from django.conf.urls.i18n import i18n_patterns
 from django.conf.urls.static import static
 from django.contrib.sitemaps.views import sitemap
 from blog.sitemaps import ArticleSitemap, StaticViewSitemap
@@ -12,12 +13,18 @@ sitemaps = {
 
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('', include('blog.urls')),
 
     # Sitemap (template YOK, Django üretir)
     path('sitemap.xml', sitemap, {'sitemaps': sitemaps}),
 ]
 
+# Türkçe öneksiz, İngilizce /en/ altında. I18N_URLS kapalıyken etkin dil hep
+# Türkçe olduğundan yalnızca öneksiz URL'ler çözülür (bkz. LanguageMiddleware)
+urlpatterns += i18n_patterns(
+    path('', include('blog.urls')),
+    prefix_default_language=False,
+)
+
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATIC_ROOT)
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'edebai.settings')
 
 application = get_wsgi_application()
+
+# Worker ilk isteği almadan önce şablon ve URL önbelleklerini ısıt
+from blog.warmup import warm_up_on_startup  # noqa: E402
+
+warm_up_on_startup()